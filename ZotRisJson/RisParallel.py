@@ -0,0 +1,154 @@
+"""
+Multi-process conversion of large RIS exports.
+
+Records are read with ris_record_read, grouped into chunks on record
+boundaries and mapped with ris_p_dict_map, or a given record_map, in a
+process pool. Results come back in the order of the records in the
+export.
+
+Exports given as a path are memory mapped instead: the parent only scans
+the bytes for record boundaries (RisToZotero.ris_record_offsets) and
+sends (offset, length) pairs, each worker maps the file itself and
+decodes its own records.
+"""
+
+__author__ = "Kaan Eraslan"
+
+# Packages ----------------------------------------------
+
+import concurrent.futures
+import mmap
+import os
+
+from ZotRisJson import RisToZotero
+from zotJson import ZoteroParallel
+
+# --------------------------------------------------------
+
+
+def ris_chunk_read(ris_file, chunk_size):
+    """
+    params:
+    ris_file, str or file object, see RisToZotero.ris_record_read
+    chunk_size, int.
+
+    yield: ris_text_list, [str, ...], at most chunk_size records.
+    """
+    #
+    ris_text_list = []
+    for ris_text in RisToZotero.ris_record_read(ris_file):
+        ris_text_list.append(ris_text)
+        if len(ris_text_list) == chunk_size:
+            yield ris_text_list
+            ris_text_list = []
+    #
+    if len(ris_text_list) > 0:
+        yield ris_text_list
+
+
+def ris_chunk_map(ris_text_list, record_map=None):
+    """
+    params:
+    ris_text_list, [str, ...]
+    record_map, function or None, see convert_ris_parallel
+
+    return: ris_p_dict_list, [[{},[],[], ...], ...], or what record_map
+    gives for each record.
+
+    Runs in the worker processes.
+    """
+    #
+    if record_map is not None:
+        return [record_map(ris_text) for ris_text in ris_text_list]
+    ris_p_dict_list = [
+        RisToZotero.ris_p_dict_map(
+            ris_text,
+            RisToZotero.type_map,
+            RisToZotero.field_map,
+            RisToZotero.dependent_fields
+        )
+        for ris_text in ris_text_list
+    ]
+    #
+    return ris_p_dict_list
+
+
+def ris_offset_chunk_read(path, chunk_size):
+    """
+    params:
+    path, str.
+    chunk_size, int.
+
+    yield: offset_list, [(offset, length), ...], at most chunk_size records.
+    """
+    #
+    if os.path.getsize(path) == 0:
+        return
+    offset_list = []
+    with open(path, "rb") as ris_stream, mmap.mmap(ris_stream.fileno(), 0, access=mmap.ACCESS_READ) as ris_buffer:
+        for ris_offset in RisToZotero.ris_record_offsets(ris_buffer):
+            offset_list.append(ris_offset)
+            if len(offset_list) == chunk_size:
+                yield offset_list
+                offset_list = []
+    #
+    if len(offset_list) > 0:
+        yield offset_list
+
+
+def ris_offset_chunk_map(path, offset_list, encoding="utf-8", record_map=None):
+    """
+    params:
+    path, str.
+    offset_list, [(offset, length), ...]
+    encoding, str.
+    record_map, function or None, see convert_ris_parallel
+
+    return: ris_p_dict_list, [[{},[],[], ...], ...], see ris_chunk_map
+
+    Runs in the worker processes, only the records of the chunk are
+    decoded.
+    """
+    #
+    ris_buffer = ZoteroParallel.parallel_mmap_open(path)
+    ris_text_list = [
+        RisToZotero.ris_record_decode(ris_buffer[offset:offset + length], encoding)
+        for offset, length in offset_list
+    ]
+    #
+    return ris_chunk_map(ris_text_list, record_map)
+
+
+def convert_ris_parallel(path, workers=None, chunk_size=500, max_in_flight=None, encoding="utf-8",
+                         record_map=None):
+    """
+    params:
+    path, str or file object. Paths are memory mapped.
+    workers, int. Number of processes, defaults to the number of cores.
+    chunk_size, int. Records sent to a worker at once.
+    max_in_flight, int. Chunks submitted but not yet yielded, defaults to
+    twice the number of workers.
+    encoding, str. Of the mapped file.
+    record_map, function or None. ris_text => result, defined at module
+    level so that it can be sent to the workers. ris_p_dict_map with the
+    default tables if None.
+
+    yield: ris_p_dict, [{},[],[], ...], or the result of record_map, in
+    the order of the records.
+
+    At most max_in_flight * chunk_size records are held in memory, so the
+    export is only read as fast as the results are consumed.
+    """
+    #
+    workers, max_in_flight = ZoteroParallel.parallel_limits_get(workers, chunk_size, max_in_flight)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        if isinstance(path, str):
+            task_iter = (
+                (ris_offset_chunk_map, path, offset_list, encoding, record_map)
+                for offset_list in ris_offset_chunk_read(path, chunk_size)
+            )
+        else:
+            task_iter = (
+                (ris_chunk_map, ris_text_list, record_map) for ris_text_list in ris_chunk_read(path, chunk_size)
+            )
+        yield from ZoteroParallel.parallel_ordered_map(executor, task_iter, max_in_flight)
@@ -0,0 +1,406 @@
+"""
+Mapping tables of the RIS translator.
+
+Taken from the field mapping of the original zotero RIS translator, see
+RisToZotero. Imported by RisToZotero on first use only.
+"""
+
+__author__ = "Kaan Eraslan"
+
+type_map = {
+    "ADVS":"film",
+    "AGGR":"document", #how can we handle "database" citations?
+    "ANCIENT":"document",
+    "BILL":"bill",
+    "BLOG":"blogPost",
+    "BOOK":"book",
+    "CHAP":"bookSection",
+    "CHART":"artwork",
+    "CLSWK":"book",
+    "COMP":"computerProgram",
+    "CONF":"conferencePaper",
+    "CPAPER":"conferencePaper",
+    "CTLG":"magazineArticle",
+    "DATA":"document", #dataset
+    "DBASE":"document", #database
+    "DICT":"dictionaryEntry",
+    "EBOOK":"book",
+    "ECHAP":"bookSection",
+    "EDBOOK":"book",
+    "EJOUR":"journalArticle",
+    "ENCYC":"encyclopediaArticle",
+    "EQUA":"document", # what's a good way to handle this?
+    "FIGURE":"artwork",
+    "GEN":"journalArticle",
+    "GOVDOC":"report",
+    "GRNT":"document",
+    "HEAR":"hearing",
+    "ICOMM":"email",
+    "INPR":"manuscript",
+    "JFULL":"journalArticle",
+    "JOUR":"journalArticle",
+    "LEGAL":"case", #is this what they mean?
+    "MANSCPT":"manuscript",
+    "MAP":"map",
+    "MGZN":"magazineArticle",
+    "MPCT":"film",
+    "MULTI":"videoRecording", # maybe?
+    "MUSIC":"audioRecording",
+    "NEWS":"newspaperArticle",
+    "PAMP":"manuscript",
+    "PAT":"patent",
+    "PCOMM":"letter",
+    "RPRT":"report",
+    "SER":"book",
+    "SLIDE":"presentation",
+    "SOUND":"audioRecording", # consider MUSIC
+    "STAND":"report",
+    "STAT":"statute",
+    "THES":"thesis",
+    "UNBILL":"manuscript",
+    "UNPD":"manuscript",
+    "VIDEO":"videoRecording",
+    "CASE":"case",
+    "ABST":"journalArticle",
+    "ART":"artwork",
+    "BOOK":"book",
+    "ELEC":"webpage",
+    "WEB":"webpage"	# not in spec, but used by EndNote
+}
+
+field_map = {
+    "AB":"abstractNote",
+    "AN":"archiveLocation",
+    "CN":"callNumber",
+    "DB":"archive",
+    "DO":"DOI",
+    "DP":"libraryCatalog",
+    "J2":"journalAbbreviation",
+    "KW":"tags",
+    "L1":"attachments/PDF",
+    "L2":"attachments/HTML",
+    "L4":"attachments/other",
+    "N1":"notes",
+    "ST":"shortTitle",
+    "UR":"url",
+    "Y2":"accessDate",
+    "CA": "unsupported/Caption",
+    "CR": "rights",
+    "CT": "title",
+    "ED": "creators/editor",
+    "EP": "pages",
+    #	"H1": "unsupported/Library Catalog", # Citavi specific (possibly multiple occurences)
+    "H1":"libraryCatalog",
+    "H2":"callNumber",
+    #	"H2": "unsupported/Call Number", # Citavi specific (possibly multiple occurences)
+    "JA": "journalAbbreviation",
+    "JF": "publicationTitle",
+    "LB":"label",
+    "M2": "extra", # not in spec
+    "N2": "abstractNote",
+    "RN": "notes"
+}
+
+# type specific
+	# tag => field:itemTypes
+	# if itemType not explicitly given, __default field is used
+    # unless itemType is excluded in exclude
+
+dependent_fields = {
+    "TI": {
+		"__default":"title",
+		"subject":["email"],
+		"caseName":["case"],
+		"nameOfAct":["statute"]
+	},
+	"T2": {
+		"code":["bill", "statute"],
+		"bookTitle":["bookSection"],
+		"blogTitle":["blogPost"],
+		"conferenceName":["conferencePaper"],
+		"dictionaryTitle":["dictionaryEntry"],
+		"encyclopediaTitle":["encyclopediaArticle"],
+		"committee":["hearing"],
+		"forumTitle":["forumPost"],
+		"websiteTitle":["webpage"],
+		"programTitle":["radioBroadcast", "tvBroadcast"],
+		"meetingName":["presentation"],
+		"seriesTitle":["computerProgram", "map", "report"],
+		"series": ["book"],
+		"publicationTitle":["journalArticle", "magazineArticle", "newspaperArticle"],
+        "__default":"backupPublicationTitle"
+	},
+    "TA": "unsupported/Translated Author",
+    "TT": "unsupported/Translated Title",
+	"T3": {
+		"legislativeBody":["hearing", "bill"],
+		"series":["bookSection", "conferencePaper", "journalArticle","book"],
+		"seriesTitle":["audioRecording"]
+	},
+	# NOT "HANDLED": reviewedAuthor, scriptwriter, contributor, guest
+	"AU": {
+		"__default":"creators/author",
+		"creators/artist":["artwork"],
+		"creators/cartographer":["map"],
+		"creators/composer":["audioRecording"],
+		"creators/director":["film", "radioBroadcast", "tvBroadcast", "videoRecording"], # this clashes with audioRecording
+		"creators/interviewee":["interview"],
+		"creators/inventor":["patent"],
+		"creators/podcaster":["podcast"],
+		"creators/programmer":["computerProgram"]
+	},
+	"A2": {
+		"creators/sponsor":["bill"],
+		"creators/performer":["audioRecording"],
+		"creators/presenter":["presentation"],
+		"creators/interviewer":["interview"],
+		"creators/editor":["journalArticle", "bookSection", "conferencePaper", "dictionaryEntry", "document", "encyclopediaArticle"],
+		"creators/seriesEditor":["book", "report"],
+		"creators/recipient":["email", "instantMessage", "letter"],
+		"reporter":["case"],
+		"issuingAuthority":["patent"]
+	},
+	"A3": {
+		"creators/cosponsor":["bill"],
+		"creators/producer":["film", "tvBroadcast", "videoRecording", "radioBroadcast"],
+		"creators/editor":["book"],
+		"creators/seriesEditor":["bookSection", "conferencePaper", "dictionaryEntry", "encyclopediaArticle", "map"]
+	},
+	"A4": {
+		"__default":"creators/translator",
+		"creators/counsel":["case"],
+		"creators/contributor":["conferencePaper", "film"]	# translator does not fit these
+	},
+	"C1": {
+		"filingDate":["patent"], # not in spec
+		"creators/castMember":["radioBroadcast", "tvBroadcast", "videoRecording"],
+		"scale":["map"],
+		"place":["conferencePaper"]
+	},
+	"C2": {
+		"issueDate":["patent"], # not in spec
+		"creators/bookAuthor":["bookSection"],
+		"creators/commenter":["blogPost"]
+	},
+	"C3": {
+		"artworkSize":["artwork"],
+		"proceedingsTitle":["conferencePaper"],
+		"country":["patent"]
+	},
+	"C4": {
+		"creators/wordsBy":["audioRecording"], # not in spec
+		"creators/attorneyAgent":["patent"],
+		"genre":["film"]
+	},
+	"C5": {
+		"references":["patent"],
+		"audioRecordingFormat":["audioRecording", "radioBroadcast"],
+		"videoRecordingFormat":["film", "tvBroadcast", "videoRecording"]
+	},
+	"C6": {
+		"legalStatus":["patent"],
+	},
+	"CY": {
+		"__default":"place",
+		"__exclude":["conferencePaper"] # should be exported as C1
+        # if conferencePaper then CY -> C1, restart
+	},
+	"DA": { # also see PY when editing
+		"__default":"date",
+		"dateEnacted":["statute"],
+		"dateDecided":["case"],
+		"issueDate":["patent"]
+	},
+	"ET": {
+		"__default":"edition",
+ 		"__ignore":["journalArticle"], # EPubDate. If journalArticle, pop or delete ET.
+		"session":["bill", "hearing", "statute"],
+		"version":["computerProgram"]
+	},
+	"IS": {
+		"__default":"issue",
+		"numberOfVolumes": ["bookSection"]
+	},
+	"LA": {
+		"__default":"language",
+		"programmingLanguage": ["computerProgram"]
+	},
+	"M1": {
+		"seriesNumber":["book"],
+		"billNumber":["bill"],
+		"system":["computerProgram"],
+		"documentNumber":["hearing"],
+		"applicationNumber":["patent"],
+		"publicLawNumber":["statute"],
+		"episodeNumber":["podcast", "radioBroadcast", "tvBroadcast"],
+        "__default":"extra",
+		"issue": ["journalArticle"], # EndNote hack
+		"numberOfVolumes": ["bookSection"],	# EndNote exports here instead of IS
+		"accessDate": ["webpage"]		# this is access date when coming from EndNote
+	},
+	"M3": {
+		"manuscriptType":["manuscript"],
+		"mapType":["map"],
+		"reportType":["report"],
+		"thesisType":["thesis"],
+		"websiteType":["blogPost", "webpage"],
+		"postType":["forumPost"],
+		"letterType":["letter"],
+		"interviewMedium":["interview"],
+		"presentationType":["presentation"],
+		"artworkMedium":["artwork"],
+		"audioFileType":["podcast"],
+        "__default":"DOI"
+	},
+	"NV": {
+		"__default": "numberOfVolumes",
+		"__exclude": ["bookSection"] # IS. If bookSection then NV -> IS, restart
+	},
+	"OP": {
+		"history":["hearing", "statute", "bill", "case"],
+		"priorityNumbers":["patent"],
+#        "__default": "unsupported/Original Publication",
+#		"unsupported/Content": ["blogPost", "computerProgram", "film", "presentation", "report", "videoRecording", "webpage"]
+	},
+	"PB": {
+		"__default":"publisher",
+		"label":["audioRecording"],
+		"court":["case"],
+		"distributor":["film"],
+		"assignee":["patent"],
+		"institution":["report"],
+		"university":["thesis"],
+		"company":["computerProgram"],
+		"studio":["videoRecording"],
+		"network":["radioBroadcast", "tvBroadcast"]
+	},
+	"PY": { # duplicate of DA, but this will only output year
+		"__default":"date",
+		"dateEnacted":["statute"],
+		"dateDecided":["case"],
+		"issueDate":["patent"]
+	},
+	"SE": {
+		"__default": "section",	# though this can refer to pages, start page, etc. for some types. Zotero does not support any of those combinations, however.
+		"__exclude": ["case"] # if case then pop/delete SE.
+#		"unsupported/File Date": ["case"]
+	},
+	"SN": {
+		"__default":"ISBN",
+		"ISSN":["journalArticle", "magazineArticle", "newspaperArticle"],
+		"patentNumber":["patent"],
+		"reportNumber":["report"],
+	},
+	"SP": {
+		"__default":"pages", # needs extra processing
+		"codePages":["bill"], # bill
+		"numPages":["book", "thesis", "manuscript"], # manuscript not really in spec
+		"firstPage":["case"],
+		"runningTime":["film"]
+	},
+	"SV": {
+		"seriesNumber": ["bookSection"],
+		"docketNumber": ["case"]	# not in spec. EndNote exports this way
+	},
+	"VL": {
+		"__default":"volume",
+		"codeNumber":["statute"],
+		"codeVolume":["bill"],
+		"reporterVolume":["case"],
+		"__exclude":["patent"], # if patent or webpage then pop/delete VL.
+        #"unsupported/Patent Version Number":['patent'],
+		"accessDate": ["webpage"]	# technically access year according to EndNote
+	},
+    "AD": {
+		"__default": "unsupported/Author Address",
+		"unsupported/Inventor Address": ["patent"]
+	},
+    "AV": "archiveLocation", # REFMAN
+    "BT": {
+		"title": ["book", "manuscript"],
+		"bookTitle": ["bookSection"],
+		"__default": "backupPublicationTitle" # we do more filtering on this later
+	},
+	"ID": "__ignore", # No support ? If Id pop/delete ID
+	"JO": {
+		"__default": "journalAbbreviation",
+		"conferenceName": ["conferencePaper"]
+	},
+#	"LB": "unsupported/Label",
+	"RI": {
+		"__default":"unsupported/Reviewed Item",
+		"unsupported/Article Number": ["statute"]
+	},
+	"T1": "TI", # if T1 then TI, restart.
+    "Y1": "DA", #  Old RIS spec. if Y1 then DA, restart
+    "RP": "ET", # We map Reprint Edition to Edition
+    "A1": "AU" # if A1 then AU, restart
+}
+
+# non-standard or degenerate field maps
+# used ONLY for importing and only if these fields are not specified above (e.g. M3)
+# these are not exported the same way
+
+
+non_standard_field_maps= {
+#	"A1": "AU", # if A1 then AU, restart
+#	"AD": {
+#		"__default": "unsupported/Author Address",
+#		"unsupported/Inventor Address": ["patent"]
+#	},
+#	"AV": "archiveLocation", # REFMAN
+#	"BT": {
+#		"title": ["book", "manuscript"],
+#		"bookTitle": ["bookSection"],
+#		"__default": "backupPublicationTitle" # we do more filtering on this later
+#	},
+#	"CA": "unsupported/Caption",
+#    "CR": "rights",
+#	"CT": "title",
+#	"ED": "creators/editor",
+#	"EP": "pages",
+#	"H1": "unsupported/Library Catalog", # Citavi specific (possibly multiple occurences)
+#	"H2": "unsupported/Call Number", # Citavi specific (possibly multiple occurences)
+#	"ID": "__ignore", # No support ? If Id pop/delete ID
+#	"JA": "journalAbbreviation",
+#	"JF": "publicationTitle",
+#	"JO": {
+#		"__default": "journalAbbreviation",
+#		"conferenceName": ["conferencePaper"]
+#	},
+#	"LB": "unsupported/Label",
+#	"M1": {
+#		"__default":"extra",
+#		"issue": ["journalArticle"], # EndNote hack
+#		"numberOfVolumes": ["bookSection"],	# EndNote exports here instead of IS
+#		"accessDate": ["webpage"]		# this is access date when coming from EndNote
+#	},
+#	"M2": "extra", # not in spec
+#	"M3": "DOI",
+#	"N2": "abstractNote",
+#	"NV": "numberOfVolumes",
+#	"OP": {
+#		"__default": "unsupported/Original Publication",
+#		"unsupported/Content": ["blogPost", "computerProgram", "film", "presentation", "report", "videoRecording", "webpage"]
+#	},
+#	"RI": {
+#		"__default":"unsupported/Reviewed Item",
+#		"unsupported/Article Number": ["statute"]
+#	},
+#	"RN": "notes",
+#	"SE": {
+#		"unsupported/File Date": ["case"]
+#	},
+#	"T1": "TI", # if T1 then TI, restart.
+#	"T2": "backupPublicationTitle", # most item types should be covered above
+#	"T3": {
+#		"series": ["book"]
+#	},
+#	"TA": "unsupported/Translated Author",
+#   "TT": "unsupported/Translated Title",
+#	"VL": {
+#		"unsupported/Patent Version Number":['patent'],
+#		"accessDate": ["webpage"]	# technically access year according to EndNote
+#	},
+#	"Y1": "DA" #  Old RIS spec. if Y1 then DA, restart
+}
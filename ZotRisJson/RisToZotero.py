@@ -15,427 +15,106 @@ Zotero-Write-Token: <write token> # Header Variable
 # Packages ----------------------------------------------
 
 
+import functools
+import hashlib
+import importlib
+import io
+import json
 import re
 import uuid
 
+from zotJson import ZoteroMetrics
+
 # --------------------------------------------------------
 
-type_map = {
-    "ADVS":"film",
-    "AGGR":"document", #how can we handle "database" citations?
-    "ANCIENT":"document",
-    "BILL":"bill",
-    "BLOG":"blogPost",
-    "BOOK":"book",
-    "CHAP":"bookSection",
-    "CHART":"artwork",
-    "CLSWK":"book",
-    "COMP":"computerProgram",
-    "CONF":"conferencePaper",
-    "CPAPER":"conferencePaper",
-    "CTLG":"magazineArticle",
-    "DATA":"document", #dataset
-    "DBASE":"document", #database
-    "DICT":"dictionaryEntry",
-    "EBOOK":"book",
-    "ECHAP":"bookSection",
-    "EDBOOK":"book",
-    "EJOUR":"journalArticle",
-    "ENCYC":"encyclopediaArticle",
-    "EQUA":"document", # what's a good way to handle this?
-    "FIGURE":"artwork",
-    "GEN":"journalArticle",
-    "GOVDOC":"report",
-    "GRNT":"document",
-    "HEAR":"hearing",
-    "ICOMM":"email",
-    "INPR":"manuscript",
-    "JFULL":"journalArticle",
-    "JOUR":"journalArticle",
-    "LEGAL":"case", #is this what they mean?
-    "MANSCPT":"manuscript",
-    "MAP":"map",
-    "MGZN":"magazineArticle",
-    "MPCT":"film",
-    "MULTI":"videoRecording", # maybe?
-    "MUSIC":"audioRecording",
-    "NEWS":"newspaperArticle",
-    "PAMP":"manuscript",
-    "PAT":"patent",
-    "PCOMM":"letter",
-    "RPRT":"report",
-    "SER":"book",
-    "SLIDE":"presentation",
-    "SOUND":"audioRecording", # consider MUSIC
-    "STAND":"report",
-    "STAT":"statute",
-    "THES":"thesis",
-    "UNBILL":"manuscript",
-    "UNPD":"manuscript",
-    "VIDEO":"videoRecording",
-    "CASE":"case",
-    "ABST":"journalArticle",
-    "ART":"artwork",
-    "BOOK":"book",
-    "ELEC":"webpage",
-    "WEB":"webpage"	# not in spec, but used by EndNote
-}
+# Mapping tables ---------------------------------------------------
 
-field_map = {
-    "AB":"abstractNote",
-    "AN":"archiveLocation",
-    "CN":"callNumber",
-    "DB":"archive",
-    "DO":"DOI",
-    "DP":"libraryCatalog",
-    "J2":"journalAbbreviation",
-    "KW":"tags",
-    "L1":"attachments/PDF",
-    "L2":"attachments/HTML",
-    "L4":"attachments/other",
-    "N1":"notes",
-    "ST":"shortTitle",
-    "UR":"url",
-    "Y2":"accessDate",
-    "CA": "unsupported/Caption",
-    "CR": "rights",
-    "CT": "title",
-    "ED": "creators/editor",
-    "EP": "pages",
-    #	"H1": "unsupported/Library Catalog", # Citavi specific (possibly multiple occurences)
-    "H1":"libraryCatalog",
-    "H2":"callNumber",
-    #	"H2": "unsupported/Call Number", # Citavi specific (possibly multiple occurences)
-    "JA": "journalAbbreviation",
-    "JF": "publicationTitle",
-    "LB":"label",
-    "M2": "extra", # not in spec
-    "N2": "abstractNote",
-    "RN": "notes"
-}
+# type_map, field_map, dependent_fields and non_standard_field_maps live in
+# RisTables, the test_input_* records in RisTestInputs. Both are imported
+# on first access, e.g. RisToZotero.type_map, not when this module is.
 
-# type specific
-	# tag => field:itemTypes
-	# if itemType not explicitly given, __default field is used
-    # unless itemType is excluded in exclude
-
-dependent_fields = {
-    "TI": {
-		"__default":"title",
-		"subject":["email"],
-		"caseName":["case"],
-		"nameOfAct":["statute"]
-	},
-	"T2": {
-		"code":["bill", "statute"],
-		"bookTitle":["bookSection"],
-		"blogTitle":["blogPost"],
-		"conferenceName":["conferencePaper"],
-		"dictionaryTitle":["dictionaryEntry"],
-		"encyclopediaTitle":["encyclopediaArticle"],
-		"committee":["hearing"],
-		"forumTitle":["forumPost"],
-		"websiteTitle":["webpage"],
-		"programTitle":["radioBroadcast", "tvBroadcast"],
-		"meetingName":["presentation"],
-		"seriesTitle":["computerProgram", "map", "report"],
-		"series": ["book"],
-		"publicationTitle":["journalArticle", "magazineArticle", "newspaperArticle"],
-        "__default":"backupPublicationTitle"
-	},
-    "TA": "unsupported/Translated Author",
-    "TT": "unsupported/Translated Title",
-	"T3": {
-		"legislativeBody":["hearing", "bill"],
-		"series":["bookSection", "conferencePaper", "journalArticle","book"],
-		"seriesTitle":["audioRecording"]
-	},
-	# NOT "HANDLED": reviewedAuthor, scriptwriter, contributor, guest
-	"AU": {
-		"__default":"creators/author",
-		"creators/artist":["artwork"],
-		"creators/cartographer":["map"],
-		"creators/composer":["audioRecording"],
-		"creators/director":["film", "radioBroadcast", "tvBroadcast", "videoRecording"], # this clashes with audioRecording
-		"creators/interviewee":["interview"],
-		"creators/inventor":["patent"],
-		"creators/podcaster":["podcast"],
-		"creators/programmer":["computerProgram"]
-	},
-	"A2": {
-		"creators/sponsor":["bill"],
-		"creators/performer":["audioRecording"],
-		"creators/presenter":["presentation"],
-		"creators/interviewer":["interview"],
-		"creators/editor":["journalArticle", "bookSection", "conferencePaper", "dictionaryEntry", "document", "encyclopediaArticle"],
-		"creators/seriesEditor":["book", "report"],
-		"creators/recipient":["email", "instantMessage", "letter"],
-		"reporter":["case"],
-		"issuingAuthority":["patent"]
-	},
-	"A3": {
-		"creators/cosponsor":["bill"],
-		"creators/producer":["film", "tvBroadcast", "videoRecording", "radioBroadcast"],
-		"creators/editor":["book"],
-		"creators/seriesEditor":["bookSection", "conferencePaper", "dictionaryEntry", "encyclopediaArticle", "map"]
-	},
-	"A4": {
-		"__default":"creators/translator",
-		"creators/counsel":["case"],
-		"creators/contributor":["conferencePaper", "film"]	# translator does not fit these
-	},
-	"C1": {
-		"filingDate":["patent"], # not in spec
-		"creators/castMember":["radioBroadcast", "tvBroadcast", "videoRecording"],
-		"scale":["map"],
-		"place":["conferencePaper"]
-	},
-	"C2": {
-		"issueDate":["patent"], # not in spec
-		"creators/bookAuthor":["bookSection"],
-		"creators/commenter":["blogPost"]
-	},
-	"C3": {
-		"artworkSize":["artwork"],
-		"proceedingsTitle":["conferencePaper"],
-		"country":["patent"]
-	},
-	"C4": {
-		"creators/wordsBy":["audioRecording"], # not in spec
-		"creators/attorneyAgent":["patent"],
-		"genre":["film"]
-	},
-	"C5": {
-		"references":["patent"],
-		"audioRecordingFormat":["audioRecording", "radioBroadcast"],
-		"videoRecordingFormat":["film", "tvBroadcast", "videoRecording"]
-	},
-	"C6": {
-		"legalStatus":["patent"],
-	},
-	"CY": {
-		"__default":"place",
-		"__exclude":["conferencePaper"] # should be exported as C1
-        # if conferencePaper then CY -> C1, restart
-	},
-	"DA": { # also see PY when editing
-		"__default":"date",
-		"dateEnacted":["statute"],
-		"dateDecided":["case"],
-		"issueDate":["patent"]
-	},
-	"ET": {
-		"__default":"edition",
- 		"__ignore":["journalArticle"], # EPubDate. If journalArticle, pop or delete ET.
-		"session":["bill", "hearing", "statute"],
-		"version":["computerProgram"]
-	},
-	"IS": {
-		"__default":"issue",
-		"numberOfVolumes": ["bookSection"]
-	},
-	"LA": {
-		"__default":"language",
-		"programmingLanguage": ["computerProgram"]
-	},
-	"M1": {
-		"seriesNumber":["book"],
-		"billNumber":["bill"],
-		"system":["computerProgram"],
-		"documentNumber":["hearing"],
-		"applicationNumber":["patent"],
-		"publicLawNumber":["statute"],
-		"episodeNumber":["podcast", "radioBroadcast", "tvBroadcast"],
-        "__default":"extra",
-		"issue": ["journalArticle"], # EndNote hack
-		"numberOfVolumes": ["bookSection"],	# EndNote exports here instead of IS
-		"accessDate": ["webpage"]		# this is access date when coming from EndNote
-	},
-	"M3": {
-		"manuscriptType":["manuscript"],
-		"mapType":["map"],
-		"reportType":["report"],
-		"thesisType":["thesis"],
-		"websiteType":["blogPost", "webpage"],
-		"postType":["forumPost"],
-		"letterType":["letter"],
-		"interviewMedium":["interview"],
-		"presentationType":["presentation"],
-		"artworkMedium":["artwork"],
-		"audioFileType":["podcast"],
-        "__default":"DOI"
-	},
-	"NV": {
-		"__default": "numberOfVolumes",
-		"__exclude": ["bookSection"] # IS. If bookSection then NV -> IS, restart
-	},
-	"OP": {
-		"history":["hearing", "statute", "bill", "case"],
-		"priorityNumbers":["patent"],
-#        "__default": "unsupported/Original Publication",
-#		"unsupported/Content": ["blogPost", "computerProgram", "film", "presentation", "report", "videoRecording", "webpage"]
-	},
-	"PB": {
-		"__default":"publisher",
-		"label":["audioRecording"],
-		"court":["case"],
-		"distributor":["film"],
-		"assignee":["patent"],
-		"institution":["report"],
-		"university":["thesis"],
-		"company":["computerProgram"],
-		"studio":["videoRecording"],
-		"network":["radioBroadcast", "tvBroadcast"]
-	},
-	"PY": { # duplicate of DA, but this will only output year
-		"__default":"date",
-		"dateEnacted":["statute"],
-		"dateDecided":["case"],
-		"issueDate":["patent"]
-	},
-	"SE": {
-		"__default": "section",	# though this can refer to pages, start page, etc. for some types. Zotero does not support any of those combinations, however.
-		"__exclude": ["case"] # if case then pop/delete SE.
-#		"unsupported/File Date": ["case"]
-	},
-	"SN": {
-		"__default":"ISBN",
-		"ISSN":["journalArticle", "magazineArticle", "newspaperArticle"],
-		"patentNumber":["patent"],
-		"reportNumber":["report"],
-	},
-	"SP": {
-		"__default":"pages", # needs extra processing
-		"codePages":["bill"], # bill
-		"numPages":["book", "thesis", "manuscript"], # manuscript not really in spec
-		"firstPage":["case"],
-		"runningTime":["film"]
-	},
-	"SV": {
-		"seriesNumber": ["bookSection"],
-		"docketNumber": ["case"]	# not in spec. EndNote exports this way
-	},
-	"VL": {
-		"__default":"volume",
-		"codeNumber":["statute"],
-		"codeVolume":["bill"],
-		"reporterVolume":["case"],
-		"__exclude":["patent"], # if patent or webpage then pop/delete VL.
-        #"unsupported/Patent Version Number":['patent'],
-		"accessDate": ["webpage"]	# technically access year according to EndNote
-	},
-    "AD": {
-		"__default": "unsupported/Author Address",
-		"unsupported/Inventor Address": ["patent"]
-	},
-    "AV": "archiveLocation", # REFMAN
-    "BT": {
-		"title": ["book", "manuscript"],
-		"bookTitle": ["bookSection"],
-		"__default": "backupPublicationTitle" # we do more filtering on this later
-	},
-	"ID": "__ignore", # No support ? If Id pop/delete ID
-	"JO": {
-		"__default": "journalAbbreviation",
-		"conferenceName": ["conferencePaper"]
-	},
-#	"LB": "unsupported/Label",
-	"RI": {
-		"__default":"unsupported/Reviewed Item",
-		"unsupported/Article Number": ["statute"]
-	},
-	"T1": "TI", # if T1 then TI, restart.
-    "Y1": "DA", #  Old RIS spec. if Y1 then DA, restart
-    "RP": "ET", # We map Reprint Edition to Edition
-    "A1": "AU" # if A1 then AU, restart
+ris_lazy_attributes = {
+    "type_map": "RisTables",
+    "field_map": "RisTables",
+    "dependent_fields": "RisTables",
+    "non_standard_field_maps": "RisTables"
 }
+for ris_test_index in range(1, 8):
+    ris_lazy_attributes["test_input_%d" % ris_test_index] = "RisTestInputs"
 
-# non-standard or degenerate field maps
-# used ONLY for importing and only if these fields are not specified above (e.g. M3)
-# these are not exported the same way
-
-
-non_standard_field_maps= {
-#	"A1": "AU", # if A1 then AU, restart
-#	"AD": {
-#		"__default": "unsupported/Author Address",
-#		"unsupported/Inventor Address": ["patent"]
-#	},
-#	"AV": "archiveLocation", # REFMAN
-#	"BT": {
-#		"title": ["book", "manuscript"],
-#		"bookTitle": ["bookSection"],
-#		"__default": "backupPublicationTitle" # we do more filtering on this later
-#	},
-#	"CA": "unsupported/Caption",
-#    "CR": "rights",
-#	"CT": "title",
-#	"ED": "creators/editor",
-#	"EP": "pages",
-#	"H1": "unsupported/Library Catalog", # Citavi specific (possibly multiple occurences)
-#	"H2": "unsupported/Call Number", # Citavi specific (possibly multiple occurences)
-#	"ID": "__ignore", # No support ? If Id pop/delete ID
-#	"JA": "journalAbbreviation",
-#	"JF": "publicationTitle",
-#	"JO": {
-#		"__default": "journalAbbreviation",
-#		"conferenceName": ["conferencePaper"]
-#	},
-#	"LB": "unsupported/Label",
-#	"M1": {
-#		"__default":"extra",
-#		"issue": ["journalArticle"], # EndNote hack
-#		"numberOfVolumes": ["bookSection"],	# EndNote exports here instead of IS
-#		"accessDate": ["webpage"]		# this is access date when coming from EndNote
-#	},
-#	"M2": "extra", # not in spec
-#	"M3": "DOI",
-#	"N2": "abstractNote",
-#	"NV": "numberOfVolumes",
-#	"OP": {
-#		"__default": "unsupported/Original Publication",
-#		"unsupported/Content": ["blogPost", "computerProgram", "film", "presentation", "report", "videoRecording", "webpage"]
-#	},
-#	"RI": {
-#		"__default":"unsupported/Reviewed Item",
-#		"unsupported/Article Number": ["statute"]
-#	},
-#	"RN": "notes",
-#	"SE": {
-#		"unsupported/File Date": ["case"]
-#	},
-#	"T1": "TI", # if T1 then TI, restart.
-#	"T2": "backupPublicationTitle", # most item types should be covered above
-#	"T3": {
-#		"series": ["book"]
-#	},
-#	"TA": "unsupported/Translated Author",
-#   "TT": "unsupported/Translated Title",
-#	"VL": {
-#		"unsupported/Patent Version Number":['patent'],
-#		"accessDate": ["webpage"]	# technically access year according to EndNote
-#	},
-#	"Y1": "DA" #  Old RIS spec. if Y1 then DA, restart
-}
 
-# Test Text --------------------------------------------------------
+def __getattr__(name):
+    """
+    params: name, str.
+    return: the table or the test record, imported on first access.
+    """
+    #
+    module_name = ris_lazy_attributes.get(name)
+    if module_name is None:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    lazy_value = getattr(importlib.import_module("ZotRisJson." + module_name), name)
+    globals()[name] = lazy_value
+    #
+    return lazy_value
 
-test_input_1 = """TY  - JOUR\nA1  - Baldwin,S.A.\nA1  - Fugaccia,I.\nA1  - Brown,D.R.\nA1  - Brown,L.V.\nA1  - Scheff,S.W.\nT1  - Blood-brain barrier breach following\ncortical contusion in the rat\nJO  - J.Neurosurg.\nY1  - 1996\nVL  - 85\nSP  - 476\nEP  - 481\nRP  - Not In File\nKW  - cortical contusion\nKW  - blood-brain barrier\nKW  - horseradish peroxidase\nKW  - head trauma\nKW  - hippocampus\nKW  - rat\nN2  - Adult Fisher 344 rats were subjected to a unilateral impact to the dorsal cortex above the hippocampus at 3.5 m/sec with a 2 mm cortical depression. This caused severe cortical damage and neuronal loss in hippocampus subfields CA1, CA3 and hilus. Breakdown of the blood-brain barrier (BBB) was assessed by injecting the protein horseradish peroxidase (HRP) 5 minutes prior to or at various times following injury (5 minutes, 1, 2, 6, 12 hours, 1, 2, 5, and 10 days). Animals were killed 1 hour after HRP injection and brain sections were reacted with diaminobenzidine to visualize extravascular accumulation of the protein. Maximum staining occurred in animals injected with HRP 5 minutes prior to or 5 minutes after cortical contusion. Staining at these time points was observed in the ipsilateral hippocampus. Some modest staining occurred in the dorsal contralateral cortex near the superior sagittal sinus. Cortical HRP stain gradually decreased at increasing time intervals postinjury. By 10 days, no HRP stain was observed in any area of the brain. In the ipsilateral hippocampus, HRP stain was absent by 3 hours postinjury and remained so at the 6- and 12- hour time points. Surprisingly, HRP stain was again observed in the ipsilateral hippocampus 1 and 2 days following cortical contusion, indicating a biphasic opening of the BBB following head trauma and a possible second wave of secondary brain damage days after the contusion injury. These data indicate regions not initially destroyed by cortical impact, but evidencing BBB breach, may be accessible to neurotrophic factors administered intravenously both immediately and days after brain trauma.\nER  - """
 
-test_input_2 = """TY  - PAT\nA1  - Burger,D.R.\nA1  - Goldstein,A.S.\nT1  - Method of detecting AIDS virus infection\nY1  - 1990/2/27\nVL  - 877609\nIS  - 4,904,581\nRP  - Not In File\nA2  - Epitope,I.\nCY  - OR\nPB  - 4,629,783\nKW  - AIDS\nKW  - virus\nKW  - infection\nKW  - antigens\nY2  - 1986/6/23\nM1  - G01N 33/569 G01N 33/577\nM2  - 435/5 424/3 424/7.1 435/7 435/29 435/32 435/70.21 435/240.27 435/172.2 530/387 530/808 530/809 935/110\nN2  - A method is disclosed for detecting the presence of HTLV III infected cells in a medium. The method comprises contacting the medium with monoclonal antibodies against an antigen produced as a result of the infection and detecting the binding of the antibodies to the antigen. The antigen may be a gene product of the HTLV III virus or may be bound to such gene product. On the other hand the antigen may not be a viral gene product but may be produced as a result of the infection and may further be bound to a lymphocyte. The medium may be a human body fluid or a culture medium. A particular embodiment of the present method involves a method for determining the presence of a AIDS virus in a person. The method comprises combining a sample of a body fluid from the person with a monoclonal antibody that binds to an antigen produced as a result of the infection and detecting the binding of the monoclonal antibody to the antigen. The presence of the binding indicates the presence of a AIDS virus infection. Also disclosed are novel monoclonal antibodies, noval compositions of matter, and novel diagnostic kits\nER  - """
+def ris_tables_load():
+    """
+    return: (type_map, field_map, dependent_fields)
+    """
+    #
+    from ZotRisJson import RisTables
+    #
+    return (RisTables.type_map, RisTables.field_map, RisTables.dependent_fields)
 
-test_input_3 = """TY  - AGGR\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Name1, Author\nAU  - Name2, Author\nCA  - Caption\nCY  - Place Published\nDA  - Date Accessed\nDB  - Name of Database\nDO  - 10.1234/123456\nDP  - Database Provider\nET  - Date Published\nJ2  - Periodical Title\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Publication Number\nM3  - Type of Work\nN1  - Notes\nOP  - Original Publication\nPB  - Publisher\nPY  - Year\nRN  - ResearchNotes\nSE  - Screens\nSN  - ISSN/ISBN\nSP  - Pages\nST  - Short Title\nT2  - Periodical\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Volume\nID  - 2\nER  - \n\n\nTY  - ANCIENT\nA2  - Editor\nA4  - Translator\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Name1, Author\nAU  - Name2, Author\nCN  - Call Number\nCA  - Caption\nCY  - Place Published\nDA  - Date\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Edition\nJ2  - Abbreviated Publication\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Text Number\nM3  - Type of Work\nN1  - Notes\nNV  - Number of Volumes\nOP  - Original Publication\nPB  - Publisher\nPY  - Year\nRI  - Reviewed Item\nRN  - ResearchNotes\nRP  - Reprint Edition\nSN  - ISBN\nSP  - Pages\nST  - Short Title\nT2  - Publication Title\nT3  - Volume Title\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Volume\nY2  - Access Date\nID  - 3\nER  - \n\n\nTY  - ART\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Artist\nC3  - Size/Length\nCA  - Caption\nCN  - Call Number\nCY  - Place Published\nDA  - Date\nDB  - Name of Database\nDP  - Database Provider\nDO  - DOI\nET  - Edition\nJ2  - Periodical Title\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Size\nM3  - Type of Work\nN1  - Notes\nPB  - Publisher\nPY  - Year\nRN  - Research Notes\nSP  - Description\nST  - Short Title\nTI  - Title\nTT  - Translated Title\nTA  - Author, Translated\nUR  - URL\nY2  - Access Date\nID  - 4\nER  - \n\n\nTY  - ADVS\nA2  - Performers\nA3  - Editor, Series\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Name1, Author\nAU  - Name2, Author\nC1  - Cast\nC2  - Credits\nC3  - Size/Length\nC5  - Format\nCA  - Caption\nCN  - Call Number\nCY  - Place Published\nDA  - Date\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Edition\nJ2  - Periodical Title\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Number\nM3  - Type\nN1  - Notes\nNV  - Extent of Work\nOP  - Contents\nPB  - Publisher\nPY  - Year\nRN  - Research Notes\nSN  - ISBN\nST  - Short Title\nT3  - Series Title\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Volume\nY2  - Access Date\nID  - 5\nER  - \n\n\nTY  - BILL\nA2  - Sponsor\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nCA  - Caption\nCN  - Call Number\nDA  - Date\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Session\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nN1  - Notes\nM1  - Bill Number\nOP  - History\nPY  - Year\nRN  - Research Notes\nSE  - Code Section\nSP  - Code Pages\nST  - Short Title\nT2  - Code\nT3  - Legislative Body\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Code Volume\nY2  - Access Date\nID  - 6\nER  - \n\n\nTY  - BLOG\nA2  - Editor\nA3  - Illustrator\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Name1, Author\nAU  - Name2, Author\nC1  - Author Affiliation\nCA  - Caption\nCN  - Call Number\nCY  - Place Published\nDA  - Last Update Date\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Edition\nJ2  - Periodical Title\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM3  - Type of Medium\nN1  - Notes\nOP  - Contents\nPB  - Publisher\nPY  - Year\nRN  - Research Notes\nSE  - Message Number\nSN  - ISBN\nSP  - Description\nST  - Short Title\nT2  - Title of WebLog\nT3  - Institution\nTA  - Author, Translated\nTI  - Title of Entry\nTT  - Translated Title\nUR  - URL\nVL  - Access Year\nY2  - Number\nID  - 7\nER  - \n\n\nTY  - BOOK\nA2  - Editor, Series\nA3  - Editor\nA4  - Translator\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Name1, Author\nAU  - Name2, Author\nC3  - Title Prefix\nC4  - Reviewer\nCA  - Caption\nCN  - Call Number\nCY  - Place Published\nDA  - Date\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Edition\nJ2  - Abbreviation\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Series Volume\nM3  - Type of Work\nN1  - Notes\nNV  - Number of Volumes\nOP  - Original Publication\nPB  - Publisher\nPY  - Year\nRN  - Research Notes\nRP  - Reprint Edition\nSE  - Pages\nSN  - ISBN\nSP  - Number of Pages\nST  - Short Title\nT2  - Series Title\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Volume\nY2  - Access Date\nID  - 8\nER  - \n\n\nTY  - CHAP\nA2  - Editor\nA3  - Editor, Series\nA4  - Translator\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Name1, Author\nAU  - Name2, Author\nC1  - Section\nC3  - Title Prefix\nC4  - Reviewer\nC5  - Packaging Method\nCA  - Caption\nCN  - Call Number\nCY  - Place Published\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Edition\nJ2  - Abbreviation\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Number of Volumes\nOP  - Original Publication\nN1  - Notes\nPB  - Publisher\nPY  - Year\nRI  - Reviewed Item\nRN  - Research Notes\nRP  - Reprint Edition\nSE  - Chapter\nSN  - ISBN\nSP  - Pages\nST  - Short Title\nSV  - Series Volume\nT2  - Book Title\nT3  - Series Title\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Volume\nY2  - Access Date\nID  - 9\nER  - \n\n\nTY  - CASE\nA2  - Reporter\nA3  - Court, Higher\nA4  - Counsel\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nCA  - Caption\nCN  - Call Number\nDA  - Date Accessed\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Action of Higher Court\nJ2  - Parallel Citation\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM3  - Citation of Reversal\nN1  - Notes\nNV  - Reporter Abbreviation\nOP  - History\nPB  - Court\nPY  - Year Decided\nRN  - ResearchNotes\nSE  - Filed Date\nSP  - First Page\nST  - Abbreviated Case Name\nSV  - Docket Number\nT3  - Decision\nTA  - Author, Translated\nTI  - Case Name\nTT  - Translated Title\nUR  - URL\nVL  - Reporter Volume\nID  - 10\nER  - \n\n\nTY  - CTLG\nA2  - Institution\nA4  - Translator\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Name1, Author\nAU  - Name2, Author\nC5  - Packaging Method\nCA  - Caption\nCN  - Call Number\nCY  - Place Published\nDA  - Date\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Edition\nJ2  - Abbreviation\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Series Volume\nM3  - Type of Work\nN1  - Notes\nNV  - Catalog Number\nOP  - Original Publication\nPB  - Publisher\nPY  - Year\nRN  - Research Notes\nRP  - Reprint Edition\nSE  - Number of Pages\nSN  - ISBN\nSP  - Pages\nST  - Short Title\nT2  - Series Title\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Volume\nY2  - Access Date\nID  - 11\nER  - \n\n\nTY  - CHART\nA2  - File, Name of\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - By, Created\nCA  - Caption\nCN  - Call Number\nCY  - Place Published\nDA  - Date\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Version\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Number\nM3  - Type of Image\nN1  - Notes\nPB  - Publisher\nPY  - Year\nRN  - Research Notes\nSP  - Description\nT2  - Image Source Program\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Image Size\nY2  - Access Date\nID  - 12\nER  - \n\n\nTY  - CLSWK\nA2  - Editor, Series\nA4  - Translator\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Attribution\nCA  - Caption\nCN  - Call Number\nCY  - Place Published\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Edition\nJ2  - Periodical Title\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Series Volume\nM3  - Type\nN1  - Notes\nNV  - Number of Volumes\nOP  - Original Publication\nPB  - Publisher\nPY  - Year\nRN  - Research Notes\nRP  - Reprint Edition\nSN  - ISSN/ISBN\nSP  - Number of Pages\nST  - Short Title\nT2  - Series Title\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Volume\nY2  - Access Date\nID  - 23\nER  - \n\n\nTY  - COMP\nA2  - Editor, Series\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Programmer\nC1  - Computer\nCA  - Caption\nCN  - Call Number\nCY  - Place Published\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Version\nJ2  - Periodical Title\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM3  - Type\nN1  - Notes\nOP  - Contents\nPB  - Publisher\nPY  - Year\nRN  - Research Notes\nSN  - ISBN\nSP  - Description\nST  - Short Title\nT2  - Series Title\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Edition\nY2  - Access Date\nID  - 14\nER  - \n\n\nTY  - CPAPER\nA2  - Editor\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Name1, Author\nAU  - Name2, Author\nC1  - Place Published\nCA  - Caption\nCY  - Conference Location\nDA  - Date\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Issue\nM3  - Type\nN1  - Notes\nPB  - Publisher\nPY  - Year\nRN  - Research Notes\nSP  - Pages\nT2  - Conference Name\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Volume\nY2  - Access Date\nID  - 15\nER  - \n\n\nTY  - CONF\nA2  - Editor\nA3  - Editor, Series\nA4  - Sponsor\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Name1, Author\nAU  - Name2, Author\nC1  - Place Published\nC2  - Year Published\nC3  - Proceedings Title\nC5  - Packaging Method\nCA  - Caption\nCN  - Call Number\nCY  - Conference Location\nDA  - Date\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Edition\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Issue\nN1  - Notes\nNV  - Number of Volumes\nOP  - Source\nPB  - Publisher\nPY  - Year of Conference\nRN  - Research Notes\nSN  - ISBN\nSP  - Pages\nST  - Short Title\nT2  - Conference Name\nT3  - Series Title\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Volume\nY2  - Access Date\nID  - 16\nER  - \n\n\nTY  - DATA\nA2  - Producer\nA4  - Agency, Funding\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Investigators\nC1  - Time Period\nC2  - Unit of Observation\nC3  - Data Type\nC4  - Dataset(s)\nCA  - Caption\nCN  - Call Number\nCY  - Place Published\nDA  - Date of Collection\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Version\nJ2  - Abbreviation\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nN1  - Notes\nNV  - Study Number\nOP  - Version History\nPB  - Distributor\nPY  - Year\nRI  - Geographic Coverage\nRN  - Research Notes\nSE  - Original Release Date\nSN  - ISSN\nST  - Short Title\nT3  - Series Title\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nY2  - Access Date\nID  - 17\nER  - \n\n\nTY  - DICT\nA2  - Editor\nA4  - Translator\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Name1, Author\nAU  - Name2, Author\nC1  - Term\nCA  - Caption\nCN  - Call Number\nCY  - Place Published\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Edition\nJ2  - Abbreviation\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Number\nM3  - Type of Work\nN1  - Notes\nNV  - Number of Volumes\nOP  - Original Publication\nPB  - Publisher\nPY  - Year\nRI  - Reviewed Item\nRN  - Research Notes\nRP  - Reprint Edition\nSE  - Version\nSN  - ISBN\nSP  - Pages\nST  - Short Title\nT2  - Dictionary Title\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Volume\nY2  - Access Date\nID  - 13\nER  - \n\n\nTY  - EDBOOK\nA2  - Editor, Series\nA4  - Translator\nAB  - Abstract\nAD  - Editor Address\nAN  - Accession Number\nAU  - Editor\nCA  - Caption\nCN  - Call Number\nCY  - Place Published\nDA  - Date\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Edition\nJ2  - Periodical Title\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Series Volume\nM3  - Type of Work\nN1  - Notes\nNV  - Number of Volumes\nOP  - Original Publication\nPB  - Publisher\nPY  - Year\nRN  - Research Notes\nRP  - Reprint Edition\nSN  - ISBN\nSP  - Number of Pages\nST  - Short Title\nT2  - Series Title\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Volume\nY2  - Access Date\nID  - 19\nER  - \n\n\nTY  - EJOUR\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Name1, Author\nAU  - Name2, Author\nC1  - Year Cited\nC2  - Date Cited\nC3  - PMCID\nC4  - Reviewer\nC5  - Issue Title\nC6  - NIHMSID\nC7  - Article Number\nCA  - Caption\nCY  - Place Published\nDA  - Date Accessed\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Edition\nJ2  - Periodical Title\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Issue\nM3  - Type of Work\nN1  - Notes\nNV  - Document Number\nPB  - Publisher\nPY  - Year\nRI  - Reviewed Item\nRN  - Research Notes\nRP  - Reprint Edition\nSE  - E-Pub Date\nSN  - ISSN\nSP  - Pages\nST  - Short Title\nT2  - Periodical Title\nT3  - Website Title\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Volume\nID  - 20\nER  - \n\n\nTY  - EBOOK\nA2  - Editor\nA3  - Editor, Series\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Name1, Author\nAU  - Name2, Author\nC1  - Year Cited\nC2  - Date Cited\nC3  - Title Prefix\nC4  - Reviewer\nC5  - Last Update Date\nC6  - NIHMSID\nC7  - PMCID\nCA  - Caption\nCN  - Call Number\nCY  - Place Published\nDA  - Date Accessed\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Edition\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM3  - Type of Medium\nN1  - Notes\nNV  - Version\nOP  - Original Publication\nPB  - Publisher\nPY  - Year\nRI  - Reviewed Item\nRN  - Research Notes\nRP  - Reprint Edition\nSN  - ISBN\nSP  - Number of Pages\nT2  - Secondary Title\nT3  - Series Title\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Volume\nID  - 21\nER  - \n\n\nTY  - ECHAP\nA2  - Editor\nA3  - Editor, Series\nA4  - Translator\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Name1, Author\nAU  - Name2, Author\nC1  - Section\nC3  - Title Prefix\nC4  - Reviewer\nC5  - Packaging Method\nC6  - NIHMSID\nC7  - PMCID\nCA  - Caption\nCN  - Call Number\nCY  - Place Published\nDA  - Date\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Edition\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Series Volume\nM3  - Type of Work\nN1  - Notes\nNV  - Number of Volumes\nOP  - Original Publication\nPB  - Publisher\nPY  - Year\nRI  - Reviewed Item\nRN  - Research Notes\nRP  - Reprint Edition\nSN  - ISSN/ISBN\nSP  - Number of Pages\nST  - Short Title\nT2  - Book Title\nT3  - Series Title\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Volume\nY2  - Access Date\nID  - 22\nER  - \n\n\nTY  - ENCYC\nA2  - Editor\nA4  - Translator\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Name1, Author\nAU  - Name2, Author\nC1  - Term\nCA  - Caption\nCN  - Call Number\nCY  - Place Published\nDA  - Date\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Edition\nJ2  - Abbreviation\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nN1  - Notes\nNV  - Number of Volumes\nOP  - Original Publication\nPB  - Publisher\nPY  - Year\nRI  - Reviewed Item\nRN  - Research Notes\nRP  - Reprint Edition\nSN  - ISBN\nSP  - Pages\nST  - Short Title\nT2  - Encyclopedia Title\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Volume\nY2  - Access Date\nID  - 18\nER  - \n\n\nTY  - EQUA\nA2  - File, Name of\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - By, Created\nCA  - Caption\nCN  - Call Number\nCY  - Place Published\nDA  - Date\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Version\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Number\nM3  - Type of Image\nN1  - Notes\nPB  - Publisher\nPY  - Year\nRN  - Research Notes\nSP  - Description\nT2  - Image Source Program\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Image Size\nY2  - Access Date\nID  - 24\nER  - \n\n\nTY  - FIGURE\nA2  - File, Name of\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - By, Created\nCN  - Call Number\nCA  - Caption\nCY  - Place Published\nDA  - Date\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Version\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Number\nM3  - Type of Image\nN1  - Notes\nPB  - Publisher\nPY  - Year\nRN  - Research Notes\nSP  - Description\nT2  - Image Source Program\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Image Size\nY2  - Access Date\nID  - 25\nER  - \n\n\nTY  - MPCT\nA2  - Director, Series\nA3  - Producer\nA4  - Performers\nAB  - Synopsis\nAD  - Author Address\nAN  - Accession Number\nAU  - Director\nC1  - Cast\nC2  - Credits\nC4  - Genre\nC5  - Format\nCA  - Caption\nCN  - Call Number\nCY  - Place Published\nDA  - Date Released\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Edition\nJ2  - Periodical Title\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM3  - Medium\nN1  - Notes\nPB  - Distributor\nPY  - Year Released\nRN  - Research Notes\nRP  - Reprint Edition\nSP  - Running Time\nST  - Short Title\nT2  - Series Title\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nY2  - Access Date\nID  - 26\nER  - \n\n\nTY  - GEN\nA2  - Author, Secondary\nA3  - Author, Tertiary\nA4  - Author, Subsidiary\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Name1, Author\nAU  - Name2, Author\nC1  - Custom 1\nC2  - Custom 2\nC3  - Custom 3\nC4  - Custom 4\nC5  - Custom 5\nC6  - Custom 6\nC7  - Custom 7\nC8  - Custom 8\nCA  - Caption\nCN  - Call Number\nCY  - Place Published\nDA  - Date\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Edition\nJ2  - Periodical Title\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Number\nM3  - Type of Work\nN1  - Notes\nNV  - Number of Volumes\nOP  - Original Publication\nPB  - Publisher\nPY  - Year\nRI  - Reviewed Item\nRN  - Research Notes\nRP  - Reprint Edition\nSE  - Section\nSN  - ISSN/ISBN\nSP  - Pages\nST  - Short Title\nT2  - Secondary Title\nT3  - Tertiary Title\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Volume\nY2  - Access Date\nID  - 27\nER  - \n\n\nTY  - GOVDOC\nA2  - Department\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Name1, Author\nAU  - Name2, Author\nC1  - Government Body\nC2  - Congress Number\nC3  - Congress Session\nCA  - Caption\nCY  - Place Published\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Edition\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Number\nN1  - Notes\nPB  - Publisher\nPY  - Year\nRN  - Research Notes\nSE  - Section\nSN  - ISSN/ISBN\nSP  - Pages\nT3  - Series Title\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Volume\nY2  - Access Date\nID  - 28\nER  - \n\n\nTY  - GRANT\nA4  - Translator\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Investigators\nC1  - Contact Name\nC2  - Contact Address\nC3  - Contact Phone\nC4  - Contact Fax\nC5  - Funding Number\nC6  - CFDA Number\nCA  - Caption\nCN  - Call Number\nCY  - Activity Location\nDA  - Deadline\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Requirements\nJ2  - Periodical Title\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Status\nM3  - Funding Type\nN1  - Notes\nNV  - Amount Received\nOP  - Original Grant Number\nPB  - Sponsoring Agency\nPY  - Year\nRI  - Reviewed Item\nRN  - Research Notes\nRP  - Review Date\nSE  - Duration of Grant\nSP  - Pages\nST  - Short Title\nTA  - Author, Translated\nTI  - Title of Grant\nTT  - Translated Title\nUR  - URL\nVL  - Amount Requested\nY2  - Access Date\nID  - 29\nER  - \n\n\nTY  - HEAR\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nC2  - Congress Number\nCA  - Caption\nCN  - Call Number\nCY  - Place Published\nDA  - Date\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Session\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Document Number\nN1  - Notes\nNV  - Number of Volumes\nOP  - History\nPB  - Publisher\nPY  - Year\nRN  - Research Notes\nSN  - ISBN\nSP  - Pages\nST  - Short Title\nT2  - Committee\nT3  - Legislative Body\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nY2  - Access Date\nID  - 30\nER  - \n\n\nTY  - JOUR\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Name1, Author\nAU  - Name2, Author\nC1  - Legal Note\nC2  - PMCID\nC6  - NIHMSID\nC7  - Article Number\nCA  - Caption\nCN  - Call Number\nDA  - Date\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Epub Date\nJ2  - Periodical Title\nLA  - Language\nLB  - Label\nIS  - Issue\nM3  - Type of Article\nOP  - Original Publication\nPY  - Year\nRI  - Reviewed Item\nRN  - Research Notes\nRP  - Reprint Edition\nSE  - Start Page\nSN  - ISSN\nSP  - Pages\nST  - Short Title\nT2  - Journal\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Volume\nY2  - Access Date\nID  - 31\nER  - \n\n\nTY  - LEGAL\nA2  - Organization, Issuing\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Name1, Author\nAU  - Name2, Author\nCA  - Caption\nCN  - Call Number\nCY  - Place Published\nDA  - Date of Code Edition\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Edition\nJ2  - Periodical Title\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Start Page\nM3  - Type of Work\nN1  - Notes\nNV  - Session Number\nOP  - History\nPB  - Publisher\nPY  - Year\nRN  - Research Notes\nSE  - Section Number\nSN  - ISSN/ISBN\nSP  - Pages\nT2  - Title Number\nT3  - Supplement No.\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Rule Number\nY2  - Access Date\nID  - 32\nER  - \n\n\nTY  - MGZN\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Name1, Author\nAU  - Name2, Author\nCA  - Caption\nCN  - Call Number\nCY  - Place Published\nDA  - Date\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Edition\nJ2  - Periodical Title\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Issue Number\nM3  - Type of Article\nN1  - Notes\nNV  - Frequency\nOP  - Original Publication\nPB  - Publisher\nPY  - Year\nRI  - Reviewed Item\nRN  - Research Notes\nRP  - Reprint Edition\nSE  - Start Page\nSN  - ISSN\nSP  - Pages\nST  - Short Title\nT2  - Magazine\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Volume\nY2  - Access Date\nID  - 33\nER  - \n\n\nTY  - MANSCPT\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Name1, Author\nAU  - Name2, Author\nCA  - Caption\nCN  - Call Number\nCY  - Place Published\nDA  - Date\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Description of Material\nJ2  - Periodical Title\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Folio Number\nM3  - Type of Work\nN1  - Notes\nNV  - Manuscript Number\nPB  - Library/Archive\nPY  - Year\nRN  - Research Notes\nRP  - Reprint Edition\nSE  - Start Page\nSP  - Pages\nST  - Short Title\nT2  - Collection Title\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Volume/Storage Container\nY2  - Access Date\nID  - 34\nER  - \n\n\nTY  - MAP\nA2  - Editor, Series\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Cartographer\nC1  - Scale\nC2  - Area\nC3  - Size\nC5  - Packaging Method\nCA  - Caption\nCN  - Call Number\nCY  - Place Published\nDA  - Date\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Edition\nJ2  - Periodical Title\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM3  - Type\nN1  - Notes\nPB  - Publisher\nPY  - Year\nRN  - Research Notes\nRP  - Reprint Edition\nSN  - ISSN/ISBN\nSP  - Description\nST  - Short Title\nT2  - Series Title\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nY2  - Access Date\nID  - 35\nER  - \n\n\nTY  - MUSIC\nA2  - Editor\nA3  - Editor, Series\nA4  - Producer\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Composer\nC1  - Format of Music\nC2  - Form of Composition\nC3  - Music Parts\nC4  - Target Audience\nC5  - Accompanying Matter\nCA  - Caption\nCN  - Call Number\nCY  - Place Published\nDA  - Date\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Edition\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM3  - Form of Item\nN1  - Notes\nNV  - Number of Volumes\nOP  - Original Publication\nPB  - Publisher\nPY  - Year\nRN  - Research Notes\nRP  - Reprint Edition\nSE  - Section\nSN  - ISBN\nSP  - Pages\nST  - Short Title\nT2  - Album Title\nT3  - Series Title\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Volume\nY2  - Access Date\nID  - 36\nER  - \n\n\nTY  - NEWS\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Reporter\nC1  - Column\nC2  - Issue\nCA  - Caption\nCN  - Call Number\nCY  - Place Published\nDA  - Issue Date\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  -  Edition\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Start Page\nM3  - Type of Article\nN1  - Notes\nNV  - Frequency\nOP  - Original Publication\nPB  - Publisher\nPY  - Year\nRI  - Reviewed Item\nRN  - Research Notes\nRP  - Reprint Edition\nSE  - Section\nSN  - ISSN\nSP  - Pages\nST  - Short Title\nT2  - Newspaper\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Volume\nY2  - Access Date\nID  - 37\nER  - \n\n\nTY  - DBASE\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Name1, Author\nAU  - Name2, Author\nCA  - Caption\nCY  - Place Published\nDA  - Date Accessed\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Date Published\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM3  - Type of Work\nN1  - Notes\nPB  - Publisher\nPY  - Year\nRN  - Research Notes\nSN  - Report Number\nSP  - Pages\nT2  - Periodical\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Volume\nID  - 38\nER  - \n\n\nTY  - MULTI\nA2  - Editor, Series\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - By, Created\nC1  - Year Cited\nC2  - Date Cited\nC5  - Format/Length\nCA  - Caption\nDA  - Date Accessed\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Number of Screens\nM3  - Type of Work\nN1  - Notes\nPB  - Distributor\nPY  - Year\nRN  - Research Notes\nT2  - Series Title\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nID  - 39\nER  - \n\n\nTY  - PAMP\nA2  - Institution\nA4  - Translator\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Name1, Author\nAU  - Name2, Author\nC5  - Packaging Method\nCA  - Caption\nCN  - Call Number\nCY  - Place Published\nDA  - Date\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Edition\nJ2  - Abbreviation\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Series Volume\nM3  - Type of Work\nN1  - Notes\nOP  - Original Publication\nPB  - Publisher\nPY  - Year\nRN  - Research Notes\nRP  - Reprint Edition\nM2  - Number of Pages\nSN  - ISBN\nSP  - Pages\nST  - Short Title\nT2  - Published Source\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Number\nY2  - Access Date\nID  - 40\nER  - \n\n\nTY  - PAT\nA2  - Organization, Issuing\nA3  - International Author\nAB  - Abstract\nAD  - Inventor Address\nAN  - Accession Number\nAU  - Inventor\nC2  - Issue Date\nC3  - Designated States\nC4  - Attorney/Agent\nC5  - References\nC6  - Legal Status\nCA  - Caption\nCN  - Call Number\nCY  - Country\nDA  - Date\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - International Patent Classification\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Application Number\nM3  - Patent Type\nN1  - Notes\nNV  - US Patent Classification\nOP  - Priority Numbers\nPB  - Assignee\nPY  - Year\nRN  - Research Notes\nSE  - International Patent Number\nSN  - Patent Number\nSP  - Pages\nST  - Short Title\nT2  - Published Source\nT3  - Title, International\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Patent Version Number\nY2  - Access Date\nID  - 41\nER  - \n\n\nTY  - PCOMM\nA2  - Recipient\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Name1, Author\nAU  - Name2, Author\nC1  - Senders E-Mail\nC2  - Recipients E-Mail\nCN  - Call Number\nCA  - Caption\nCY  - Place Published\nDA  - Date\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Description\nJ2  - Abbreviation\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Folio Number\nM3  - Type\nN1  - Notes\nNV  - Communication Number\nPB  - Publisher\nPY  - Year\nRN  - Research Notes\nSP  - Pages\nST  - Short Title\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nY2  - Access Date\nID  - 42\nER  - \n\n\nTY  - RPRT\nA2  - Editor, Series\nA3  - Publisher\nA4  - Department/Division\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Name1, Author\nAU  - Name2, Author\nC6  - Issue\nCA  - Caption\nCN  - Call Number\nCY  - Place Published\nDA  - Date\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Edition\nJ2  - Periodical Title\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Document Number\nM3  - Type\nN1  - Notes\nNV  - Series Volume\nOP  - Contents\nPB  - Institution\nPY  - Year\nRN  - Research Notes\nRP  - Notes\nSN  - Report Number\nSP  - Pages\nST  - Short Title\nTA  - Author, Translated\nT2  - Series Title\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Volume\nY2  - Access Date\nID  - 43\nER  - \n\n\nTY  - SER\nA2  - Editor\nA3  - Editor, Series\nA4  - Editor, Volume\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Name1, Author\nAU  - Name2, Author\nC1  - Section\nC2  - Report Number\nC5  - Packaging Method\nCA  - Caption\nCN  - Call Number\nCY  - Place Published\nDA  - Date\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Edition\nJ2  - Abbreviation\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Series Volume\nM3  - Type of Work\nN1  - Notes\nNV  - Number of Volumes\nOP  - Original Publication\nPB  - Publisher\nPY  - Year\nRI  - Reviewed Item\nRN  - Research Notes\nRP  - Reprint Edition\nSE  - Chapter\nSN  - ISBN\nSP  - Pages\nST  - Short Title\nT2  - Secondary Title\nT3  - Series Title\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Volume\nY2  - Access Date\nID  - 44\nER  - \n\n\nTY  - STAND\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Institution\nCA  - Caption\nCN  - Call Number\nCY  - Place Published\nDA  - Date\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nJ2  - Abbreviation\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Start Page\nM3  - Type of Work\nN1  - Notes\nNV  - Session Number\nPB  - Publisher\nPY  - Year\nRN  - Research Notes\nSE  - Section Number\nSN  - Document Number\nSP  - Pages\nT2  - Section Title\nT3  - Paper Number\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Rule Number\nY2  - Access Date\nID  - 45\nER  - \n\n\nTY  - STAT\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nC5  - Publisher\nC6  - Volume\nCA  - Caption\nCN  - Call Number\nCY  - Country\nDA  - Date Enacted\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Session\nJ2  - Abbreviation\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Public Law Number\nN1  - Notes\nNV  - Statute Number\nOP  - History\nPB  - Source\nPY  - Year\nRI  - Article Number\nRN  - Research Notes\nSE  - Sections\nSP  - Pages\nST  - Short Title\nT2  - Code\nT3  - International Source\nTA  - Author, Translated\nTI  - Name of Act\nTT  - Translated Title\nUR  - URL\nVL  - Code Number\nY2  - Access Date\nID  - 46\nER  - \n\n\nTY  - THES\nA3  - Advisor\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Name1, Author\nAU  - Name2, Author\nCA  - Caption\nCN  - Call Number\nCY  - Place Published\nDA  - Date\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Document Number\nM3  - Thesis Type\nN1  - Notes\nPB  - University\nPY  - Year\nRN  - Research Notes\nSP  - Number of Pages\nST  - Short Title\nT2  - Academic Department\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Degree\nY2  - Access Date\nID  - 47\nER  - \n\n\nTY  - UNPB\nA2  - Editor, Series\nAB  - Abstract\nAD  - Author Address\nAU  - Name1, Author\nAU  - Name2, Author\nCA  - Caption\nCY  - Place Published\nDA  - Date\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nJ2  - Abbreviation\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Number\nM3  - Type of Work\nN1  - Notes\nPB  - Institution\nPY  - Year\nRN  - Research Notes\nSP  - Pages\nST  - Short Title\nT2  - Series Title\nT3  - Department\nTA  - Author, Translated\nTI  - Title of Work\nTT  - Translated Title\nUR  - URL\nY2  - Access Date\nID  - 48\nER  - \n\n\nTY  - WEB\nA2  - Editor, Series\nAB  - Abstract\nAD  - Author Address\nAN  - Accession Number\nAU  - Name1, Author\nAU  - Name2, Author\nC1  - Year Cited\nC2  - Date Cited\nCA  - Caption\nCN  - Call Number\nCY  - Place Published\nDA  - Last Update Date\nDB  - Name of Database\nDO  - DOI\nDP  - Database Provider\nET  - Edition\nJ2  - Periodical Title\nKW  - Keyword1, Keyword2, Keyword3\nKeyword4; Keyword5\nLA  - Language\nLB  - Label\nM1  - Access Date\nM3  - Type of Medium\nN1  - Notes\nOP  - Contents\nPB  - Publisher\nPY  - Year\nRN  - Research Notes\nSN  - ISBN\nSP  - Description\nST  - Short Title\nT2  - Series Title\nTA  - Author, Translated\nTI  - Title\nTT  - Translated Title\nUR  - URL\nVL  - Access Year\nID  - 49\nER  - \n"""
 
-test_input_4 = """TY - JOUR\nAB - Optimal integration of next-generation sequencing into mainstream research requires re-evaluation of how problems can be reasonably overcome and what questions can be asked. .... The random sequencing-based approach to identify microsatellites was rapid, cost-effective and identified thousands of useful microsatellite loci in a previously unstudied species.\nAD - Consortium for Comparative Genomics, Department of Biochemistry and Molecular Genetics, University of Colorado School of Medicine, Aurora, CO 80045, USA; Department of Biology, University of Central Florida, 4000 Central Florida Blvd., Orlando, FL 32816, USA; Department of Biology & Amphibian and Reptile Diversity Research Center, The University of Texas at Arlington, Arlington, TX 76019, USA\nAU - CASTOE, TODD A.\nAU - POOLE, ALEXANDER W.\nAU - GU, WANJUN\nAU - KONING, A. P. JASON de\nAU - DAZA, JUAN M.\nAU - SMITH, ERIC N.\nAU - POLLOCK, DAVID D.\nL1 - internal-pdf://2009 Castoe Mol Eco Resources-1114744832/2009 Castoe Mol Eco Resources.pdf\ninternal-pdf://sm001-1634838528/sm001.pdf\ninternal-pdf://sm002-2305927424/sm002.txt\ninternal-pdf://sm003-2624695040/sm003.xls\nM1 - 9999\nN1 - 10.1111/j.1755-0998.2009.02750.x\nPY - 2009\nSN - 1755-0998\nST - Rapid identification of thousands of copperhead snake (Agkistrodon contortrix) microsatellite loci from modest amounts of 454 shotgun genome sequence\nT2 - Molecular Ecology Resources\nTI - Rapid identification of thousands of copperhead snake (Agkistrodon contortrix) microsatellite loci from modest amounts of 454 shotgun genome sequence\nUR - http://dx.doi.org/10.1111/j.1755-0998.2009.02750.x\nVL - 9999\nID - 3\nER -
-"""
+ris_record_begin_re = re.compile("^TY {1,2}-")
+ris_record_end_re = re.compile("^ER {1,2}-")
 
-test_input_5 = """TY  - BILL\nN1  - Record ID: 10\nA1  - Author Name, Author2 Name2\nTI  - Act Name\nRP  - Reprint Status, Date\nCY  - Code\nPY  - Date of Code\nY2  - Date\nVL  - Bill/Res Number\nSP  - Section(s)\nN1  - Histroy: History\nAV  - Address/Availability\nUR  - Location/URL\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\nTY  - ART\nN1  - Record ID: 20\nA1  - Author Name, Author2 Name2\nN1  - Artist Role: Artist Role\nT1  - Title/Subject\nM1  - Medium\nN1  - Connective Phrase: Connective Phrase\nN1  - Author, Monographic: Monographic Author\nN1  - Author Role: Author Role\nN1  - Title Monographic: Monographic Title\nRP  - Reprint Status, Date\nVL  - Edition\nCY  - Place of Publication\nPB  - Publisher Name\nY1  - Date of Publication\nN1  - Location in Work: Location in Work\nN1  - Size: Size\nN1  - Series Title: Series Title\nN1  - Connective Phrase: Connective Phrase\nAV  - Address/Availability\nUR  - Location/URL\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\n\nTY  - ADVS\nN1  - Record ID: 30\nA1  - Author Name, Author2 Name2\nN1  - Author Role: Author Role\nT1  - Analytic Title\nM3  - Medium Designator\nN1  - Connective Phrase: Connective Phrase\nN1  - Author, Monographic: Monographic Author\nN1  - Author Role: Monographic Author Role\nN1  - Title Monographic: Monographic Title\nRP  - Reprint Status, Date\nVL  - Edition\nN1  - Author, Subsidiary: Subsidiary Author\nN1  - Author Role: Author Role\nCY  - Place of Publication\nPB  - Publisher Name\nPY  - Date of Publication\nIS  - Volume ID\nN1  - Location in Work: Location in Work\nN1  - Extent of Work: Extent of Work\nN1  - Packaging Method: Packaging Method\nN1  - Size: Size\nN1  - Series Editor: Series Editor\nN1  - Series Editor Role: Series Editor Role\nN1  - Series Title: Series Title\nN1  - Series Volume ID: Series Volume ID\nN1  - Series Issue ID: Series Issue ID\nN1  - Connective Phrase: Connective Phrase\nAV  - Address/Availability\nUR  - Location/URL\nSN  - ISBN\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\nTY  - CHAP\nN1  - Record ID: 40\nA1  - Author Name, Author2 Name2\nT1  - Analytic Title\nN1  - Medium Designator: Medium Designator\nN1  - Connective Phrase: Connective Phrase\nA2  - Monographic Author\nN1  - Author Role: Author Role\nT2  - Monographic Title\nRP  - Reprint Status, Date\nVL  - Edition\nCY  - Place of Publication\nPB  - Publisher Name\nPY  - Date of Publication\nN1  - Volume ID: Volume ID\nN1  - Issue ID: Issue ID\nSP  - Page(s)\nA3  - Series Editor\nN1  - Series Editor Role: Series Editor Role\nN1  - Series Title: Series Title\nN1  - Series Volume ID: Series Volume Identification\nN1  - Series Issue ID: Series Issue Identification\nN1  - Connective PhraseConnective Phrase\nAV  - Address/Availability\nUR  - Location/URL\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\nTY  - CHAP\nN1  - Record ID: 50\nA1  - Author Name, Author2 Name2\nN1  - Author Role: Author Role\nT1  - Analytic Title\nN1  - Medium Designator: Medium Designator\nN1  - Connective Phrase: Connective Phrase\nA2  - Monographic Author\nN1  - Author Role: Author Role\nT2  - Monographic Title\nRP  - Reprint Status, Date\nVL  - Edition\nN1  - Author, Subsidiary: Subsidiary Author\nN1  - Author Role: Author Role\nCY  - Place of Publication\nPB  - Publisher Name\nPY  - Date of Publication\nN1  - Date of Copyright: Date of Copyright\nN1  - Volume ID: Volume ID\nN1  - Issue ID: Issue ID\nSP  - Page(s)\nN1  - Extent of Work: Extent of Work\nN1  - Packaging Method: Packaging Method\nA3  - Series Editor\nN1  - Series Editor Role: Series Editor Role\nT3  - Series Title\nN1  - Series Volume ID: Series Volume ID\nAV  - Address/Availability\nUR  - Location/URL\nSN  - ISBN\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\nTY  - ABST\nN1  - Record ID: 180\nA1  - Author Name, Author2 Name2\nT1  - Title\nJF  - Journal Title\nRP  - Reprint Status, Date\nY1  - Date of Publication\nVL  - Volume ID\nIS  - Issue ID\nSP  - Page(s)\nAD  - Address/Availability\nUR  - Location/URL\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\nTY  - BOOK\nN1  - Record ID: 190\nA1  - Monographic Author\nT1  - Monographic Title\nRP  - Reprint Status, Date\nCY  - Place of Publication\nPB  - Publisher Name\nPY  - Date of Publication\nAV  - Address/Availability\nUR  - Location/URL\nSN  - ISBN\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\nTY  - BOOK\nN1  - Record ID: 200\nA1  - Monographic Author\nN1  - Author Role: Author Role\nT1  - Monographic Title\nN1  - Translated Title: Translated Title\nRP  - Reprint Status, Date\nVL  - Edition\nN1  - Author, Subsidiary: Subsidiary Author\nN1  - Author Role: Author Role\nCY  - Place of Publication\nPB  - Publisher Name\nPY  - Date of Publication\nN1  - Original Pub Date: Original Pub Date\nIS  - Volume ID\nN1  - Extent of Work: Extent of Work\nN1  - Packaging Method: Packaging Method\nA3  - Series Editor\nN1  - Series Editor Role: Series Editor Role\nT3  - Series Title\nN1  - Series Volume ID: Series Volume ID\nAV  - Address/Availability\nUR  - Location/URL\nSN  - ISBN\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\nTY  - CASE\nN1  - Record Number: 210\nA1  - Counsel\nT1  - Case Name\nT2  - Case Name (Abbrev)\nRP  - Reprint Status, Date\nCY  - Reporter\nPB  - Court\nPY  - Date Field\nY2  - Date Decided\nN1  - First Page: First Page\nVL  - Reporter Number\nSP  - Page(s)\nT3  - History\nAV  - Address/Availability\nUR  - Location/URL\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\nTY  - COMP\nN1  - Record Number: 220\nT1  - Program Title\nN1  - Computer Program: Computer Program\nN1  - Connective Phrase: Connective Phrase\nA1  - Author/Programmer\nN1  - Author Role: Author Role\nN1  - Title: Title\nRP  - Reprint Status, Date\nIS  - Version\nCY  - Place of Publication\nPB  - Publisher Name\nPY  - Date of Publication\nN1  - Date of Copyright: Date of Copyright\nN1  - Report Identification: Report ID\nN1  - Extent of Work: Extent of Work\nN1  - Packaging Method: Packaging Method\nN1  - Connective Phrase: Connective Phrase\nAV  - Address/Availability\nUR  - Location/URL\nSN  - ISBN\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\nTY  - CONF\nN1  - Record Number: 230\nA1  - Author Name, Author2 Name2\nN1  - Author Role: Author Role\nN1  - Author Affiliation, Ana.: Author Affiliation\nT1  - Paper/Section Title\nN1  - Medium Designator: Medium Designator\nN1  - Connective Phrase: Connective Phrase\nA2  - Editor/Compiler\nN1  - Editor/Compiler Role: Editor/Compiler Role\nN1  - Proceedings Title: Proceedings Title\nY2  - Date of Meeting\nN1  - Place of Meeting: Place of Meeting\nCY  - Place of Publication\nPB  - Publisher Name\nPY  - Date of Publication\nN1  - Date of Copyright: Date of Copyright\nVL  - Volume ID\nSP  - Location in Work\nN1  - Extent of Work: Extent of Work\nN1  - Packaging Method: Packaging Method\nA3  - Series Editor\nN1  - Series Editor Role: Series Editor Role\nT3  - Series Title\nN1  - Series Volume ID: Series Volume ID\nAV  - Address/Availability\nUR  - Location/URL\nN1  - ISBN: ISBN\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\nTY  - DATA\nN1  - Record Number: 240\nT1  - Analytic Title\nN1  - Medium (Data File): Medium (Data File)\nN1  - Connective Phrase: Connective Phrase\nA2  - Editor/Compiler\nN1  - Editor/Compiler Role: Editor/Compiler Role\nN1  - Title, Monographic: Monographic Title\nRP  - Reprint Status, Date\nIS  - Version\nCY  - Place of Publication\nPB  - Publisher Name\nPY  - Date of Publication\nSP  - Location in Work\nN1  - Extent of Work: Extent of Work\nN1  - Packaging Method: Packaging Method\nT3  - Series Title\nN1  - Series Volume ID: Series Volume ID\nN1  - Connective Phrase: Connective Phrase\nAV  - Address/Availability\nUR  - Location/URL\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\nTY  - THES\nN1  - Record Number: 250\nA1  - Author Name, Author2 Name2\nT1  - Analytic Title\nN1  - Medium Designator: Medium Designator\nRP  - Reprint Status, Date\nN1  - Place of Publication: Place of Publication\nPB  - University\nPY  - Date of Publication\nN1  - Date of Copyright: Date of Copyright\nSP  - Extent of Work\nN1  - Packaging Method: Packaging Method\nN1  - Connective Phrase: Connective Phrase\nAV  - Address/Availability\nUR  - Location/URL\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\nTY  - ELEC\nN1  - Record Number: 260\nA1  - Author Name, Author2 Name2\nT1  - Title\nM1  - Medium\nJO  - Source\nRP  - Reprint Status, Date\nIS  - Edition\nPB  - Publisher Name\nPY  - Last Update\nY2  - Access Date\nN1  - Volume ID: Volume ID\nSP  - Page(s)\nAV  - Address/Availability\nUR  - Location/URL\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\nTY  - ICOMM\nN1  - Record Number: 270\nA1  - Author Name, Author2 Name2\nN1  - Author E-mail: Author E-mail\nN1  - Author Affiliation: Author Affiliation\nT1  - Subject\nA2  - Recipient\nN1  - Recipient E-mail: Recipient E-mail\nRP  - Reprint Status, Date\nPY  - Date of Message\nAV  - Address/Availability\nUR  - Location/URL\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\nTY  - GEN\nN1  - Record Number: 280\nA1  - Author Name, Author2 Name2\nT1  - Analytic Title\nA2  - Monographic Author\nT2  - Monographic Title\nJO  - Journal Title\nRP  - Reprint Status, Date\nCY  - Place of Publication\nPB  - Publisher Name\nPY  - Date of Publication\nY2  - Date of Copyright\nVL  - Volume ID\nIS  - Issue ID\nSP  - Location in Work\nA3  - Series Editor\nT3  - Series Title\nAV  - Address/Availability\nUR  - Location/URL\nSN  - ISSN\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\nTY  - HEAR\nN1  - Record Number: 290\nA1  - Author Name, Author2 Name2\nN1  - Author Role: Author Role\nN1  - Author Affiliation: Author Affiliation\nT1  - Title\nN1  - Medium Designator: Medium Designator\nRP  - Reprint Status, Date\nCY  - Committee\nPB  - Subcommittee\nPY  - Hearing Date\nY2  - Date\nVL  - Bill Number\nN1  - Issue ID: Issue ID\nN1  - Location in Work: Location/URL\nAV  - Address/Availability\nUR  - Location/URL\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\nTY  - MGZN\nN1  - Record Number: 300\nA1  - Author Name, Author2 Name2\nT1  - Article Title\nJO  - Magazine Title\nCY  - Place of Publication\nPB  - Publisher Name\nPY  - Date of Publication\nN1  - Copyright Date: Date of Copyright\nVL  - Volume ID\nIS  - Issue ID\nSP  - Page(s)\nAV  - Address/Availability\nUR  - Location/URL\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\nTY  - INPR\nN1  - Record Number: 310\nA1  - Author Name, Author2 Name2\nT1  - Title\nJO  - Journal Title\nRP  - Reprint Status, Date\nPY  - Date of Publication\nN1  - Volume ID: Volume ID\nN1  - Page(s): Page(s)\nAV  - Address/Availability\nUR  - Location/URL\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\nTY  - JOUR\nN1  - Record Number: 320\nA1  - Author Name, Author2 Name2\nT1  - Article Title\nN1  - Medium Designator: Medium Designator\nN1  - Connective Phrase: Connective Phrase\nJF  - Journal Title\nN1  - Translated Title: Translated Title\nRP  - Reprint Status, Date\nPY  - Date of Publication\nVL  - Volume ID\nIS  - Issue ID\nSP  - Page(s)\nN1  - Language: Language\nN1  - Connective Phrase: Connective Phrase\nAV  - Address/Availability\nUR  - Location/URL\nSN  - ISSN\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\nTY  - JOUR\nN1  - Record Number: 330\nA1  - Author Name, Author2 Name2\nN1  - Author Role: Author Role\nN1  - Author Affiliation: Author Affiliation\nT1  - Article Title\nN1  - Medium Designator: Medium Designator\nN1  - Connective Phrase: Connective Phrase\nN1  - Author, Monographic: Monographic Author\nN1  - Author Role: Author Role\nJF  - Journal Title\nRP  - Reprint Status, Date\nPY  - Date of Publication\nVL  - Volume ID\nIS  - Issue ID\nSP  - Page(s)\nAV  - Address/Availability\nUR  - Location/URL\nN1  - CODEN: CODEN\nSN  - ISSN\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\nTY  - JOUR\nN1  - Record Number: 340\nA1  - Author Name, Author2 Name2\nT1  - Analytic Title\nJF  - Journal Title\nRP  - Reprint Status, Date\nPY  - Date of Publication\nVL  - Volume ID\nIS  - Issue ID\nSP  - Page(s)\nAV  - Address/Availability\nUR  - Location/URL\nSN  - ISSN\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\nTY  - JFULL\nN1  - Record Number: 350\nN1  - Editor: Editor\nJF  - Journal Title\nRP  - Reprint Status, Date\nN1  - Medium Designator: Medium Designator\nN1  - Edition: Edition\nN1  - Place of Publication: Place of Publication\nN1  - Publisher Name: Publisher Name\nPY  - Date of Publication\nVL  - Volume ID\nIS  - Issue ID\nSP  - Extent of Work\nN1  - Packaging Method: Packaging Method\nN1  - Frequency of Publication: Frequency of Publication\nN1  - Connective Phrase: Connective Phrase\nAV  - Address/Availability\nUR  - Location/URL\nN1  - CODEN: CODEN\nSN  - ISSN\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\nTY  - PCOMM\nN1  - Record Number: 360\nA1  - Author Name, Author2 Name2\nN1  - Author Affiliation: Author Affiliation\nN1  - Medium Designator: Medium Designator\nA2  - Recipient\nRP  - Reprint Status, Date\nN1  - Place of Publication: Place of Publication\nPY  - Date of Letter\nN1  - Extent of Letter: Extent of Letter\nN1  - Packaging Method: Packaging Method\nN1  - Connective Phrase: Connective Phrase\nAV  - Address/Availability\nUR  - Location/URL\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\nTY  - SER\nN1  - Record Number: 370\nA1  - Author Name, Author2 Name2\nN1  - Author Role: Author Role\nT1  - Analytic Title\nN1  - Medium Designator: Medium Designator\nN1  - Connective Phrase: Connective Phrase\nT3  - Collection Title\nRP  - Reprint Status, Date\nPY  - Date of Publication\nSP  - Location of Work\nN1  - Extent of Work: Extent of Work\nN1  - Packaging Method: Packaging Method\nN1  - Document Type: Document Type\nN1  - Connective Phrase: Connective Phrase\nAV  - Address/Availability\nUR  - Location/URL\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\nTY  - MAP\nN1  - Record Number: 380\nT1  - Map Title\nM2  - Map Type\nA1  - Cartographer\nN1  - Cartographer Role: Cartographer Role\nRP  - Reprint Status, Date\nM1  - Area\nN1  - Medium Designator: Medium Designator\nVL  - Edition\nCY  - Place of Publication\nPB  - Publisher Name\nPY  - Date of Publication\nY2  - Date of Copyright\nN1  - Extent of Work: Extent of Work\nN1  - Packaging Method: Packaging Method\nN1  - Size: Size\nN1  - Scale: Scale\nT3  - Series Title\nN1  - Series Volume ID: Series Volume ID\nN1  - Series Issue ID: Series Issue ID\nN1  - Connective Phrase: Connective Phrase\nAV  - Address/Availability\nUR  - Location/URL\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\nTY  - SER\nN1  - Record Number: 390\nA1  - Monographic Author\nN1  - Author Role: Author Role\nT1  - Monographic Title\nRP  - Reprint Status, Date\nVL  - Edition\nCY  - Place of Publication\nPB  - Publisher Name\nPY  - Date of Publication\nAV  - Address/Availability\nUR  - Location/URL\nSN  - ISBN\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\nTY  - MUSIC\nN1  - Record Number: 400\nA1  - Composer\nN1  - Composer Role: Composer Role\nT1  - Analytic Title\nN1  - Medium Designator: Medium Designator\nN1  - Connective Phrase: Connective Phrase\nA2  - Editor/Compiler\nN1  - Editor/Compiler Role: Editor/Compiler Role\nN1  - Title, Monographic: Monographic Title\nRP  - Reprint Status, Date\nN1  - Medium Designator: Medium Designator\nVL  - Edition\nN1  - Author, Subsidiary: Subsidiary Author\nN1  - Author Role: Author Role\nCY  - Place of Publication\nPB  - Publisher Name\nPY  - Date of Publication\nN1  - Copyright Date: Copyright Date\nIS  - Volume ID\nN1  - Report Identification: Report ID\nN1  - Plate Number: Plate Number\nN1  - Location in Work: Location in Work\nN1  - Extent of Work: Extent of Work\nN1  - Packaging Method: Packaging Method\nA3  - Series Editor\nN1  - Series Editor Role: Series Editor Role\nT3  - Series Title\nN1  - Series Volume ID: Series Volume ID\nN1  - Series Issue ID: Series Issue ID\nN1  - Connective Phrase: Connective Phrase\nAV  - Address/Availability\nUR  - Location/URL\nSN  - ISBN\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\nTY  - MPCT\nT1  - Analytic Title\nN1  - Medium Designator: Medium Designator\nN1  - Producer: Producer\nN1  - Producer Role: Producer Role\nRP  - Reprint Status, Date\nA1  - Director\nN1  - Director Role: Director Role\nCY  - Place of Publication\nU5  - Distributor\nPY  - Date of Publication\nM2  - Timing\nN1  - Packaging Method: Packaging Method\nN1  - Size: Size\nT3  - Series Title\nN1  - Connective Phrase: Connective Phrase\nAV  - Address/Availability\nUR  - Location/URL\nSN  - ISBN\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\nTY  - NEWS\nN1  - Record Number: 420\nA1  - Author Name, Author2 Name2\nN1  - Author Role: Author Role\nT1  - Analytic Title\nN1  - Medium Designator: Medium Designator\nN1  - Connective Phrase: Connective Phrase\nJO  - Newspaper Name\nRP  - Reprint Status, Date\nCY  - Place of Publication\nPB  - Publisher Name\nPY  - Date of Publication\nM2  - Section\nN1  - Column Number: Column Number\nSP  - Page(s)\nAV  - Address/Availability\nUR  - Location/URL\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\n\nTY  - PAT\nN1  - Record Number: 430\nA1  - Inventor Name\nN1  - Address: Address\nT1  - Patent Title\nA2  - Assignee\nN1  - Title, Short Form: Title, Short Form\nN1  - Title, Long Form: Title, Long Form\nN1  - Abstract Journal Date: Abstract Journal Date\nCY  - Country\nM3  - Document Type\nIS  - Patent Number\nN1  - Abstract Journal Title: Abstract Journal Title\nPY  - Date of Patent Issue\nVL  - Application No./Date\nN1  - Abstract Journal Volume: Abstract Journal Volume\nN1  - Abstract Journal Issue: Abstract Journal Issue\nSP  - Abstract Journal Page(s)\nN1  - Extent of Work: Extent of Work\nN1  - Packaging Method: Packaging Method\nN1  - Language: Language\nN1  - Connective Phrase: Connective Phrase\nAV  - Address/Availability\nUR  - Location/URL\nM2  - Class Code, National\nM1  - Class Code, International\nN1  - Related Document No.: Related Document Number\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Registry Number: Registry Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\n\nTY  - RPRT\nN1  - Record Number: 440\nA1  - Author Name, Author2 Name2\nN1  - Author Role, Analytic: Author Role\nN1  - Author Affiliation: Author Affiliation\nN1  - Section Title: Section Title\nN1  - Medium Designator: Medium Designator\nN1  - Connective Phrase: Connective Phrase\nA2  - Monographic Author\nN1  - Author Role: Author Role\nT1  - Report Title\nRP  - Reprint Status, Date\nN1  - Edition: Edition\nN1  - Author, Subsidiary: Subsidiary Author\nN1  - Author Role: Author Role\nCY  - Place of Publication\nPB  - Publisher Name\nPY  - Date of Publication\nVL  - Report ID\nSP  - Extent of Work\nN1  - Packaging Method: Packaging Method\nT3  - Series Title\nN1  - Series Volume ID: Series Volume ID\nN1  - Series Issue ID: Series Issue ID\nN1  - Connective Phrase: Connective Phrase\nAV  - Address/Availability\nUR  - Location/URL\nN1  - CODEN: CODEN\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\n\nTY  - SOUND\nN1  - Record Number: 450\nA1  - Composer\nN1  - Composer Role: Composer Role\nT1  - Analytic Title\nN1  - Medium Designator: Medium Designator\nN1  - Connective Phrase: Connective Phrase\nN1  - Editor/Compiler: Editor/Compiler\nN1  - Editor/Compiler Role: Editor/Compiler Role\nN1  - Recording Title: Recording Title\nRP  - Reprint Status, Date\nN1  - Edition: Edition\nA2  - Performer\nN1  - Performer Role: Performer Role\nCY  - Place of Publication\nPB  - Publisher Name\nPY  - Date of Publication\nN1  - Copyright Date: Date of Copyright\nN1  - Acquisition Number: Acquisition Number\nN1  - Matrix Number: Matrix Number\nN1  - Extent of Work: Extent of Work\nN1  - Packaging Method: Packaging Method\nN1  - Size: Size\nN1  - Reproduction Ratio: Reproduction Ratio\nT3  - Series Title\nAV  - Address/Availability\nUR  - Location/URL\nSN  - ISBN\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\n\nTY  - STAT\nN1  - Record Number: 460\nA1  - Author Name, Author2 Name2\nT1  - Statute Title\nRP  - Reprint Status, Date\nCY  - Code\nPY  - Date of Publication\nY2  - Date\nVL  - Title/Code Number\nSP  - Section(s)\nT3  - History\nAV  - Address/Availability\nUR  - Location/URL\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\nTY  - CTLG\nN1  - Record Number: 470\nA1  - Author Name, Author2 Name2\nT1  - Catalog Title\nN1  - Medium Designator: Medium Designator\nRP  - Reprint Status, Date\nVL  - Edition\nCY  - Place of Publication\nPB  - Publisher Name\nPY  - Date of Publication\nIS  - Catalog Number\nN1  - Issue Identification: Issue ID\nN1  - Extent of Work: Extent of Work\nN1  - Packaging Method: Packaging Method\nN1  - Connective Phrase: Connective Phrase\nAV  - Address/Availability\nUR  - Location/URL\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\n\nTY  - UNBILL\nN1  - Record Number: 480\nA1  - Author Name, Author2 Name2\nT1  - Act Title\nRP  - Reprint Status, Date\nCY  - Code\nPY  - Date of Code\nY2  - Date\nVL  - Bill/Res Number\nT3  - History\nAV  - Address/Availability\nUR  - Location/URL\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\nTY  - UNPB\nN1  - Record Number: 490\nA1  - Author Name, Author2 Name2\nT1  - Title\nA2  - Editor(s)\nRP  - Reprint Status, Date\nPY  - Date of Publication\nN1  - Date of Copyright: Date of Copyright\nAV  - Address/Availability\nUR  - Location/URL\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\nTY  - VIDEO\nN1  - Record Number: 500\nA1  - Author Name, Author2 Name2\nT1  - Analytic Title\nN1  - Medium Designator: Medium Designator\nN1  - Producer: Producer\nN1  - Producer Role: Producer Role\nRP  - Reprint Status, Date\nN1  - Director: Director\nN1  - Director Role: Director Role\nCY  - Place of Publication\nPB  - Distributor\nPY  - Date of Publication\nM2  - Extent of Work\nN1  - Packaging Method: Packaging Method\nN1  - Size: Size\nT3  - Series Title\nN1  - Connective Phrase: Connective Phrase\nAV  - Address/Availability\nUR  - Location/URL\nSN  - ISBN\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\n\nTY  - ELEC\nN1  - Record Number: 510\nA1  - Author Name, Author2 Name2\nN1  - Author Role: Author Role\nN1  - Author Affiliation: Author Affiliation\nT1  - Title\nRP  - Reprint Status, Date\nPY  - Date of Publication\nY2  - Date of Access\nAV  - Address/Availability\nUR  - Location/URL\nN1  - Notes: Notes\nN2  - Abstract\nN1  - Call Number: Call Number\nKW  - Keywords1, Keywords2, Keywords3\nKW  - Keywords4\nER  - \n\n
-"""
 
-test_input_6 = """TY  - JOUR\nT1  - From Basic to Applied Research to Improve Outcomes for Individuals Who Require Augmentative and Alternative Communication: \u2028Potential Contributions of Eye Tracking Research Methods\nAU  - Light, Janice\nAU  - McNaughton, David\nY1  - 2014/06/01\nPY  - 2014\nDA  - 2014/06/01\nN1  - doi: 10.3109/07434618.2014.906498\nDO  - 10.3109/07434618.2014.906498\nT2  - Augmentative and Alternative Communication\nJF  - Augmentative and Alternative Communication\nJO  - Augment Altern Commun\nSP  - 99\nEP  - 105\nVL  - 30\nIS  - 2\nPB  - Informa Allied Health\nSN  - 0743-4618\nM3  - doi: 10.3109/07434618.2014.906498\nUR  - http://dx.doi.org/10.3109/07434618.2014.906498\nY2  - 2014/12/17\nER  - """
+def ris_record_read(ris_file, encoding="utf-8"):
+    """
+    params:
+    ris_file, str or file object. A path, a text stream or a binary stream.
+    encoding, str. Used for paths and binary streams.
 
-test_input_7 = """TY  - BOOK\nSN  - 9783642002304\nAU  - Depenheuer, Otto\nT1  - Eigentumsverfassung und Finanzkrise\nT2  - Bibliothek des Eigentums\nPY  - 2009\nCY  - Berlin, Heidelberg\nPB  - Springer Berlin Heidelberg\nKW  - Finanzkrise / Eigentum / Haftung / Ordnungspolitik / Aufsatzsammlung / Online-Publikation\nKW  - Constitutional law\nKW  - Law\nUR  - http://dx.doi.org/10.1007/978-3-642-00230-4\nL1  - doi:10.1007/978-3-642-00230-4\nVL  - 7\nAB  - In dem Buch befinden sich einzelne Beiträge zu ...\nLA  - ger\nH1  - UB Mannheim\nH2  - 300 QN 100 D419\nH1  - UB Leipzig\nH2  - PL 415 D419\nTS  - BibTeX\nDO  - 10.1007/978-3-642-00230-4\nER  -\n\n"""
+    yield: ris_text, str.
 
+    Scans the export line by line and yields each record, from its TY line
+    to its ER line, as soon as the ER line is read. Only the current record
+    is kept in memory. Both "TY  - " and the single space "TY - " variants
+    are accepted. A record that is not closed by an ER line at the end of
+    the file is yielded as is.
+    """
+    #
+    if isinstance(ris_file, str):
+        with open(ris_file, "r", encoding=encoding, newline="") as ris_stream:
+            yield from ris_record_read(ris_stream)
+        return
+    #
+    if isinstance(ris_file, (io.RawIOBase, io.BufferedIOBase)):
+        ris_stream = io.TextIOWrapper(ris_file, encoding=encoding, newline="")
+        try:
+            yield from ris_record_read(ris_stream)
+        finally:
+            # the stream belongs to the caller, the wrapper must not close it
+            ris_stream.detach()
+        return
+    #
+    ris_record_lines = None
+    for ris_line in ris_file:
+        ris_line = ris_line.rstrip("\r\n").lstrip("\ufeff")
+        if ris_record_lines is None:
+            if ris_record_begin_re.match(ris_line) is not None:
+                ris_record_lines = [ris_line]
+            continue
+        ris_record_lines.append(ris_line)
+        if ris_record_end_re.match(ris_line) is not None:
+            yield "\n".join(ris_record_lines)
+            ris_record_lines = None
+    #
+    if ris_record_lines is not None:
+        yield "\n".join(ris_record_lines)
 
 
 def ris_text_read(textChunk):
@@ -443,68 +122,138 @@ def ris_text_read(textChunk):
     params: textChunk, str.
     return: ris_text_list, []
 
-    Recipe adapted from the code published by pyInTheSky on 2011-09-26 taken from SO:
-    http://stackoverflow.com/questions/7559397/python-read-file-from-and-to-specific-lines-of-text
+    Kept for callers that already hold the whole export in a string, see
+    ris_record_read for reading large exports record by record.
     """
     #
-    line_begin = "TY"
-    line_end = "ER"
-    #
-    ris_text_list = re.findall('(TY  -.*?\nER )', textChunk, re.S)
+    ris_text_list = list(ris_record_read(io.StringIO(textChunk, newline="")))
     #
     return ris_text_list
 
 
-def ris_text_parse(ris_text):
+ris_record_begin_bytes_re = re.compile(rb"^(?:\xef\xbb\xbf)?TY {1,2}-", re.M)
+ris_record_end_bytes_re = re.compile(rb"^ER {1,2}-[^\n]*", re.M)
+
+
+def ris_record_offsets(ris_buffer):
     """
-    params: ris_text,str.
-    return: ris_text_line_list, {}
+    params: ris_buffer, bytes-like, e.g. an mmap of the export.
+    yield: (offset, length), (int, int). The bytes of each record.
+
+    Finds the same records as ris_record_read, from the TY line to the end
+    of the ER line, without decoding or copying the buffer. Lines must end
+    with LF or CRLF. Decode the records with ris_record_decode.
     """
     #
-    ris_text_lines = ris_text.splitlines()
+    buffer_length = len(ris_buffer)
+    pos = 0
+    while pos < buffer_length:
+        ris_begin_match = ris_record_begin_bytes_re.search(ris_buffer, pos)
+        if ris_begin_match is None:
+            return
+        ris_end_match = ris_record_end_bytes_re.search(ris_buffer, ris_begin_match.end())
+        pos = ris_end_match.end() if ris_end_match is not None else buffer_length
+        yield (ris_begin_match.start(), pos - ris_begin_match.start())
+
+
+def ris_record_decode(ris_bytes, encoding="utf-8"):
+    """
+    params:
+    ris_bytes, bytes-like. One record, see ris_record_offsets.
+    encoding, str.
+
+    return: ris_text, str. As given by ris_record_read.
+    """
     #
-    # SP  - 79, EP  - 96, SN  - 0392-4866
-    # ["SP  "," 79",], ["EP  "," 96"], ["SN  ","0392","4866"] !!
+    ris_text = str(ris_bytes, encoding).lstrip("\ufeff")
+    if ris_text.endswith("\n"):
+        # a record without ER line runs to the end of the buffer
+        ris_text = ris_text[:-1]
+    if "\r" in ris_text:
+        ris_text = "\n".join(ris_line.rstrip("\r") for ris_line in ris_text.split("\n"))
     #
-    changed_ris_text_lines = []
-    for ris_text_line in ris_text_lines:
-        try:
-            re.match("^([A-Z1-9]+)", ris_text_line)
-            #
-            if re.match("^([A-Z1-9]+)", ris_text_line) is None:
-                raise ValueError("The line doesn't start with a ris element. Make sure ris file has been divided: 'Ris_Tag CorrespondingValue lineDelimiter' structure")
-        except ValueError as ris_text_line_split_fail:
-            #
-            print(ris_text_line_split_fail)
-            print("Trying a hack that might or might not work. In any case you should, see the original line. I will give its index but it will not be available after our method, apply the index number to the original file after you have try to split it with .split('\\n') method.")
-            print("Index no:\n")
-            print(str(ris_text_lines.index(ris_text_line)))
-            index_ris_text_line = ris_text_lines.index(ris_text_line)
-            ris_text_lines[index_ris_text_line-1] = ris_text_lines[index_ris_text_line-1] + ris_text_line
-            ris_text_lines.remove(ris_text_line)
-        else:
-            changed_ris_text_lines.append(ris_text_line)
-            pass
+    return ris_text
+
+
+ris_tag_re = re.compile("([A-Z][A-Z0-9]) {1,2}-(.*)")
+ris_list_tags = ("L1", "L2", "L4")
+
+
+def ris_line_tokenize(ris_text, diagnostics=None):
+    """
+    params:
+    ris_text, str.
+    diagnostics, [] or None. Warnings are appended to it as dicts.
+
+    yield: (risTag, value), (str, str)
+
+    Lines that do not start with a ris tag are continuations of the previous
+    value. Attachment lists (L1, L2, L4) keep one path per line, the other
+    values are joined with a space. The ER line is not yielded.
+    """
     #
-    ris_lines_split = [ris_line.split("-") for ris_line in changed_ris_text_lines]
-    ris_text_line_list = []
+    ris_tag = None
+    ris_value_parts = None
+    for line_no, ris_line in enumerate(ris_text.split("\n")):
+        ris_tag_match = ris_tag_re.match(ris_line)
+        if ris_tag_match is not None:
+            if ris_tag is not None:
+                yield (ris_tag, ris_value_join(ris_tag, ris_value_parts))
+            ris_tag = ris_tag_match.group(1)
+            ris_value_parts = [ris_tag_match.group(2).strip()]
+            if ris_tag == "ER":
+                ris_tag = None
+            continue
+        #
+        ris_line = ris_line.strip()
+        if len(ris_line) == 0:
+            continue
+        if diagnostics is not None:
+            diagnostics.append({
+                "line": line_no,
+                "tag": ris_tag,
+                "message": "continuation" if ris_tag is not None else "orphan line dropped",
+                "text": ris_line
+            })
+        if ris_tag is not None:
+            ris_value_parts.append(ris_line)
     #
-    for ris_line_list in ris_lines_split:
-        if len(ris_line_list) == 2:
-            # ["EP  "," 96"]
-            #
-            ris_line = [ris_element.strip() for ris_element in ris_line_list]
-            if ris_line[0] == "ER":
-                ris_lines_split.remove(ris_line_list)
-                continue
-            ris_text_line_list.append(ris_line)
-            #
-        elif len(ris_line_list) > 2:
-            # ["SN  ","0392","4866"]
-            #
-            ris_line = [ris_line_list[0].strip(), ris_line_list[1]+ "-".join(ris_line_list[1:])]
-            ris_text_line_list.append(ris_line)
-            #
+    if ris_tag is not None:
+        yield (ris_tag, ris_value_join(ris_tag, ris_value_parts))
+
+
+def ris_value_join(ris_tag, ris_value_parts):
+    """
+    params:
+    ris_tag, str.
+    ris_value_parts, [str, ...]
+
+    return: ris_value, str.
+    """
+    #
+    if len(ris_value_parts) == 1:
+        return ris_value_parts[0]
+    elif ris_tag in ris_list_tags:
+        return "\n".join(ris_value_parts)
+    #
+    return " ".join(ris_value_parts)
+
+
+def ris_text_parse(ris_text, diagnostics=None):
+    """
+    params:
+    ris_text, str.
+    diagnostics, [] or None, see ris_line_tokenize.
+
+    return: ris_text_line_list, [[],[], ...]
+    """
+    #
+    # SP  - 79, EP  - 96, SN  - 0392-4866
+    # ["SP","79"], ["EP","96"], ["SN","0392-4866"]
+    #
+    ris_text_line_list = [
+        [ris_tag, ris_value] for ris_tag, ris_value in ris_line_tokenize(ris_text, diagnostics)
+    ]
     #
     return ris_text_line_list
 
@@ -870,7 +619,7 @@ def ris_fieldMap(ris_text_line_parse):
     return ris_line_list
 
 
-def ris_p_dict_map(ris_text, ris_types, ris_Indep_fields, ris_Dep_fields):
+def ris_p_dict_map_staged(ris_text, ris_types, ris_Indep_fields, ris_Dep_fields):
     """
     params:
     ris_text, str
@@ -880,6 +629,9 @@ def ris_p_dict_map(ris_text, ris_types, ris_Indep_fields, ris_Dep_fields):
 
     return:
     ris_text_p_dict, dict
+
+    Runs every stage separately, resolving the dependent fields line by
+    line. ris_p_dict_map gives the same output from a compiled table.
     """
     #
     ris_parsing_text = ris_text_parse(ris_text)
@@ -891,6 +643,675 @@ def ris_p_dict_map(ris_text, ris_types, ris_Indep_fields, ris_Dep_fields):
     return ris_text_p_dict
 
 
+# Compiled field table --------------------------------------------
+
+ris_drop_field = "__drop"
+ris_default_itemType = "document"
+# (id, id, id) of the three maps => (ris_types, ris_Indep_fields, ris_Dep_fields, ris_field_table)
+# the maps are kept so that their ids are not reused while they are cached
+ris_field_tables = {}
+ris_field_table_cache_size = 8
+
+
+def ris_itemTypes_get(ris_types, ris_Dep_fields):
+    """
+    params:
+    ris_types, dict
+    ris_Dep_fields, dict
+
+    return: itemType_list, [str, ...]
+    """
+    #
+    itemType_set = set(ris_types.values())
+    for dependent_field in ris_Dep_fields.values():
+        if isinstance(dependent_field, dict):
+            for itemType_list in dependent_field.values():
+                if isinstance(itemType_list, list):
+                    itemType_set.update(itemType_list)
+    #
+    return sorted(itemType_set)
+
+
+def ris_DependentField_resolve(risTag, itemType_value, ris_Dep_fields):
+    """
+    params:
+    risTag, str.
+    itemType_value, str.
+    ris_Dep_fields, dict
+
+    return: zoteroField, str.
+
+    Resolves a tag the way risDependentField_map does. Tags it can not
+    resolve give ris_drop_field.
+    """
+    #
+    dependent_field = ris_Dep_fields[risTag]
+    if risTag == "ID":
+        return ris_drop_field
+    elif isinstance(dependent_field, str) and dependent_field not in ris_Dep_fields:
+        # "TA": "unsupported/Translated Author", "AV": "archiveLocation"
+        return dependent_field
+    #
+    fieldsTuple = ris_DependentField_parse({risTag: dependent_field}, ris_Dep_fields)
+    if fieldsTuple is None:
+        return ris_drop_field
+    fieldValue_dict = ris_DependentField_itemType_get(fieldsTuple, itemType_value, ris_Dep_fields)
+    zoteroField_list = [
+        zoteroField for zoteroField in fieldValue_dict.values() if isinstance(zoteroField, str)
+    ]
+    if len(zoteroField_list) == 0:
+        return ris_drop_field
+    #
+    return zoteroField_list[-1]
+
+
+def ris_field_table_compile(ris_types, ris_Indep_fields, ris_Dep_fields):
+    """
+    params:
+    ris_types, dict
+    ris_Indep_fields, dict
+    ris_Dep_fields, dict
+
+    return: ris_field_table, {(risTag, itemType): (zoteroField, independent)}
+
+    Flattens the three maps once so that mapping a line is a single dict
+    lookup. independent is True for the tags of ris_Indep_fields, which
+    the staged pipeline outputs as {zoteroField: value} instead of
+    [zoteroField, value]. zoteroField is ris_drop_field for lines that are
+    dropped.
+    """
+    #
+    itemType_list = ris_itemTypes_get(ris_types, ris_Dep_fields)
+    ris_field_table = {}
+    for itemType_value in itemType_list:
+        for risTag in ris_Dep_fields.keys():
+            ris_field_table[(risTag, itemType_value)] = (
+                ris_DependentField_resolve(risTag, itemType_value, ris_Dep_fields), False
+            )
+        for risTag, zoteroField in ris_Indep_fields.items():
+            ris_field_table[(risTag, itemType_value)] = (zoteroField.strip(), True)
+    #
+    return ris_field_table
+
+
+def ris_field_table_get(ris_types, ris_Indep_fields, ris_Dep_fields):
+    """
+    params:
+    ris_types, dict
+    ris_Indep_fields, dict
+    ris_Dep_fields, dict
+
+    return: ris_field_table, {}
+
+    Compiles the table on first use and keeps it for the same three map
+    objects, the maps should not be changed in place afterwards. At most
+    ris_field_table_cache_size tables are kept, the least recently used
+    one is dropped, with its item schemas.
+    """
+    #
+    table_key = (id(ris_types), id(ris_Indep_fields), id(ris_Dep_fields))
+    table_entry = ris_field_tables.pop(table_key, None)
+    if table_entry is None:
+        if len(ris_field_tables) >= ris_field_table_cache_size:
+            evicted_key = next(iter(ris_field_tables))
+            evicted_table = ris_field_tables.pop(evicted_key)[3]
+            for schema_key in [schema_key for schema_key in ris_item_schemas if schema_key[0] == id(evicted_table)]:
+                del ris_item_schemas[schema_key]
+        table_entry = (
+            ris_types, ris_Indep_fields, ris_Dep_fields,
+            ris_field_table_compile(ris_types, ris_Indep_fields, ris_Dep_fields)
+        )
+    ris_field_tables[table_key] = table_entry
+    #
+    return table_entry[3]
+
+
+def ris_compiled_map(ris_text_line_list, ris_types, ris_field_table, diagnostics=None):
+    """
+    params:
+    ris_text_line_list, [[],[],[], ...] or [(),(), ...]
+    ris_types, dict
+    ris_field_table, {}, see ris_field_table_compile
+    diagnostics, [] or None
+
+    return: ris_line_list, [{},[],{},[], ...]
+    """
+    #
+    itemType_value = None
+    for risTag, ris_value in ris_text_line_list:
+        if risTag == "TY":
+            itemType_value = ris_types.get(ris_value)
+            break
+    if itemType_value is None:
+        if diagnostics is not None:
+            diagnostics.append({"tag": "TY", "message": "unknown item type", "text": ris_text_line_list[0][1] if ris_text_line_list else ""})
+        itemType_value = ris_default_itemType
+    #
+    ris_line_list = []
+    for risTag, ris_value in ris_text_line_list:
+        if risTag == "TY":
+            ris_line_list.append({"itemType": itemType_value})
+            continue
+        zoteroField_tuple = ris_field_table.get((risTag, itemType_value))
+        if zoteroField_tuple is None:
+            if diagnostics is not None:
+                diagnostics.append({"tag": risTag, "message": "unknown tag dropped", "text": ris_value})
+            continue
+        zoteroField, independent = zoteroField_tuple
+        if zoteroField == ris_drop_field:
+            continue
+        elif independent:
+            ris_line_list.append({zoteroField: ris_value})
+        else:
+            ris_line_list.append([zoteroField, ris_value])
+    #
+    return ris_line_list
+
+
+class RisRecord:
+    """
+    One record between the stages, as parallel lists.
+
+    fields holds the ris tags until ris_record_map replaces them in place
+    with the Zotero fields, independent flags the fields of field_map.
+    The slots keep a record to four references, instead of a dict or a
+    list per line.
+    """
+
+    __slots__ = ("itemType", "fields", "values", "independent")
+
+    def __init__(self):
+        self.itemType = None
+        self.fields = []
+        self.values = []
+        self.independent = bytearray()
+
+    def __len__(self):
+        return len(self.fields)
+
+
+def ris_record_parse(ris_text, diagnostics=None):
+    """
+    params:
+    ris_text, str.
+    diagnostics, [] or None, see ris_line_tokenize.
+
+    return: ris_record, RisRecord, with the ris tags as fields.
+    """
+    #
+    ris_record = RisRecord()
+    fields = ris_record.fields
+    values = ris_record.values
+    for ris_tag, ris_value in ris_line_tokenize(ris_text, diagnostics):
+        fields.append(ris_tag)
+        values.append(ris_value)
+    ris_record.independent = bytearray(len(fields))
+    #
+    return ris_record
+
+
+def ris_record_map(ris_record, ris_types, ris_field_table, diagnostics=None):
+    """
+    params:
+    ris_record, RisRecord, from ris_record_parse.
+    ris_types, dict
+    ris_field_table, {}, see ris_field_table_compile
+    diagnostics, [] or None
+
+    return: ris_record, the same record, mapped in place.
+
+    Same mapping as ris_compiled_map. Dropped lines are compacted out of
+    the lists, nothing is copied. The TY line becomes the independent
+    field "itemType".
+    """
+    #
+    fields = ris_record.fields
+    values = ris_record.values
+    independent = ris_record.independent
+    itemType_value = None
+    if "TY" in fields:
+        itemType_value = ris_types.get(values[fields.index("TY")])
+    if itemType_value is None:
+        if diagnostics is not None:
+            diagnostics.append({"tag": "TY", "message": "unknown item type", "text": values[0] if values else ""})
+        itemType_value = ris_default_itemType
+    ris_record.itemType = itemType_value
+    #
+    write_index = 0
+    ris_field_get = ris_field_table.get
+    for read_index, risTag in enumerate(fields):
+        if risTag == "TY":
+            zoteroField, is_independent = "itemType", True
+            values[read_index] = itemType_value
+        else:
+            zoteroField_tuple = ris_field_get((risTag, itemType_value))
+            if zoteroField_tuple is None:
+                if diagnostics is not None:
+                    diagnostics.append({"tag": risTag, "message": "unknown tag dropped", "text": values[read_index]})
+                continue
+            zoteroField, is_independent = zoteroField_tuple
+            if zoteroField == ris_drop_field:
+                continue
+        fields[write_index] = zoteroField
+        values[write_index] = values[read_index]
+        independent[write_index] = is_independent
+        write_index += 1
+    del fields[write_index:]
+    del values[write_index:]
+    del independent[write_index:]
+    #
+    return ris_record
+
+
+def ris_record_lines(ris_record):
+    """
+    params: ris_record, RisRecord, mapped.
+    return: ris_line_list, [{},[],{},[], ...], the output of ris_compiled_map.
+    """
+    #
+    ris_line_list = [
+        {zoteroField: ris_value} if is_independent else [zoteroField, ris_value]
+        for zoteroField, ris_value, is_independent in zip(ris_record.fields, ris_record.values, ris_record.independent)
+    ]
+    #
+    return ris_line_list
+
+
+ris_identity_tags = ("DO", "ID", "SN")
+# an ISSN or ISBN is shared by a whole journal or book, SN identities are
+# qualified with these tags
+ris_identity_qualifier_tags = ("VL", "IS", "SP", "TI", "T1")
+
+
+def ris_record_identity(ris_text):
+    """
+    params: ris_text, str.
+    return: identity, str or None.
+
+    The first of the DO, ID and SN tags the record has, as
+    "DO:10.1111/..." (in lower case), "ID:3" or, with the volume, issue,
+    start page and title, "SN:0392-4866|12|3|45|a title". Identities can
+    still repeat, ZoteroManifest.manifest_diff_iter reports the ones that
+    do and numbers their records, see manifest_identity_fallback.
+    """
+    #
+    identity_values = {}
+    for ris_tag, ris_value in ris_line_tokenize(ris_text):
+        if (ris_tag in ris_identity_tags or ris_tag in ris_identity_qualifier_tags) \
+                and ris_tag not in identity_values and len(ris_value) > 0:
+            identity_values[ris_tag] = ris_value
+    for ris_tag in ris_identity_tags:
+        if ris_tag not in identity_values:
+            continue
+        ris_value = identity_values[ris_tag]
+        if ris_tag == "DO":
+            return "DO:" + ris_value.lower()
+        elif ris_tag == "SN":
+            qualifier_values = [
+                " ".join(identity_values.get(qualifier_tag, "").lower().split())
+                for qualifier_tag in ris_identity_qualifier_tags
+            ]
+            return "|".join(["SN:" + ris_value] + qualifier_values)
+        return ris_tag + ":" + ris_value
+    #
+    return None
+
+
+# raised whenever records convert differently with the same tables, it is
+# part of the ZoteroCache keys. 2: an EP line before the SP line no longer
+# drops the start page.
+ris_converter_version = 2
+
+
+def ris_tables_version(ris_types=None, ris_Indep_fields=None, ris_Dep_fields=None):
+    """
+    params:
+    ris_types, dict or None for type_map
+    ris_Indep_fields, dict or None for field_map
+    ris_Dep_fields, dict or None for dependent_fields
+
+    return: tables_version, str. Changes whenever one of the maps changes.
+    """
+    #
+    default_tables = ris_tables_load()
+    ris_tables = [
+        default_tables[0] if ris_types is None else ris_types,
+        default_tables[1] if ris_Indep_fields is None else ris_Indep_fields,
+        default_tables[2] if ris_Dep_fields is None else ris_Dep_fields
+    ]
+    tables_version = "ris-" + hashlib.sha256(json.dumps(ris_tables, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+    #
+    return tables_version
+
+
+def ris_p_dict_map(ris_text, ris_types, ris_Indep_fields, ris_Dep_fields, diagnostics=None):
+    """
+    params:
+    ris_text, str
+    ris_types, dict
+    ris_Indep_fields, dict
+    ris_Dep_fields, dict
+    diagnostics, [] or None
+
+    return:
+    ris_text_p_dict, dict
+
+    With ZoteroMetrics enabled, the parse, map and lines stages are timed.
+    Type mapping and dependent field resolution are both done by the
+    map stage, from the compiled field table.
+
+    Unlike ris_p_dict_map_staged, the line that follows a dropped ID line,
+    or a dependent field with no value for the item type, is mapped.
+    risDependentField_map removes those lines from the list it iterates
+    over, which skips the next line.
+    """
+    #
+    ris_field_table = ris_field_table_get(ris_types, ris_Indep_fields, ris_Dep_fields)
+    if ZoteroMetrics.metrics_state is None:
+        ris_record = ris_record_map(ris_record_parse(ris_text, diagnostics), ris_types, ris_field_table, diagnostics)
+        return ris_record_lines(ris_record)
+    #
+    metrics_token = ZoteroMetrics.metrics_stage_start()
+    ris_record = ris_record_parse(ris_text, diagnostics)
+    metrics_token = ZoteroMetrics.metrics_stage_end("ris_record_parse", metrics_token, 1, len(ris_record))
+    ris_record = ris_record_map(ris_record, ris_types, ris_field_table, diagnostics)
+    metrics_token = ZoteroMetrics.metrics_stage_end("ris_record_map", metrics_token, 1, len(ris_record))
+    ris_text_p_dict = ris_record_lines(ris_record)
+    ZoteroMetrics.metrics_stage_end("ris_record_lines", metrics_token, 1, len(ris_text_p_dict))
+    #
+    return ris_text_p_dict
+
+
+class RisVisitedLines(list):
+    """
+    A line list that keeps the lines its last loop got to, as
+    risDependentField_map iterates over the list it removes lines from.
+    """
+
+    def __init__(self, ris_line_list):
+        super().__init__(ris_line_list)
+        self.visited = []
+
+    def __iter__(self):
+        # same indexing as the list iterator
+        self.visited = []
+        line_index = 0
+        while line_index < len(self):
+            self.visited.append(self[line_index])
+            yield self[line_index]
+            line_index += 1
+
+
+def ris_field_table_verify(ris_text_list, ris_types, ris_Indep_fields, ris_Dep_fields):
+    """
+    params:
+    ris_text_list, [str, ...], a golden corpus of records.
+    ris_types, dict
+    ris_Indep_fields, dict
+    ris_Dep_fields, dict
+
+    return: (mismatch_list, skipped_list), ([int, ...], [int, ...]), indexes
+    of the differing records and of the records that were not compared.
+
+    Records the staged pipeline fails on can not be compared and are
+    skipped, it raises on the dependent fields that are a plain string,
+    like "TA": "unsupported/Translated Author" or "AV": "archiveLocation".
+    Lines it maps to an empty field, like [[], value], are dropped by the
+    compiled table and are left out of the comparison. The lines the
+    staged pipeline skips, see ris_p_dict_map, are left out of the
+    compiled record.
+    """
+    #
+    ris_field_table = ris_field_table_get(ris_types, ris_Indep_fields, ris_Dep_fields)
+    mismatch_list = []
+    skipped_list = []
+    for ris_index, ris_text in enumerate(ris_text_list):
+        ris_text_line_list = ris_text_parse(ris_text)
+        try:
+            ris_get_types = risType_map(ris_text_line_list, ris_types)
+            ris_get_Indep_fields = RisVisitedLines(risIndependentField_map(ris_get_types, ris_Indep_fields))
+            ris_line_list = list(ris_get_Indep_fields)
+            staged_output = ris_fieldMap(risDependentField_map(ris_get_Indep_fields, ris_Dep_fields))
+        except (IndexError, TypeError, KeyError):
+            skipped_list.append(ris_index)
+            continue
+        staged_output = [
+            ris_line for ris_line in staged_output
+            if not isinstance(ris_line, list) or isinstance(ris_line[0], str)
+        ]
+        visited_ids = set(id(ris_line) for ris_line in ris_get_Indep_fields.visited)
+        ris_record = RisRecord()
+        for ris_text_line, ris_line in zip(ris_text_line_list, ris_line_list):
+            if id(ris_line) in visited_ids:
+                ris_record.fields.append(ris_text_line[0])
+                ris_record.values.append(ris_text_line[1])
+        ris_record.independent = bytearray(len(ris_record.fields))
+        compiled_output = ris_record_lines(ris_record_map(ris_record, ris_types, ris_field_table))
+        if staged_output != compiled_output:
+            mismatch_list.append(ris_index)
+    #
+    return (mismatch_list, skipped_list)
+
+
+# Zotero item assembly --------------------------------------------
+
+ris_item_schemas = {}
+
+
+def ris_item_schema_compile(ris_field_table, itemType_value):
+    """
+    params:
+    ris_field_table, {}, see ris_field_table_compile
+    itemType_value, str.
+
+    return: ris_item_schema, {zoteroField: (action, argument)}
+
+    The action of every Zotero field the table can give for the item type:
+    "creator" with the creator type, "tag", "pages", "note", "attachment",
+    "extra" with a label for the unsupported fields, or "field".
+    """
+    #
+    ris_item_schema = {"itemType": ("field", None)}
+    for (risTag, table_itemType), (zoteroField, independent) in ris_field_table.items():
+        if table_itemType != itemType_value or zoteroField == ris_drop_field:
+            continue
+        if zoteroField.startswith("creators/"):
+            ris_item_schema[zoteroField] = ("creator", zoteroField[len("creators/"):])
+        elif zoteroField.startswith("attachments/"):
+            ris_item_schema[zoteroField] = ("attachment", None)
+        elif zoteroField.startswith("unsupported/"):
+            ris_item_schema[zoteroField] = ("extra", zoteroField[len("unsupported/"):])
+        elif zoteroField == "tags":
+            ris_item_schema[zoteroField] = ("tag", None)
+        elif zoteroField == "pages":
+            ris_item_schema[zoteroField] = ("pages", None)
+        elif zoteroField == "notes":
+            ris_item_schema[zoteroField] = ("note", None)
+        elif zoteroField == "extra":
+            ris_item_schema[zoteroField] = ("extra", None)
+        else:
+            ris_item_schema[zoteroField] = ("field", None)
+    #
+    return ris_item_schema
+
+
+def ris_item_schema_get(ris_field_table, itemType_value):
+    """
+    params:
+    ris_field_table, {}
+    itemType_value, str.
+
+    return: ris_item_schema, {}, compiled on first use.
+    """
+    #
+    # ris_field_table_get drops the schemas of the tables it drops
+    schema_key = (id(ris_field_table), itemType_value)
+    ris_item_schema = ris_item_schemas.get(schema_key)
+    if ris_item_schema is None:
+        ris_item_schema = ris_item_schema_compile(ris_field_table, itemType_value)
+        ris_item_schemas[schema_key] = ris_item_schema
+    #
+    return ris_item_schema
+
+
+def ris_creator_make(creatorType, ris_value):
+    """
+    params:
+    creatorType, str.
+    ris_value, str. "Last, First" or a single name.
+
+    return: creator, {}
+    """
+    #
+    if "," not in ris_value:
+        return {"creatorType": creatorType, "name": ris_value.strip()}
+    lastName, firstName = ris_value.split(",", 1)
+    #
+    return {"creatorType": creatorType, "lastName": lastName.strip(), "firstName": firstName.strip()}
+
+
+def ris_item_assemble(ris_record, ris_item_schema, diagnostics=None):
+    """
+    params:
+    ris_record, RisRecord, mapped with ris_record_map.
+    ris_item_schema, {}, see ris_item_schema_get
+    diagnostics, [] or None
+
+    return: zotero_item, [zotero_dict, zotero_note_list]
+
+    Builds the item in one pass over the record. creators and tags are
+    collected in order, the first start (SP) and end (EP) pages are merged
+    into "start-end" whatever their order, notes become child notes, attachment paths are kept in
+    lists under their attachments/ field, unsupported fields go to extra.
+    Later values of a field that is already set are dropped.
+    """
+    #
+    zotero_dict = {"itemType": ris_record.itemType, "creators": [], "tags": [], "relations": {}}
+    zotero_note_list = []
+    extra_lines = []
+    # [SP, EP], EP is the independent one
+    page_parts = [None, None]
+    for zoteroField, ris_value, is_independent in zip(ris_record.fields, ris_record.values, ris_record.independent):
+        action, argument = ris_item_schema.get(zoteroField, ("field", None))
+        if action == "creator":
+            zotero_dict["creators"].append(ris_creator_make(argument, ris_value))
+        elif action == "tag":
+            zotero_dict["tags"].append({"tag": ris_value})
+        elif action == "field":
+            if zoteroField not in zotero_dict:
+                zotero_dict[zoteroField] = ris_value
+            elif zotero_dict[zoteroField] != ris_value and diagnostics is not None:
+                diagnostics.append({"field": zoteroField, "message": "repeated field dropped", "text": ris_value})
+        elif action == "pages":
+            page_index = 1 if is_independent else 0
+            if page_parts[page_index] is None:
+                page_parts[page_index] = ris_value
+        elif action == "note":
+            zotero_note_list.append({"itemType": "note", "note": ris_value, "tags": [], "relations": {}})
+        elif action == "attachment":
+            zotero_dict.setdefault(zoteroField, []).extend(
+                ris_path.strip() for ris_path in ris_value.split("\n") if len(ris_path.strip()) > 0
+            )
+        elif action == "extra":
+            extra_lines.append(ris_value if argument is None else argument + ": " + ris_value)
+    if page_parts != [None, None]:
+        zotero_dict["pages"] = "-".join(page_part for page_part in page_parts if page_part is not None)
+    if len(extra_lines) > 0:
+        zotero_dict["extra"] = "\n".join(extra_lines)
+    #
+    return [zotero_dict, zotero_note_list]
+
+
+def ris_item_map(ris_text, ris_types, ris_Indep_fields, ris_Dep_fields, diagnostics=None):
+    """
+    params:
+    ris_text, str
+    ris_types, dict
+    ris_Indep_fields, dict
+    ris_Dep_fields, dict
+    diagnostics, [] or None
+
+    return: zotero_item, [zotero_dict, zotero_note_list], for every item type.
+    """
+    #
+    ris_field_table = ris_field_table_get(ris_types, ris_Indep_fields, ris_Dep_fields)
+    ris_record = ris_record_map(ris_record_parse(ris_text, diagnostics), ris_types, ris_field_table, diagnostics)
+    ris_item_schema = ris_item_schema_get(ris_field_table, ris_record.itemType)
+    zotero_item = ris_item_assemble(ris_record, ris_item_schema, diagnostics)
+    #
+    return zotero_item
+
+
+pf_name_hyphen_initials_re = re.compile(r"[A-Z]\.-[A-Z]")
+pf_name_initials_re = re.compile(r"\w\.-\w\.")
+
+
+def pascal_francis_name_normalise(name_author_brut):
+    """
+    params: name_author_brut, str.
+    return: (firstName, lastName), (str, str)
+    """
+    #
+    name_author_split = name_author_brut.split(",")
+    if len(name_author_split) > 1:
+        return (name_author_split[1].strip(), name_author_split[0].strip())
+    #
+    # For names that are wrongly provided as
+    # J. J.-C GOYON GOYON
+    name_first_name = ""
+    name_last_name = ""
+    for name_split in dict.fromkeys(name_author_brut.split(" ")):
+        if len(name_split) <= 2:
+            if name_split not in name_first_name:
+                name_first_name = name_first_name + " " + name_split
+        elif pf_name_hyphen_initials_re.match(name_split) is not None:
+            # For names like J.-P. Kollerin
+            if name_split not in name_first_name:
+                name_first_name = name_split
+        elif pf_name_initials_re.match(name_split) is None:
+            if name_split not in name_last_name:
+                name_last_name = name_last_name + " " + name_split
+    #
+    return (name_first_name.strip(), name_last_name.strip())
+
+
+pascal_francis_name_cache_size = 4096
+pascal_francis_name_normalise_cached = functools.lru_cache(maxsize=pascal_francis_name_cache_size)(pascal_francis_name_normalise)
+
+
+def pascal_francis_name_cache_resize(maxsize):
+    """
+    params: maxsize, int or None. None for an unbounded cache.
+
+    Replaces the name cache, the counters start again from zero.
+    """
+    #
+    global pascal_francis_name_cache_size, pascal_francis_name_normalise_cached
+    pascal_francis_name_cache_size = maxsize
+    pascal_francis_name_normalise_cached = functools.lru_cache(maxsize=maxsize)(pascal_francis_name_normalise)
+
+
+def pascal_francis_name_cache_stats():
+    """
+    return: cache_stats, {}
+
+    hits, misses, hit_rate, size and maxsize of the name cache shared by
+    the Pascal-Francis mappers.
+    """
+    #
+    cache_info = pascal_francis_name_normalise_cached.cache_info()
+    lookups = cache_info.hits + cache_info.misses
+    cache_stats = {
+        "hits": cache_info.hits,
+        "misses": cache_info.misses,
+        "hit_rate": cache_info.hits / lookups if lookups > 0 else 0.0,
+        "size": cache_info.currsize,
+        "maxsize": cache_info.maxsize
+    }
+    #
+    return cache_stats
+
+
 def pascal_francis_journal_zotero_map(PF_notice_elements_list):
     """
     params:
@@ -930,31 +1351,9 @@ def pascal_francis_journal_zotero_map(PF_notice_elements_list):
     zotero_note_list = []
     for pf_notice_elements in PF_notice_elements_list:
         if isinstance(pf_notice_elements, list) and pf_notice_elements[0] == "creators/author":
-            name_author_brut = pf_notice_elements[1].strip()
-            name_author_split = name_author_brut.split(",")
-            if len (name_author_split) > 1:
-                zotero_dict["creators"][0]['firstName'] = name_author_split[1].strip()
-                zotero_dict["creators"][0]['lastName'] = name_author_split[0].strip()
-            elif len(name_author_split) == 1:
-                # For names that are wrongly provided as
-                # J. J.-C GOYON GOYON
-                name_author_new_split_brut = name_author_brut.split(" ")
-                name_author_new_split = list(set(name_author_new_split_brut))
-                name_first_name = ""
-                name_last_name = ""
-                for name_split in name_author_new_split:
-                    if len(name_split) <= 2:
-                        if name_split not in name_first_name:
-                            name_first_name = name_first_name + " " + name_split
-                    elif len(name_split) > 2 and re.match("[A-Z]\.-[A-Z]", name_split) is not None:
-                        # For names like J.-P. Kollerin
-                        if name_split not in name_first_name:
-                            name_first_name = name_split
-                    elif len(name_split) > 2 and re.match("\w\.-\w\.", name_split) is None:
-                        if name_split not in name_last_name:
-                            name_last_name = name_last_name + " " + name_split
-                zotero_dict["creators"][0]['firstName'] = name_first_name.strip()
-                zotero_dict["creators"][0]['lastName'] = name_last_name.strip()
+            name_first_name, name_last_name = pascal_francis_name_normalise_cached(pf_notice_elements[1].strip())
+            zotero_dict["creators"][0]['firstName'] = name_first_name
+            zotero_dict["creators"][0]['lastName'] = name_last_name
         elif isinstance(pf_notice_elements, list) and pf_notice_elements[0] == "pages":
             zotero_dict["pages"] = pf_notice_elements[1].strip()
         elif isinstance(pf_notice_elements, list):
@@ -1022,31 +1421,9 @@ def pascal_francis_conference_zotero_map(PF_notice_elements_list):
     zotero_note_list = []
     for pf_notice_elements in PF_notice_elements_list:
         if isinstance(pf_notice_elements, list) and pf_notice_elements[0] == "creators/author":
-            name_author_brut = pf_notice_elements[1].strip()
-            name_author_split = name_author_brut.split(",")
-            if len (name_author_split) > 1:
-                zotero_dict["creators"][0]['firstName'] = name_author_split[1].strip()
-                zotero_dict["creators"][0]['lastName'] = name_author_split[0].strip()
-            elif len(name_author_split) == 1:
-                # For names that are wrongly provided as
-                # J. J.-C GOYON GOYON
-                name_author_new_split_brut = name_author_brut.split(" ")
-                name_author_new_split = list(set(name_author_new_split_brut))
-                name_first_name = ""
-                name_last_name = ""
-                for name_split in name_author_new_split:
-                    if len(name_split) <= 2:
-                        if name_split not in name_first_name:
-                            name_first_name = name_first_name + " " + name_split
-                    elif len(name_split) > 2 and re.match("[A-Z]\.-[A-Z]", name_split) is not None:
-                        # For names like J.-P. Kollerin
-                        if name_split not in name_first_name:
-                            name_first_name = name_split
-                    elif len(name_split) > 2 and re.match("\w\.-\w\.", name_split) is None:
-                        if name_split not in name_last_name:
-                            name_last_name = name_last_name + " " + name_split
-                zotero_dict["creators"][0]['firstName'] = name_first_name.strip()
-                zotero_dict["creators"][0]['lastName'] = name_last_name.strip()
+            name_first_name, name_last_name = pascal_francis_name_normalise_cached(pf_notice_elements[1].strip())
+            zotero_dict["creators"][0]['firstName'] = name_first_name
+            zotero_dict["creators"][0]['lastName'] = name_last_name
         elif isinstance(pf_notice_elements, list) and pf_notice_elements[0] == "pages":
             zotero_dict["pages"] = pf_notice_elements[1].strip()
         elif isinstance(pf_notice_elements, list):
@@ -1079,75 +1456,88 @@ def pascal_francis_conference_zotero_map(PF_notice_elements_list):
     return [zotero_dict, zotero_note_list]
 
 
-def pascal_francis_confP_map(notice_list, itemType=""):
+def pascal_francis_item_iter(notice_list, itemType, notice_zotero_map, diagnostics=None):
     """
-    params: notice_list, []
+    params:
+    notice_list, iterable of ris_p_dict_map outputs.
     itemType, str.
+    notice_zotero_map, function, pascal_francis_journal_zotero_map or
+    pascal_francis_conference_zotero_map
+    diagnostics, [] or None. Notices that can not be mapped are skipped and
+    reported with their index.
 
-    return: zotero_item_list
+    yield: zotero_dict_note_list, [{},[{}, ...]]
+
+    Notices are mapped one at a time, so a generator of notices can be
+    converted without holding the whole list.
     """
     #
-    zotero_item_list = []
-    for ris_notice in notice_list:
+    for notice_index, ris_notice in enumerate(notice_list):
         for ris_not in ris_notice:
-            if isinstance(ris_not, dict):
-                if ris_not.get("itemType") == itemType:
-                    try:
-                        ris_not_zot_confP = pascal_francis_conference_zotero_map(ris_notice)
-                    except IndexError:
-                        print(ris_notice)
-                        print(notice_list.index(ris_notice))
-                        continue
-                    else:
-                        pass
-                    zotero_item_list.append(ris_not_zot_confP)
+            if isinstance(ris_not, dict) and ris_not.get("itemType") == itemType:
+                try:
+                    zotero_dict_note_list = notice_zotero_map(ris_notice)
+                except IndexError as notice_error:
+                    if diagnostics is not None:
+                        diagnostics.append({
+                            "notice": notice_index,
+                            "message": "notice skipped: " + str(notice_error),
+                            "text": json.dumps(ris_notice, ensure_ascii=False)
+                        })
                 else:
-                    pass
+                    yield zotero_dict_note_list
+                break
+
+
+def pascal_francis_confP_map(notice_list, itemType="", diagnostics=None):
+    """
+    params: notice_list, []
+    itemType, str.
+    diagnostics, [] or None, see pascal_francis_item_iter
+
+    return: zotero_item_list
+    """
+    #
+    zotero_item_list = list(pascal_francis_item_iter(notice_list, itemType, pascal_francis_conference_zotero_map, diagnostics))
     #
     return zotero_item_list
 
-def pascal_francis_journ_map(notice_list, itemType=""):
+def pascal_francis_journ_map(notice_list, itemType="", diagnostics=None):
     """
     params: notice_list, []
     itemType, str.
+    diagnostics, [] or None, see pascal_francis_item_iter
 
     return: zotero_item_list
     """
     #
-    zotero_item_list = []
-    for ris_notice in notice_list:
-        for ris_not in ris_notice:
-            if isinstance(ris_not, dict):
-                if ris_not.get("itemType") == itemType:
-                    try:
-                        ris_not_zot_jour = pascal_francis_journal_zotero_map(ris_notice)
-                    except IndexError:
-                        print(ris_notice)
-                        print(notice_list.index(ris_notice))
-                        continue
-                    else:
-                        pass
-                    zotero_item_list.append(ris_not_zot_jour)
-                else:
-                    pass
+    zotero_item_list = list(pascal_francis_item_iter(notice_list, itemType, pascal_francis_journal_zotero_map, diagnostics))
     #
     return zotero_item_list
 
 
-def zotero_collection_map(zotero_item_list, collection=""):
+def zotero_collection_iter(zotero_item_list, collection=""):
     """
-    params: zotero_item_list, [{},{}, ...]
-    return: zotero_item_collection_list, [{},{}, ...]
+    params: zotero_item_list, iterable of [{},[{}, ...]]
+    yield: new_zotero_item_list, [{}]
     """
     #
-    zotero_item_collection_list = []
     for zotero_item in zotero_item_list:
         new_zotero_item_list = []
         for zot_item in zotero_item:
             if isinstance(zot_item, dict) and "collections" in zot_item.keys():
                 zot_item["collections"].append(collection)
                 new_zotero_item_list.append(zot_item)
-        zotero_item_collection_list.append(new_zotero_item_list)
+        yield new_zotero_item_list
+
+
+def zotero_collection_map(zotero_item_list, collection=""):
+    """
+    params: zotero_item_list, [{},{}, ...]
+    return: zotero_item_collection_list, [{},{}, ...]
+    """
+    #
+    zotero_item_collection_list = list(zotero_collection_iter(zotero_item_list, collection))
     #
     return zotero_item_collection_list
 
@@ -0,0 +1,157 @@
+"""
+Per entry timing of bibtex_field_map against the if chain it replaced.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_bibtex_field_map [entries]
+"""
+
+__author__ = "Kaan Eraslan"
+
+import random
+import sys
+import time
+
+from zotBibtexJson import BibtexToZotero
+
+
+def bibtex_field_map_chain(bibtex_dict, zotero_dict, bibtex_type):
+    """
+    params: bibtex_dict, dict.
+    return: zotero_dict, dict.
+
+    The if chain bibtex_field_map used before bibtex_field_table, kept as
+    the baseline. patentNumber reads bibtex_dict, the old code raised.
+    """
+    #
+    if "comments" in bibtex_dict.keys():
+        zotero_dict["notes"] = bibtex_dict["comments"]
+    if "annote" in bibtex_dict.keys():
+        zotero_dict["notes"] = bibtex_dict["annote"]
+    if "review" in bibtex_dict.keys():
+        zotero_dict["notes"] = bibtex_dict["review"]
+    if "notes" in bibtex_dict.keys():
+        zotero_dict["notes"] = bibtex_dict["notes"]
+    if "keywords" in bibtex_dict.keys():
+        zotero_dict["tags"] = bibtex_dict["keywords"]
+    if "keyword" in bibtex_dict.keys():
+        zotero_dict["tags"] = bibtex_dict["keyword"]
+    if "date" in bibtex_dict.keys():
+        zotero_dict["date"] = bibtex_dict["date"]
+    if "pages" in bibtex_dict.keys() and (bibtex_type == "book" or bibtex_type == "thesis" or bibtex_type == "manuscript"):
+        zotero_dict["numPages"] = bibtex_dict["pages"]
+    if "pages" in bibtex_dict.keys() and bibtex_type != "book" and bibtex_type != "thesis" and bibtex_type != "manuscript":
+        zotero_dict["pages"] = bibtex_dict["pages"]
+    if "year" in bibtex_dict.keys():
+        zotero_dict["date"] = bibtex_dict["year"]
+    if "title" in bibtex_dict.keys():
+        zotero_dict["title"] = bibtex_dict["title"]
+    if "lastchecked" in bibtex_dict.keys():
+        zotero_dict["accessDate"] = bibtex_dict["lastchecked"]
+    if "urldate" in bibtex_dict.keys():
+        zotero_dict["accessDate"] = bibtex_dict["urldate"]
+    if "journal" in bibtex_dict.keys():
+        zotero_dict["publicationTitle"] = bibtex_dict["journal"]
+    if "number" in bibtex_dict.keys() and bibtex_type == "report":
+        zotero_dict["reportNumber"] = bibtex_dict["number"]
+    if "number" in bibtex_dict.keys() and (bibtex_type == "book" or bibtex_type == "bookSection" or bibtex_type == "conferencePaper"):
+        zotero_dict["seriesNumber"] = bibtex_dict["number"]
+    if "number" in bibtex_dict.keys() and bibtex_type == "patent":
+        zotero_dict["patentNumber"] = bibtex_dict["number"]
+    if "booktitle" in bibtex_dict.keys():
+        zotero_dict["publicationTitle"] = bibtex_dict["booktitle"]
+    if "school" in bibtex_dict.keys():
+        zotero_dict["publisher"] = bibtex_dict["school"]
+    if "institution" in bibtex_dict.keys():
+        zotero_dict["publisher"] = bibtex_dict["institution"]
+    if "issue" in bibtex_dict.keys():
+        zotero_dict["issue"] = bibtex_dict["issue"]
+    if "location" in bibtex_dict.keys():
+        zotero_dict["place"] = bibtex_dict["location"]
+    if "address" in bibtex_dict.keys():
+        zotero_dict["place"] = bibtex_dict["address"]
+    if "chapter" in bibtex_dict.keys():
+        zotero_dict["section"] = bibtex_dict["chapter"]
+    if "edition" in bibtex_dict.keys():
+        zotero_dict["edition"] = bibtex_dict["edition"]
+    if "series" in bibtex_dict.keys():
+        zotero_dict["series"] = bibtex_dict["series"]
+    if "volume" in bibtex_dict.keys():
+        zotero_dict["volume"] = bibtex_dict["volume"]
+    if "copyright" in bibtex_dict.keys():
+        zotero_dict["rights"] = bibtex_dict["copyright"]
+    if "isbn" in bibtex_dict.keys():
+        zotero_dict["ISBN"] = bibtex_dict["isbn"]
+    if "issn" in bibtex_dict.keys():
+        zotero_dict["ISSN"] = bibtex_dict["issn"]
+    if "shorttitle" in bibtex_dict.keys():
+        zotero_dict["shortTitle"] = bibtex_dict["shorttitle"]
+    if "url" in bibtex_dict.keys():
+        zotero_dict["url"] = bibtex_dict["url"]
+    if "doi" in bibtex_dict.keys():
+        zotero_dict["DOI"] = bibtex_dict["doi"]
+    if "abstract" in bibtex_dict.keys():
+        zotero_dict["abstractNote"] = bibtex_dict["abstract"]
+    if "nationality" in bibtex_dict.keys():
+        zotero_dict["country"] = bibtex_dict["nationality"]
+    if "language" in bibtex_dict.keys():
+        zotero_dict["language"] = bibtex_dict["language"]
+    if "assignee" in bibtex_dict.keys():
+        zotero_dict["assignee"] = bibtex_dict["assignee"]
+    #
+    return zotero_dict
+
+
+def bibtex_entries_make(entry_count, seed=0):
+    """
+    params:
+    entry_count, int.
+    seed, int.
+
+    return: [(bibtex_dict, itemType), ...]
+    """
+    #
+    rng = random.Random(seed)
+    bibtex_field_names = [bibtex_field for bibtex_field, zotero_field in BibtexToZotero.bibtex_fields]
+    bibtex_type_names = sorted(BibtexToZotero.bibtex_types.keys())
+    entry_list = []
+    for entry_index in range(entry_count):
+        bibtex_dict = {"type": rng.choice(bibtex_type_names), "ID": "key%d" % entry_index}
+        for bibtex_field in rng.sample(bibtex_field_names, rng.randint(4, 14)):
+            bibtex_dict[bibtex_field] = "%s %d" % (bibtex_field, entry_index)
+        for extra_index in range(rng.randint(0, 4)):
+            bibtex_dict["x-custom%d" % extra_index] = "unmapped"
+        entry_list.append((bibtex_dict, BibtexToZotero.bibtex_types[bibtex_dict["type"]]))
+    #
+    return entry_list
+
+
+def bench_run(field_map, entry_list):
+    """
+    params:
+    field_map, function.
+    entry_list, [(bibtex_dict, itemType), ...]
+
+    return: (seconds, [zotero_dict, ...])
+    """
+    #
+    start = time.perf_counter()
+    zotero_dict_list = [field_map(bibtex_dict, {}, itemType) for bibtex_dict, itemType in entry_list]
+    #
+    return (time.perf_counter() - start, zotero_dict_list)
+
+
+def main(entry_count=100000):
+    entry_list = bibtex_entries_make(entry_count)
+    chain_time, chain_output = bench_run(bibtex_field_map_chain, entry_list)
+    table_time, table_output = bench_run(BibtexToZotero.bibtex_field_map, entry_list)
+    if chain_output != table_output:
+        raise AssertionError("bibtex_field_map output differs from the if chain")
+    print("entries: %d" % entry_count)
+    print("if chain: %.2f us/entry" % (chain_time / entry_count * 1e6))
+    print("table:    %.2f us/entry" % (table_time / entry_count * 1e6))
+    print("speedup:  %.2fx" % (chain_time / table_time))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,103 @@
+"""
+Import time of the converter modules, against a budget.
+
+Each module is imported in a fresh interpreter with -X importtime and the
+best cumulative time of a few runs is kept. bench_stages records these
+times in its history, with the other stages.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_import
+"""
+
+__author__ = "Kaan Eraslan"
+
+import os
+import subprocess
+import sys
+
+# cumulative microseconds, standard library modules included, so they
+# depend on the machine. RisToZotero took about 35 ms with its tables and
+# test records, and about 20 ms once they were made lazy.
+import_budgets = {
+    "ZotRisJson.RisToZotero": 30000,
+    "zotBibtexJson.BibtexToZotero": 50000,
+    "zotJson.__main__": 50000
+}
+import_repository_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_time_measure(module_name, repeat=5):
+    """
+    params:
+    module_name, str.
+    repeat, int.
+
+    return: import_us, int. Best cumulative import time, in microseconds.
+    """
+    #
+    import_us = None
+    for repeat_index in range(repeat):
+        importtime_output = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import " + module_name],
+            capture_output=True, text=True, check=True, cwd=import_repository_root
+        ).stderr
+        for importtime_line in importtime_output.splitlines():
+            importtime_fields = importtime_line.split("|")
+            if len(importtime_fields) == 3 and importtime_fields[2].strip() == module_name:
+                cumulative_us = int(importtime_fields[1])
+                import_us = cumulative_us if import_us is None else min(import_us, cumulative_us)
+    #
+    return import_us
+
+
+def import_stages_run(repeat=5):
+    """
+    params: repeat, int.
+    return: stage_results, {"import <module>": stage_result}, shaped as
+    the results of bench_stages.bench_stage.
+    """
+    #
+    stage_results = {}
+    for module_name in import_budgets:
+        import_us = import_time_measure(module_name, repeat)
+        stage_results["import " + module_name] = {
+            "records": 1,
+            "seconds": import_us / 1e6,
+            "us_per_record": import_us,
+            "peak_bytes": 0
+        }
+    #
+    return stage_results
+
+
+def import_budget_check(stage_results):
+    """
+    params: stage_results, {}, see import_stages_run
+    return: overrun_list, [str, ...]
+    """
+    #
+    overrun_list = []
+    for module_name, budget_us in import_budgets.items():
+        stage_result = stage_results.get("import " + module_name)
+        if stage_result is not None and stage_result["us_per_record"] > budget_us:
+            overrun_list.append("import %s: %d us over the %d us budget" % (
+                module_name, stage_result["us_per_record"], budget_us
+            ))
+    #
+    return overrun_list
+
+
+def main():
+    stage_results = import_stages_run()
+    for stage, stage_result in stage_results.items():
+        print("%-36s %8d us" % (stage, stage_result["us_per_record"]))
+    overrun_list = import_budget_check(stage_results)
+    for overrun in overrun_list:
+        print("  " + overrun)
+    #
+    return 1 if len(overrun_list) > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,309 @@
+"""
+Per stage timing and memory peaks of the RIS and BibTeX pipelines on a
+synthetic corpus (see benchmarks.corpus), recorded per commit.
+
+Every stage is run repeat times on the same input, the best time is
+kept, then once more under tracemalloc for its memory peak. Results are
+appended to a JSON lines history; each run is compared with the last
+run of another commit on the same number of records, and stages that
+got slower, or use more memory, by more than the threshold are listed,
+as are the imports over their budget (see benchmarks.bench_import).
+
+Run from the repository root:
+
+    python -m benchmarks.bench_stages --records 10000 --check
+"""
+
+__author__ = "Kaan Eraslan"
+
+import argparse
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from ZotRisJson import RisToZotero
+from zotBibtexJson import BibtexLatex
+from zotBibtexJson import BibtexToZotero
+from benchmarks import bench_import
+from benchmarks import corpus
+
+bench_history_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "history.jsonl")
+
+
+def bench_commit():
+    """
+    return: commit, str. Short hash of HEAD, with "+" if the tree has
+    changes, or "unknown" outside of a git checkout.
+    """
+    #
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        tree_status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True, check=True
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    #
+    return commit + ("+" if len(tree_status.strip()) > 0 else "")
+
+
+def bench_stage(stage_run, stage_prepare=None, repeat=3):
+    """
+    params:
+    stage_run, function. stage_input => record_count
+    stage_prepare, function or None. Gives a fresh input, not timed.
+    repeat, int.
+
+    return: stage_result, {"records", "seconds", "us_per_record", "peak_bytes"}
+    """
+    #
+    seconds = None
+    record_count = 0
+    for repeat_index in range(repeat):
+        stage_input = stage_prepare() if stage_prepare is not None else None
+        start = time.perf_counter()
+        record_count = stage_run(stage_input)
+        elapsed = time.perf_counter() - start
+        seconds = elapsed if seconds is None else min(seconds, elapsed)
+    #
+    stage_input = stage_prepare() if stage_prepare is not None else None
+    tracemalloc.start()
+    stage_run(stage_input)
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    stage_result = {
+        "records": record_count,
+        "seconds": round(seconds, 6),
+        "us_per_record": round(seconds / max(record_count, 1) * 1e6, 3),
+        "peak_bytes": peak_bytes
+    }
+    #
+    return stage_result
+
+
+def ris_stages_run(record_count, seed, repeat):
+    """
+    params:
+    record_count, int.
+    seed, int.
+    repeat, int.
+
+    return: stage_results, {stage: stage_result}
+    """
+    #
+    ris_types = RisToZotero.type_map
+    ris_Indep_fields = RisToZotero.field_map
+    ris_Dep_fields = RisToZotero.dependent_fields
+    ris_export = "".join(corpus.ris_corpus_iter(record_count, seed))
+    ris_text_list = RisToZotero.ris_text_read(ris_export)
+    ris_parsed_list = [RisToZotero.ris_text_parse(ris_text) for ris_text in ris_text_list]
+    ris_Indep_list = [
+        RisToZotero.risIndependentField_map(RisToZotero.risType_map(ris_parsed, ris_types), ris_Indep_fields)
+        for ris_parsed in ris_parsed_list
+    ]
+    ris_p_dict_list = [
+        RisToZotero.ris_p_dict_map(ris_text, ris_types, ris_Indep_fields, ris_Dep_fields)
+        for ris_text in ris_text_list
+    ]
+    journal_notices = [ris_p_dict for ris_p_dict in ris_p_dict_list if {"itemType": "journalArticle"} in ris_p_dict]
+    conference_notices = [ris_p_dict for ris_p_dict in ris_p_dict_list if {"itemType": "conferencePaper"} in ris_p_dict]
+    #
+    def ris_dependent_run(ris_Indep_copies):
+        # the staged map raises on some tag combinations, as in ris_field_table_verify
+        for ris_Indep in ris_Indep_copies:
+            try:
+                RisToZotero.risDependentField_map(ris_Indep, ris_Dep_fields)
+            except (IndexError, TypeError, KeyError):
+                pass
+        return len(ris_Indep_copies)
+    #
+    stage_results = {
+        "ris_text_read": bench_stage(
+            lambda stage_input: len(RisToZotero.ris_text_read(ris_export)), repeat=repeat
+        ),
+        "ris_text_parse": bench_stage(
+            lambda stage_input: len([RisToZotero.ris_text_parse(ris_text) for ris_text in ris_text_list]),
+            repeat=repeat
+        ),
+        "risDependentField_map": bench_stage(
+            ris_dependent_run,
+            # risDependentField_map removes lines from its input
+            lambda: [list(ris_Indep) for ris_Indep in ris_Indep_list],
+            repeat=repeat
+        ),
+        "ris_p_dict_map": bench_stage(
+            lambda stage_input: len([
+                RisToZotero.ris_p_dict_map(ris_text, ris_types, ris_Indep_fields, ris_Dep_fields)
+                for ris_text in ris_text_list
+            ]),
+            repeat=repeat
+        ),
+        "pascal_francis_journ_map": bench_stage(
+            lambda stage_input: len(RisToZotero.pascal_francis_journ_map(journal_notices, "journalArticle")),
+            repeat=repeat
+        ),
+        "pascal_francis_confP_map": bench_stage(
+            lambda stage_input: len(RisToZotero.pascal_francis_confP_map(conference_notices, "conferencePaper")),
+            repeat=repeat
+        )
+    }
+    #
+    return stage_results
+
+
+def bibtex_stages_run(entry_count, seed, repeat):
+    """
+    params:
+    entry_count, int.
+    seed, int.
+    repeat, int.
+
+    return: stage_results, {stage: stage_result}
+    """
+    #
+    bibtex_export = "".join(corpus.bibtex_corpus_iter(entry_count, seed))
+    bibtex_dict_list = list(BibtexToZotero.bibtex_dict_read(io.StringIO(bibtex_export)))
+    bibtex_typed_list = [
+        (bibtex_dict, BibtexToZotero.bibtex_types.get(bibtex_dict["type"], "book"))
+        for bibtex_dict in bibtex_dict_list
+    ]
+    #
+    stage_results = {
+        "bibtex_dict_read": bench_stage(
+            lambda stage_input: len(list(BibtexToZotero.bibtex_dict_read(io.StringIO(bibtex_export)))),
+            repeat=repeat
+        ),
+        # per field, most fields have no LaTeX
+        "bibtex_latex_decode": bench_stage(
+            lambda stage_input: sum(
+                len(BibtexLatex.latex_entry_decode(bibtex_dict)) for bibtex_dict in bibtex_dict_list
+            ),
+            repeat=repeat
+        ),
+        "bibtex_field_map": bench_stage(
+            lambda stage_input: len([
+                BibtexToZotero.bibtex_field_map(bibtex_dict, {}, itemType)
+                for bibtex_dict, itemType in bibtex_typed_list
+            ]),
+            repeat=repeat
+        ),
+        "bibtex_parse_name": bench_stage(
+            lambda stage_input: len([
+                BibtexToZotero.bibtex_parse_name(bibtex_dict, {}) for bibtex_dict in bibtex_dict_list
+            ]),
+            repeat=repeat
+        )
+    }
+    #
+    return stage_results
+
+
+def bench_history_load(path):
+    """
+    params: path, str.
+    return: bench_runs, [{}, ...], oldest first.
+    """
+    #
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as history_file:
+        bench_runs = [json.loads(line) for line in history_file if len(line.strip()) > 0]
+    #
+    return bench_runs
+
+
+def bench_history_append(path, bench_result):
+    """
+    params:
+    path, str.
+    bench_result, {}
+    """
+    #
+    with open(path, "a", encoding="utf-8") as history_file:
+        history_file.write(json.dumps(bench_result, sort_keys=True) + "\n")
+
+
+def bench_regressions(bench_result, bench_runs, threshold=0.1):
+    """
+    params:
+    bench_result, {}. This run.
+    bench_runs, [{}, ...]. The history.
+    threshold, float. Allowed relative growth.
+
+    return: (baseline, regression_list), ({} or None, [str, ...])
+    """
+    #
+    baseline = None
+    for bench_run in reversed(bench_runs):
+        if bench_run["records"] == bench_result["records"] and bench_run["commit"] != bench_result["commit"]:
+            baseline = bench_run
+            break
+    if baseline is None:
+        return (None, [])
+    #
+    regression_list = []
+    for stage, stage_result in bench_result["stages"].items():
+        baseline_stage = baseline["stages"].get(stage)
+        if baseline_stage is None:
+            continue
+        for measure in ("us_per_record", "peak_bytes"):
+            if stage_result[measure] > baseline_stage[measure] * (1 + threshold):
+                regression_list.append("%s %s: %s -> %s" % (
+                    stage, measure, baseline_stage[measure], stage_result[measure]
+                ))
+    #
+    return (baseline, regression_list)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--records", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--history", default=bench_history_path)
+    parser.add_argument("--threshold", type=float, default=0.1)
+    parser.add_argument("--check", action="store_true", help="exit with 1 when a stage regressed")
+    parser.add_argument("--no-save", action="store_true", help="do not append this run to the history")
+    args = parser.parse_args(argv)
+    #
+    stage_results = ris_stages_run(args.records, args.seed, args.repeat)
+    stage_results.update(bibtex_stages_run(args.records, args.seed, args.repeat))
+    stage_results.update(bench_import.import_stages_run())
+    bench_result = {
+        "commit": bench_commit(),
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "records": args.records,
+        "seed": args.seed,
+        "stages": stage_results
+    }
+    for stage, stage_result in stage_results.items():
+        print("%-26s %10.2f us/record %10.1f MiB peak" % (
+            stage, stage_result["us_per_record"], stage_result["peak_bytes"] / 2 ** 20
+        ))
+    #
+    baseline, regression_list = bench_regressions(bench_result, bench_history_load(args.history), args.threshold)
+    regression_list.extend(bench_import.import_budget_check(stage_results))
+    if baseline is not None:
+        print("compared with %s (%s):" % (baseline["commit"], baseline["date"]))
+    for regression in regression_list:
+        print("  regression " + regression)
+    if baseline is not None and len(regression_list) == 0:
+        print("  no regression above %d%%" % (args.threshold * 100))
+    if not args.no_save:
+        bench_history_append(args.history, bench_result)
+    if args.check and len(regression_list) > 0:
+        return 1
+    #
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,197 @@
+"""
+Seeded synthetic RIS and BibTeX exports for the benchmarks.
+
+The first records cycle through every type of RisToZotero.type_map and
+BibtexToZotero.bibtex_types, the others pick a type at random. Records
+are generated one at a time, so 10M records can be written to a file
+without holding them in memory.
+
+Run from the repository root:
+
+    python -m benchmarks.corpus ris 1000000 corpus.ris [seed]
+    python -m benchmarks.corpus bibtex 1000000 corpus.bib [seed]
+"""
+
+__author__ = "Kaan Eraslan"
+
+import random
+import sys
+
+from ZotRisJson import RisToZotero
+from zotBibtexJson import BibtexToZotero
+
+corpus_syllables = [
+    "an", "ar", "ba", "ca", "de", "el", "fa", "gi", "ho", "is", "ka", "lo", "ma", "ne", "or",
+    "pa", "qu", "ri", "sa", "te", "ul", "va", "we", "xi", "yo", "zu", "tion", "ment", "ia", "ous"
+]
+corpus_ris_tags = sorted(set(RisToZotero.field_map) | set(RisToZotero.dependent_fields))
+corpus_bibtex_fields = [bibtex_field for bibtex_field, zotero_field in BibtexToZotero.bibtex_fields]
+
+
+def corpus_words_make(word_count, rng):
+    """
+    params:
+    word_count, int. Size of the vocabulary.
+    rng, random.Random
+
+    return: word_list, [str, ...]
+    """
+    #
+    word_list = [
+        "".join(rng.choice(corpus_syllables) for syllable_index in range(rng.randint(1, 4)))
+        for word_index in range(word_count)
+    ]
+    #
+    return word_list
+
+
+def corpus_text_make(word_list, rng, low, high):
+    """
+    params:
+    word_list, [str, ...]
+    rng, random.Random
+    low, int.
+    high, int. Number of words.
+
+    return: text, str.
+    """
+    #
+    text = " ".join(rng.choice(word_list) for word_index in range(rng.randint(low, high)))
+    #
+    return text
+
+
+def corpus_name_make(word_list, rng):
+    """
+    params:
+    word_list, [str, ...]
+    rng, random.Random
+
+    return: (last, first), (str, str)
+    """
+    #
+    last = rng.choice(word_list).capitalize()
+    if rng.random() < 0.3:
+        first = rng.choice("ABCDEFGHIJKLMNOPRSTVW") + "." + rng.choice("ABCDEFGHIJKLMNOPRSTVW") + "."
+    else:
+        first = rng.choice(word_list).capitalize()
+    #
+    return (last, first)
+
+
+def ris_corpus_iter(record_count, seed=0):
+    """
+    params:
+    record_count, int.
+    seed, int.
+
+    yield: ris_text, str. One record, ending with its ER line.
+    """
+    #
+    rng = random.Random(seed)
+    word_list = corpus_words_make(5000, rng)
+    ris_type_names = sorted(RisToZotero.type_map.keys())
+    for record_index in range(record_count):
+        if record_index < len(ris_type_names):
+            ris_type = ris_type_names[record_index]
+        else:
+            ris_type = rng.choice(ris_type_names)
+        ris_lines = ["TY  - " + ris_type]
+        for author_index in range(rng.randint(1, 6)):
+            ris_lines.append("AU  - %s, %s" % corpus_name_make(word_list, rng))
+        ris_lines.append("TI  - " + corpus_text_make(word_list, rng, 3, 14).capitalize())
+        ris_lines.append("PY  - %d" % rng.randint(1900, 2024))
+        ris_lines.append("JO  - " + corpus_text_make(word_list, rng, 1, 4).title())
+        ris_lines.append("VL  - %d" % rng.randint(1, 120))
+        first_page = rng.randint(1, 900)
+        ris_lines.append("SP  - %d" % first_page)
+        ris_lines.append("EP  - %d" % (first_page + rng.randint(1, 40)))
+        if rng.random() < 0.6:
+            ris_lines.append("DO  - 10.%d/%s.%d" % (rng.randint(1000, 9999), rng.choice(word_list), record_index))
+        if rng.random() < 0.5:
+            ris_lines.append("SN  - %04d-%04d" % (rng.randint(0, 9999), rng.randint(0, 9999)))
+        for keyword_index in range(rng.randint(0, 6)):
+            ris_lines.append("KW  - " + corpus_text_make(word_list, rng, 1, 3))
+        if rng.random() < 0.7:
+            ris_lines.append("AB  - " + corpus_text_make(word_list, rng, 20, 60))
+            for continuation_index in range(rng.randint(0, 3)):
+                ris_lines.append(corpus_text_make(word_list, rng, 5, 15))
+        if rng.random() < 0.3:
+            ris_lines.append("N1  - " + corpus_text_make(word_list, rng, 5, 30))
+        if rng.random() < 0.2:
+            ris_lines.append("L1  - internal-pdf://%d/%s.pdf" % (rng.randint(0, 4000000000), rng.choice(word_list)))
+        for tag_index in range(rng.randint(0, 5)):
+            ris_lines.append("%s  - %s" % (rng.choice(corpus_ris_tags), corpus_text_make(word_list, rng, 1, 6)))
+        ris_lines.append("ID  - %d" % record_index)
+        ris_lines.append("ER  - ")
+        yield "\n".join(ris_lines) + "\n"
+
+
+def bibtex_corpus_iter(entry_count, seed=0):
+    """
+    params:
+    entry_count, int.
+    seed, int.
+
+    yield: bibtex_text, str. The @string macros first, then one entry each.
+    """
+    #
+    rng = random.Random(seed)
+    word_list = corpus_words_make(5000, rng)
+    bibtex_type_names = sorted(BibtexToZotero.bibtex_types.keys())
+    macro_names = ["jnl%d" % macro_index for macro_index in range(20)]
+    for macro_name in macro_names:
+        yield "@string{%s = {%s}}\n" % (macro_name, corpus_text_make(word_list, rng, 2, 5).title())
+    for entry_index in range(entry_count):
+        if entry_index < len(bibtex_type_names):
+            bibtex_type = bibtex_type_names[entry_index]
+        else:
+            bibtex_type = rng.choice(bibtex_type_names)
+        author_list = [
+            "%s, %s" % corpus_name_make(word_list, rng) for author_index in range(rng.randint(1, 6))
+        ]
+        bibtex_lines = [
+            "@%s{key%d," % (bibtex_type, entry_index),
+            "  author = {%s}," % " and ".join(author_list),
+            "  title = {%s}," % corpus_text_make(word_list, rng, 3, 14).capitalize(),
+            "  year = %d," % rng.randint(1900, 2024),
+            "  month = %s," % rng.choice(list(BibtexToZotero.bibtex_month_macros)),
+            "  journal = %s," % rng.choice(macro_names)
+        ]
+        for bibtex_field in rng.sample(corpus_bibtex_fields, rng.randint(3, 10)):
+            if bibtex_field in ("year", "title", "journal"):
+                continue
+            bibtex_lines.append("  %s = {%s}," % (bibtex_field, corpus_text_make(word_list, rng, 1, 12)))
+        if rng.random() < 0.3:
+            bibtex_lines.append("  editor = {%s}," % " and ".join(
+                "%s, %s" % corpus_name_make(word_list, rng) for editor_index in range(rng.randint(1, 3))
+            ))
+        bibtex_lines.append("}")
+        yield "\n".join(bibtex_lines) + "\n\n"
+
+
+def corpus_write(path, text_iter):
+    """
+    params:
+    path, str.
+    text_iter, iterable of str, see ris_corpus_iter and bibtex_corpus_iter
+
+    return: byte_count, int.
+    """
+    #
+    byte_count = 0
+    with open(path, "w", encoding="utf-8", newline="\n") as corpus_file:
+        for text in text_iter:
+            byte_count += corpus_file.write(text)
+    #
+    return byte_count
+
+
+def main(corpus_format, record_count, path, seed=0):
+    corpus_iter = ris_corpus_iter if corpus_format == "ris" else bibtex_corpus_iter
+    byte_count = corpus_write(path, corpus_iter(int(record_count), int(seed)))
+    print("%s: %s records, %d bytes" % (path, record_count, byte_count))
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:5])
@@ -0,0 +1,112 @@
+"""
+A local stub of the Zotero write API, shared by the upload tests, and
+the items they send.
+
+The stub answers each POST with the next scripted response and keeps the
+batches it received, with the keys of the items created before each one.
+"""
+
+__author__ = "Kaan Eraslan"
+__license__ = "MIT License, see LICENSE"
+
+# Packages ----------------------------------------------
+
+import http.server
+import json
+import threading
+import time
+
+import pytest
+
+# --------------------------------------------------------
+
+
+class ZoteroStubHandler(http.server.BaseHTTPRequestHandler):
+    """Answers POST /users/1/items like the Zotero write API."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        stub_state = self.server.stub_state
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        zotero_objects = json.loads(body.decode("utf-8"))
+        with stub_state["lock"]:
+            stub_state["requests"].append({
+                "time": time.monotonic(),
+                "token": self.headers["Zotero-Write-Token"],
+                "items": zotero_objects,
+                "created": set(stub_state["created"])
+            })
+            script = stub_state["script"]
+            status, headers = script.pop(0) if len(script) > 0 else (200, {})
+        if status == 200:
+            # parents are slow to create, notes racing ahead of them would show
+            if any("parentItem" not in zotero_object for zotero_object in zotero_objects):
+                time.sleep(stub_state["parent_delay"])
+            resp = {"success": {}, "unchanged": {}, "failed": {}}
+            with stub_state["lock"]:
+                for item_index, zotero_object in enumerate(zotero_objects):
+                    if zotero_object.get("parentItem") is not None \
+                            and zotero_object["parentItem"] not in stub_state["created"]:
+                        resp["failed"][str(item_index)] = {
+                            "key": zotero_object["key"], "code": 409, "message": "parent item does not exist"
+                        }
+                    elif zotero_object.get("title") == "rejected":
+                        resp["failed"][str(item_index)] = {
+                            "key": zotero_object["key"], "code": 400, "message": "rejected"
+                        }
+                    else:
+                        stub_state["created"].add(zotero_object["key"])
+                        resp["success"][str(item_index)] = zotero_object["key"]
+            resp_body = json.dumps(resp).encode("utf-8")
+        else:
+            resp_body = b"stub"
+        self.send_response(status)
+        for header_name, header_value in headers.items():
+            self.send_header(header_name, header_value)
+        self.send_header("Content-Length", str(len(resp_body)))
+        self.end_headers()
+        self.wfile.write(resp_body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def zotero_stub():
+    stub_server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), ZoteroStubHandler)
+    stub_server.daemon_threads = True
+    stub_server.stub_state = {
+        "lock": threading.Lock(),
+        "requests": [],
+        "created": set(),
+        "script": [],
+        "parent_delay": 0.0
+    }
+    stub_thread = threading.Thread(target=stub_server.serve_forever, daemon=True)
+    stub_thread.start()
+    stub_server.stub_state["items_url"] = "http://127.0.0.1:%d/users/1/items" % stub_server.server_address[1]
+    yield stub_server.stub_state
+    stub_server.shutdown()
+    stub_server.server_close()
+
+
+def zotero_items_build(note_counts, title=None):
+    """
+    params:
+    note_counts, [int, ...]. The notes of each item.
+    title, str or None. Of every item, "t<index>" if None.
+
+    return: zotero_items, [[{}, [{}, ...]], ...]
+    """
+    #
+    return [
+        [{"itemType": "book", "title": "t%d" % item_index if title is None else title},
+         [{"itemType": "note", "note": "n%d" % note_index} for note_index in range(note_count)]]
+        for item_index, note_count in enumerate(note_counts)
+    ]
+
+
+@pytest.fixture
+def zotero_items_make():
+    return zotero_items_build
@@ -0,0 +1,122 @@
+"""
+BibtexToZotero entry reading, field precedence, names and LaTeX decoding.
+"""
+
+__author__ = "Kaan Eraslan"
+__license__ = "MIT License, see LICENSE"
+
+# Packages ----------------------------------------------
+
+import io
+
+import pytest
+
+from zotBibtexJson import BibtexLatex
+from zotBibtexJson import BibtexToZotero
+
+# --------------------------------------------------------
+
+
+def bibtex_dicts(bib_text):
+    return list(BibtexToZotero.bibtex_dict_read(io.StringIO(bib_text)))
+
+
+def bibtex_item(bibtex_dict):
+    return BibtexToZotero.bibtexTozotero(dict(bibtex_dict), {})
+
+
+def test_at_sign_in_values():
+    bib_text = (
+        '@misc{a, note = {mail jane@example.org}, howpublished = "x@y.z"}\n'
+        "@book{b, title = {B}, note = {line one\n@ line two}}\n"
+    )
+    assert [bibtex_dict["ID"] for bibtex_dict in bibtex_dicts(bib_text)] == ["a", "b"]
+    note_dict, line_dict = bibtex_dicts(bib_text)
+    assert note_dict["note"] == "mail jane@example.org"
+    assert note_dict["howpublished"] == "x@y.z"
+    # whitespace, newlines included, is collapsed in values
+    assert line_dict["note"] == "line one @ line two"
+
+
+@pytest.mark.parametrize("chunk_size", [7, 65536])
+def test_last_entry_without_newline(chunk_size):
+    bib_text = "@article{a, title = {A}}\n\n@book{b, title = {B}, year = 2001}"
+    entries = list(BibtexToZotero.bibtex_entry_split(io.StringIO(bib_text), chunk_size))
+    assert entries[-1] == "@book{b, title = {B}, year = 2001}"
+    assert [bibtex_dict["title"] for bibtex_dict in bibtex_dicts(bib_text)] == ["A", "B"]
+
+
+def test_field_precedence_ignores_entry_order():
+    bibtex_dict = {
+        "type": "article", "ID": "x", "comments": "c", "notes": "n", "annote": "a",
+        "date": "2001-01", "year": "2002", "journal": "J", "booktitle": "BT"
+    }
+    reversed_dict = dict(reversed(list(bibtex_dict.items())))
+    for zotero_item in (bibtex_item(bibtex_dict), bibtex_item(reversed_dict)):
+        assert zotero_item["notes"] == "n"
+        assert zotero_item["date"] == "2002"
+        assert zotero_item["publicationTitle"] == "BT"
+
+
+def test_field_depends_on_item_type():
+    assert bibtex_item({"type": "article", "pages": "1--3", "number": "4"}) == {
+        "itemType": "journalArticle", "pages": "1-3", "creators": []
+    }
+    book_item = bibtex_item({"type": "book", "pages": "300", "number": "4"})
+    assert book_item["numPages"] == "300" and book_item["seriesNumber"] == "4"
+    report_item = bibtex_item({"type": "techreport", "number": "TR-1", "institution": "I", "school": "S"})
+    assert report_item["reportNumber"] == "TR-1" and report_item["publisher"] == "I"
+    assert bibtex_item({"type": "software", "title": "T"})["itemType"] == BibtexToZotero.bibtex_fallback_itemType
+
+
+@pytest.mark.parametrize("name_str, name_tuple", [
+    ("Doe, Jane", ("Doe", "Jane")),
+    ("{van Gogh}, Vincent", ("van Gogh", "Vincent")),
+    ("Ford, Jr., Henry", ("Ford", "Henry, Jr.")),
+    ("Jane Doe", ("Doe", "Jane")),
+    ("Ludwig van Beethoven", ("van Beethoven", "Ludwig")),
+    ("Charles Louis Xavier Joseph de la Vall{\\'e}e Poussin", ("de la Vall{\\'e}e Poussin", "Charles Louis Xavier Joseph")),
+    ("Madonna", ("Madonna", "")),
+    ("{World Health Organization}", ("World Health Organization",))
+])
+def test_name_forms(name_str, name_tuple):
+    assert BibtexToZotero.bibtex_name_parse(name_str) == name_tuple
+
+
+def test_names_split_outside_braces():
+    creators = BibtexToZotero.bibtex_names_parse(["{Barnes and Noble} and Doe, J. AND Roe, R. and others"], "editor")
+    assert creators == [
+        {"name": "Barnes and Noble", "creatorType": "editor"},
+        {"firstName": "J.", "lastName": "Doe", "creatorType": "editor"},
+        {"firstName": "R.", "lastName": "Roe", "creatorType": "editor"}
+    ]
+
+
+@pytest.mark.parametrize("latex_text, text", [
+    ('Sch{\\"o}n', "Schön"),
+    ('\\c{C}atalh\\"oy\\"uk', "Çatalhöyük"),
+    ("\\'{e}t\\'e", "été"),
+    ("\\v s", "š"),
+    ("Stra\\ss e", "Straße"),
+    ("$\\alpha$-helix", "α-helix"),
+    ("R\\&D 50\\%", "R&D 50%"),
+    ("a---b -- c", "a—b – c"),
+    ("``q''", "“q”"),
+    ("x~y", "x\u00a0y"),
+    ("{DNA} sequencing", "DNA sequencing"),
+    ("\\emph{Homo} sapiens", "Homo sapiens"),
+    ("No LaTeX here", "No LaTeX here")
+])
+def test_latex_decode(latex_text, text):
+    assert BibtexLatex.latex_decode(latex_text) == text
+
+
+def test_latex_entry_decode_keeps_verbatim_fields_and_name_braces():
+    bibtex_dict = BibtexLatex.latex_entry_decode({
+        "ID": "k{1}", "url": "http://a.org/{b}", "author": '{\\"O}zt{\\"u}rk, A. and {WHO}', "title": "{T}he"
+    })
+    assert bibtex_dict == {"ID": "k{1}", "url": "http://a.org/{b}", "author": "Öztürk, A. and {WHO}", "title": "The"}
+    assert bibtex_item(dict(bibtex_dict, type="article"))["creators"] == [
+        {"firstName": "A.", "lastName": "Öztürk", "creatorType": "author"},
+        {"name": "WHO", "creatorType": "author"}
+    ]
@@ -0,0 +1,85 @@
+"""
+BibtexParallel gives the entries, and the output, of the serial converter.
+"""
+
+__author__ = "Kaan Eraslan"
+__license__ = "MIT License, see LICENSE"
+
+# Packages ----------------------------------------------
+
+import io
+
+import pytest
+
+from zotBibtexJson import BibtexParallel
+from zotBibtexJson import BibtexToZotero
+
+# --------------------------------------------------------
+
+bibtex_nested_database = """\ufeff% a database with commented out entries
+@string{jn = "Journal of Tests"}
+@article{one,
+  title = {One},
+  journal = jn,
+  author = {Doe, Jane and {Research Group}}
+}
+@comment{
+@article{commented,
+  title = {Commented out},
+  note = {with {nested {braces}}}
+}
+}
+@preamble{"\\newcommand{\\noop}[1]{}"}
+@book{two,
+  title = {Two},
+  note = {mail me at jane@example.org
+@misc{not an entry}}
+}
+@string{pub = {Test Press}}
+@misc{three, title = "Three {"}quoted{"}", publisher = pub}
+@comment(
+@inproceedings{also_commented, title = {Hidden}}
+)
+@incollection{four, title = {Four}, year = 2020}"""
+
+
+def bibtex_serial_titles(bib_text):
+    return [zotero_dict.get("title") for zotero_dict in BibtexToZotero.bibtex_zotero_iter(io.StringIO(bib_text))]
+
+
+@pytest.fixture
+def bibtex_nested_path(tmp_path):
+    bib_path = tmp_path / "nested.bib"
+    bib_path.write_bytes(bibtex_nested_database.encode("utf-8"))
+    return str(bib_path)
+
+
+def test_entry_offsets_match_entry_split():
+    bib_buffer = bibtex_nested_database.encode("utf-8")
+    offset_entries = [
+        bib_buffer[entry_start:entry_end].decode("utf-8")
+        for bibtex_type, entry_start, entry_end in BibtexParallel.bibtex_entry_offsets(bib_buffer)
+    ]
+    assert offset_entries == list(BibtexToZotero.bibtex_entry_split(io.StringIO(bibtex_nested_database)))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 500])
+def test_scan_counts_converted_entries(chunk_size):
+    macros, range_list = BibtexParallel.bibtex_database_scan(bibtex_nested_database.encode("utf-8"), chunk_size)
+    assert len(range_list) == -(-4 // chunk_size)
+    assert macros["jn"] == "Journal of Tests"
+    assert macros["pub"] == "Test Press"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 500])
+def test_parallel_matches_serial(bibtex_nested_path, chunk_size):
+    serial_output = list(BibtexToZotero.bibtex_zotero_iter(bibtex_nested_path))
+    parallel_output = list(BibtexParallel.convert_bibtex_parallel(bibtex_nested_path, workers=2, chunk_size=chunk_size))
+    assert [zotero_dict["title"] for zotero_dict in serial_output] == ["One", "Two", 'Three "quoted"', "Four"]
+    assert parallel_output == serial_output
+
+
+def test_parallel_file_object_matches_serial(bibtex_nested_path):
+    with open(bibtex_nested_path, "r", encoding="utf-8-sig") as bib_file:
+        parallel_output = list(BibtexParallel.convert_bibtex_parallel(bib_file, workers=2, chunk_size=1))
+    assert parallel_output == list(BibtexToZotero.bibtex_zotero_iter(bibtex_nested_path))
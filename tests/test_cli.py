@@ -0,0 +1,69 @@
+"""
+The command line converter: large files over all workers, and files that
+fail on their own.
+"""
+
+__author__ = "Kaan Eraslan"
+__license__ = "MIT License, see LICENSE"
+
+# Packages ----------------------------------------------
+
+import gzip
+import json
+
+import pytest
+
+from benchmarks import corpus
+from zotJson import __main__ as cli
+
+# --------------------------------------------------------
+
+cli_bibtex_database = """@article{one, title = {One}, author = {Doe, Jane}, year = 2001}
+@book{two, title = {Two}, publisher = {Test Press}, year = 2002}
+@misc{three, title = {Three}}
+"""
+
+
+def cli_output_lines(output_path):
+    with open(output_path, "r", encoding="utf-8") as output:
+        return [json.loads(ndjson_line) for ndjson_line in output]
+
+
+@pytest.fixture
+def cli_inputs(tmp_path):
+    ris_path = tmp_path / "export.ris"
+    ris_path.write_text("".join(corpus.ris_corpus_iter(200, 0)), encoding="utf-8")
+    bib_path = tmp_path / "export.bib.gz"
+    with gzip.open(bib_path, "wt", encoding="utf-8") as bib_file:
+        bib_file.write(cli_bibtex_database)
+    return (str(ris_path), str(bib_path))
+
+
+@pytest.mark.parametrize("mapper", ["lines", "zotero", "pascal-francis"])
+def test_large_files_match_serial(cli_inputs, tmp_path, monkeypatch, mapper):
+    serial_path = str(tmp_path / "serial.ndjson")
+    parallel_path = str(tmp_path / "parallel.ndjson")
+    assert cli.main(list(cli_inputs) + ["-m", mapper, "-j", "1", "-q", "-o", serial_path]) == 0
+    monkeypatch.setattr(cli, "cli_parallel_min_bytes", 0)
+    assert cli.main(list(cli_inputs) + ["-m", mapper, "-j", "2", "-q", "-o", parallel_path]) == 0
+    assert cli_output_lines(parallel_path) == cli_output_lines(serial_path)
+    assert len(cli_output_lines(serial_path)) > 3
+
+
+def test_file_workers_threshold(cli_inputs, monkeypatch):
+    ris_path = cli_inputs[0]
+    assert cli.cli_file_workers(ris_path, 4) == 1
+    monkeypatch.setattr(cli, "cli_parallel_min_bytes", 1)
+    assert cli.cli_file_workers(ris_path, 4) == 4
+    assert cli.cli_file_workers(ris_path, 1) == 1
+
+
+@pytest.mark.parametrize("workers", ["1", "2"])
+def test_bad_file_is_reported_and_skipped(cli_inputs, tmp_path, capsys, workers):
+    bad_path = tmp_path / "latin1.ris"
+    bad_path.write_bytes("TY  - JOUR\nTI  - Café\nER  - \n".encode("latin-1"))
+    output_path = str(tmp_path / "items.ndjson")
+    exit_status = cli.main([str(bad_path), cli_inputs[1], "-j", workers, "-o", output_path])
+    assert exit_status == 1
+    assert [zotero_item["title"] for zotero_item in cli_output_lines(output_path)] == ["One", "Two", "Three"]
+    assert str(bad_path) + ": UnicodeDecodeError" in capsys.readouterr().err
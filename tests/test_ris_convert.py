@@ -0,0 +1,123 @@
+"""
+RisToZotero reading, tokenizing and item assembly.
+"""
+
+__author__ = "Kaan Eraslan"
+__license__ = "MIT License, see LICENSE"
+
+# Packages ----------------------------------------------
+
+import io
+
+import pytest
+
+from benchmarks import corpus
+from ZotRisJson import RisToZotero
+
+# --------------------------------------------------------
+
+ris_export = (
+    "\ufeffTY - JOUR\nTI - Single space\nAU - Doe, Jane\nER - \n"
+    "\n"
+    "TY  - BOOK\nTI  - A title that\n  goes on\nKW  - one\nKW  - two\n"
+    "L1  - internal-pdf://a.pdf\n  internal-pdf://b.pdf\nER  - \n"
+    "TY  - CHAP\nTI  - Not closed\nSP  - 5"
+)
+
+
+def ris_tables():
+    return (RisToZotero.type_map, RisToZotero.field_map, RisToZotero.dependent_fields)
+
+
+def test_single_space_tags_and_continuations():
+    ris_text_list = RisToZotero.ris_text_read(ris_export)
+    assert [ris_text.split("\n")[0] for ris_text in ris_text_list] == ["TY - JOUR", "TY  - BOOK", "TY  - CHAP"]
+    diagnostics = []
+    assert RisToZotero.ris_text_parse(ris_text_list[1], diagnostics) == [
+        ["TY", "BOOK"], ["TI", "A title that goes on"], ["KW", "one"], ["KW", "two"],
+        ["L1", "internal-pdf://a.pdf\ninternal-pdf://b.pdf"]
+    ]
+    assert [diagnostic["tag"] for diagnostic in diagnostics] == ["TI", "L1"]
+    assert RisToZotero.ris_text_parse(ris_text_list[0]) == [["TY", "JOUR"], ["TI", "Single space"], ["AU", "Doe, Jane"]]
+
+
+def test_orphan_lines_are_dropped():
+    diagnostics = []
+    ris_text_line_list = RisToZotero.ris_text_parse("stray line\nTY  - JOUR\nER  - ", diagnostics)
+    assert ris_text_line_list == [["TY", "JOUR"]]
+    assert diagnostics[0]["message"] == "orphan line dropped"
+
+
+def test_text_binary_and_path_inputs(tmp_path):
+    ris_path = tmp_path / "export.ris"
+    ris_path.write_bytes(ris_export.replace("\n", "\r\n").encode("utf-8"))
+    ris_text_list = RisToZotero.ris_text_read(ris_export)
+    assert list(RisToZotero.ris_record_read(str(ris_path))) == ris_text_list
+    with open(ris_path, "rb") as ris_stream:
+        assert list(RisToZotero.ris_record_read(ris_stream)) == ris_text_list
+        # the binary stream is the caller's, it is not closed
+        assert not ris_stream.closed
+    latin_export = "TY  - JOUR\nTI  - Café\nER  - \n"
+    assert list(RisToZotero.ris_record_read(io.BytesIO(latin_export.encode("latin-1")), "latin-1")) == [
+        latin_export.rstrip("\n")
+    ]
+
+
+@pytest.mark.parametrize("line_end", ["\n", "\r\n"])
+def test_offsets_match_record_read(line_end):
+    # the record without ER line, at the end of ris_export, runs to the end
+    ris_export_text = "".join(corpus.ris_corpus_iter(200, 3)) + ris_export
+    ris_buffer = ris_export_text.replace("\n", line_end).encode("utf-8")
+    offset_records = [
+        RisToZotero.ris_record_decode(ris_buffer[offset:offset + length])
+        for offset, length in RisToZotero.ris_record_offsets(ris_buffer)
+    ]
+    assert offset_records == list(RisToZotero.ris_record_read(io.BytesIO(ris_buffer)))
+    assert len(offset_records) == 203
+
+
+@pytest.mark.parametrize("risType", sorted(RisToZotero.type_map))
+def test_item_assemble_every_type(risType):
+    ris_text = (
+        "TY  - %s\nTI  - Title\nAU  - Doe, Jane\nPY  - 2001\nKW  - kw\nN1  - a note\n"
+        "UR  - http://example.org\nL1  - internal-pdf://a.pdf\nER  - " % risType
+    )
+    ris_field_table = RisToZotero.ris_field_table_get(*ris_tables())
+    itemType_value = RisToZotero.type_map[risType]
+    zotero_dict, zotero_note_list = RisToZotero.ris_item_map(ris_text, *ris_tables())
+    assert zotero_dict["itemType"] == itemType_value
+    ris_item_schema = RisToZotero.ris_item_schema_get(ris_field_table, itemType_value)
+    assert set(zotero_dict) - {"creators", "tags", "relations"} <= set(ris_item_schema)
+    assert zotero_dict[ris_field_table[("TI", itemType_value)][0]] == "Title"
+    assert zotero_dict[ris_field_table[("PY", itemType_value)][0]] == "2001"
+    creatorType = ris_field_table[("AU", itemType_value)][0][len("creators/"):]
+    assert zotero_dict["creators"] == [{"creatorType": creatorType, "lastName": "Doe", "firstName": "Jane"}]
+    assert zotero_dict["tags"] == [{"tag": "kw"}]
+    assert zotero_dict["attachments/PDF"] == ["internal-pdf://a.pdf"]
+    assert [zotero_note_dict["note"] for zotero_note_dict in zotero_note_list] == ["a note"]
+
+
+def test_item_assemble_pages_and_repeats():
+    diagnostics = []
+    zotero_dict, zotero_note_list = RisToZotero.ris_item_map(
+        "TY  - JOUR\nTI  - First\nT1  - Second\nAU  - Single Name\nSP  - 79\nEP  - 96\nER  - ",
+        *ris_tables(), diagnostics=diagnostics
+    )
+    assert zotero_dict["title"] == "First"
+    assert zotero_dict["pages"] == "79-96"
+    assert zotero_dict["creators"] == [{"creatorType": "author", "name": "Single Name"}]
+    assert {"field": "title", "message": "repeated field dropped", "text": "Second"} in diagnostics
+
+
+@pytest.mark.parametrize("page_lines, pages", [
+    ("SP  - 79\nEP  - 96", "79-96"),
+    ("EP  - 96\nSP  - 79", "79-96"),
+    ("EP  - 96\nTI  - Between\nSP  - 79\nSP  - 80", "79-96"),
+    ("SP  - 79", "79"),
+    ("EP  - 96", "96")
+])
+def test_pages_whatever_the_tag_order(page_lines, pages):
+    zotero_dict, zotero_note_list = RisToZotero.ris_item_map(
+        "TY  - JOUR\n%s\nER  - " % page_lines, *ris_tables()
+    )
+    assert zotero_dict["pages"] == pages
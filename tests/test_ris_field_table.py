@@ -0,0 +1,67 @@
+"""
+The compiled RIS field table against the staged pipeline.
+"""
+
+__author__ = "Kaan Eraslan"
+__license__ = "MIT License, see LICENSE"
+
+# Packages ----------------------------------------------
+
+from benchmarks import corpus
+from ZotRisJson import RisToZotero
+
+# --------------------------------------------------------
+
+
+def ris_tables():
+    return (RisToZotero.type_map, RisToZotero.field_map, RisToZotero.dependent_fields)
+
+
+def test_verify_test_inputs():
+    ris_text_list = [getattr(RisToZotero, "test_input_%d" % ris_test_index) for ris_test_index in range(1, 8)]
+    mismatch_list, skipped_list = RisToZotero.ris_field_table_verify(ris_text_list, *ris_tables())
+    assert mismatch_list == []
+    assert len(skipped_list) < len(ris_text_list)
+
+
+def test_verify_generated_corpus():
+    ris_text_list = RisToZotero.ris_text_read("".join(corpus.ris_corpus_iter(3000, 0)))
+    mismatch_list, skipped_list = RisToZotero.ris_field_table_verify(ris_text_list, *ris_tables())
+    assert mismatch_list == []
+    # the staged pipeline raises on the plain string dependent fields, see below
+    assert len(skipped_list) < len(ris_text_list) // 5
+
+
+def test_plain_string_dependent_fields():
+    # the tags the staged pipeline can not map, checked against the maps themselves
+    ris_types, ris_Indep_fields, ris_Dep_fields = ris_tables()
+    ris_field_table = RisToZotero.ris_field_table_get(ris_types, ris_Indep_fields, ris_Dep_fields)
+    plain_tags = [
+        risTag for risTag, dependent_field in ris_Dep_fields.items()
+        if isinstance(dependent_field, str) and dependent_field not in ris_Dep_fields
+    ]
+    assert len(plain_tags) > 0
+    for itemType_value in set(ris_types.values()):
+        for risTag in plain_tags:
+            if risTag in ris_Indep_fields:
+                continue
+            zoteroField = RisToZotero.ris_drop_field if risTag == "ID" else ris_Dep_fields[risTag]
+            assert ris_field_table[(risTag, itemType_value)] == (zoteroField, False)
+
+
+def test_line_after_dropped_line_is_mapped():
+    ris_text = "TY  - JOUR\nID  - 3\nTI  - After the ID\nER  - \n"
+    ris_p_dict = RisToZotero.ris_p_dict_map(ris_text, *ris_tables())
+    assert {"title": "After the ID"} in ris_p_dict or ["title", "After the ID"] in ris_p_dict
+    mismatch_list, skipped_list = RisToZotero.ris_field_table_verify([ris_text], *ris_tables())
+    assert mismatch_list == [] and skipped_list == []
+
+
+def test_field_table_cache_is_bounded():
+    ris_types, ris_Indep_fields, ris_Dep_fields = ris_tables()
+    for copy_index in range(RisToZotero.ris_field_table_cache_size + 4):
+        RisToZotero.ris_field_table_get(dict(ris_types), ris_Indep_fields, ris_Dep_fields)
+    assert len(RisToZotero.ris_field_tables) <= RisToZotero.ris_field_table_cache_size
+    book_types = dict(ris_types, JOUR="book")
+    ris_p_dict = RisToZotero.ris_p_dict_map("TY  - JOUR\nER  - \n", book_types, ris_Indep_fields, ris_Dep_fields)
+    assert ris_p_dict[0] == {"itemType": "book"}
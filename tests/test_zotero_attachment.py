@@ -0,0 +1,74 @@
+"""
+ZoteroAttachment attachment items and cached file hashes.
+"""
+
+__author__ = "Kaan Eraslan"
+__license__ = "MIT License, see LICENSE"
+
+# Packages ----------------------------------------------
+
+import hashlib
+import os
+
+from zotJson import ZoteroAttachment
+from zotJson import ZoteroCache
+
+# --------------------------------------------------------
+
+
+def attachment_run(attachment_root, cache, attachment_paths):
+    attachment_report = ZoteroAttachment.attachment_report_make()
+    diagnostics = []
+    zotero_items = [
+        {"itemType": "book", "title": "t%d" % path_index, "attachments/PDF": [attachment_path]}
+        for path_index, attachment_path in enumerate(attachment_paths)
+    ]
+    zotero_items = list(ZoteroAttachment.attachment_stage(
+        zotero_items, attachment_root, cache, attachment_report, workers=2, diagnostics=diagnostics
+    ))
+    return (zotero_items, attachment_report, diagnostics)
+
+
+def test_hashes_are_cached(tmp_path):
+    pdf_folder = tmp_path / "PDF"
+    (pdf_folder / "1").mkdir(parents=True)
+    (pdf_folder / "1" / "a.pdf").write_bytes(b"%PDF a")
+    (pdf_folder / "b.pdf").write_bytes(b"%PDF b" * 100000)
+    attachment_paths = ["internal-pdf://1/a.pdf", "b.pdf"]
+    cache = ZoteroCache.cache_open(str(tmp_path / "attachments.sqlite"))
+    try:
+        zotero_items, attachment_report, diagnostics = attachment_run(str(pdf_folder), cache, attachment_paths)
+        assert (attachment_report["hashed"], attachment_report["cached"]) == (2, 0)
+        attachment_dicts = [zotero_item[1][0] for zotero_item in zotero_items]
+        assert [attachment_dict["md5"] for attachment_dict in attachment_dicts] == [
+            hashlib.md5(b"%PDF a").hexdigest(), hashlib.md5(b"%PDF b" * 100000).hexdigest()
+        ]
+        assert "attachments/PDF" not in zotero_items[0][0]
+        assert attachment_report["files"][attachment_dicts[0]["key"]] == str(pdf_folder / "1" / "a.pdf")
+        #
+        zotero_items, attachment_report, diagnostics = attachment_run(str(pdf_folder), cache, attachment_paths)
+        assert (attachment_report["hashed"], attachment_report["cached"]) == (0, 2)
+        assert [zotero_item[1][0]["md5"] for zotero_item in zotero_items] == [
+            attachment_dict["md5"] for attachment_dict in attachment_dicts
+        ]
+        # a changed file is read again
+        (pdf_folder / "b.pdf").write_bytes(b"%PDF changed")
+        file_stat = os.stat(pdf_folder / "b.pdf")
+        os.utime(pdf_folder / "b.pdf", ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 10 ** 9))
+        zotero_items, attachment_report, diagnostics = attachment_run(str(pdf_folder), cache, attachment_paths)
+        assert (attachment_report["hashed"], attachment_report["cached"]) == (1, 1)
+        assert zotero_items[1][1][0]["md5"] == hashlib.md5(b"%PDF changed").hexdigest()
+    finally:
+        ZoteroCache.cache_close(cache)
+
+
+def test_urls_and_missing_files(tmp_path):
+    zotero_items, attachment_report, diagnostics = attachment_run(
+        str(tmp_path), None, ["https://example.org/a.pdf", "doi:10.1000/x", "missing.pdf"]
+    )
+    assert [zotero_item[1][0]["url"] for zotero_item in zotero_items[:2]] == [
+        "https://example.org/a.pdf", "https://doi.org/10.1000/x"
+    ]
+    assert zotero_items[2][1] == []
+    assert (attachment_report["links"], attachment_report["missing"]) == (2, 1)
+    assert [diagnostic["text"] for diagnostic in diagnostics] == ["missing.pdf"]
@@ -0,0 +1,61 @@
+"""
+ZoteroBatch planning, and sending the planned batches to the stub Zotero
+server of conftest.py.
+"""
+
+__author__ = "Kaan Eraslan"
+__license__ = "MIT License, see LICENSE"
+
+# Packages ----------------------------------------------
+
+from zotJson import ZoteroBatch
+
+# --------------------------------------------------------
+
+
+def test_plan_keeps_notes_with_their_parent(zotero_items_make):
+    zotero_batches = list(ZoteroBatch.zotero_batch_plan(zotero_items_make([3, 0, 10, 40, 1, 48])))
+    assert [len(zotero_batch["items"]) for zotero_batch in zotero_batches] == [16, 43, 49]
+    assert len(set(zotero_batch["token"] for zotero_batch in zotero_batches)) == 3
+    for zotero_batch in zotero_batches:
+        assert "after" not in zotero_batch
+        batch_keys = set(zotero_object["key"] for zotero_object in zotero_batch["items"])
+        for zotero_object in zotero_batch["items"]:
+            assert zotero_object.get("parentItem", zotero_object["key"]) in batch_keys
+
+
+def test_plan_spills_large_parents(zotero_items_make):
+    zotero_batches = list(ZoteroBatch.zotero_batch_plan(zotero_items_make([2, 120, 1])))
+    assert [len(zotero_batch["items"]) for zotero_batch in zotero_batches] == [3, 50, 50, 23]
+    parent_batch = zotero_batches[1]
+    assert "parentItem" not in parent_batch["items"][0]
+    assert [zotero_batch.get("after") for zotero_batch in zotero_batches] == [
+        None, None, parent_batch["token"], parent_batch["token"]
+    ]
+
+
+def test_plan_batch_size(zotero_items_make):
+    zotero_batches = list(ZoteroBatch.zotero_batch_plan(zotero_items_make([0] * 25), batch_size=10))
+    assert [len(zotero_batch["items"]) for zotero_batch in zotero_batches] == [10, 10, 5]
+
+
+def test_send_planned_batches(zotero_stub, zotero_items_make):
+    zotero_items = zotero_items_make([1] * 100)
+    failed_list = []
+    for zotero_batch in ZoteroBatch.zotero_batch_plan(zotero_items):
+        resp = ZoteroBatch.zotero_batch_send(zotero_batch, zotero_stub["items_url"], "key")
+        failed_list.extend(ZoteroBatch.zotero_batch_failed(resp, zotero_batch))
+    # a parent and its note go in one request, not one round trip each
+    assert len(zotero_stub["requests"]) == 4
+    assert failed_list == []
+    assert len(zotero_stub["created"]) == 200
+
+
+def test_send_reports_failed_items(zotero_stub, zotero_items_make):
+    zotero_items = zotero_items_make([0, 0])
+    zotero_items[1][0]["title"] = "rejected"
+    zotero_batch = next(ZoteroBatch.zotero_batch_plan(zotero_items))
+    resp = ZoteroBatch.zotero_batch_send(zotero_batch, zotero_stub["items_url"], "key")
+    failed_list = ZoteroBatch.zotero_batch_failed(resp, zotero_batch)
+    assert [zotero_object["title"] for zotero_object, failure in failed_list] == ["rejected"]
+    assert [failure["code"] for zotero_object, failure in failed_list] == [400]
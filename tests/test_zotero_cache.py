@@ -0,0 +1,86 @@
+"""
+ZoteroCache hits, misses, keys and eviction.
+"""
+
+__author__ = "Kaan Eraslan"
+__license__ = "MIT License, see LICENSE"
+
+# Packages ----------------------------------------------
+
+import time
+
+import pytest
+
+from ZotRisJson import RisToZotero
+from zotJson import ZoteroCache
+
+# --------------------------------------------------------
+
+cache_records = [
+    "TY  - JOUR\nTI  - One\nER  - ",
+    "TY  - BOOK\nTI  - Two\nER  - ",
+    "TY  - CHAP\nTI  - Three\nER  - "
+]
+
+
+def ris_convert(ris_text):
+    return RisToZotero.ris_item_map(ris_text, RisToZotero.type_map, RisToZotero.field_map, RisToZotero.dependent_fields)
+
+
+@pytest.fixture
+def cache():
+    cache = ZoteroCache.cache_open(":memory:")
+    yield cache
+    ZoteroCache.cache_close(cache)
+
+
+def cache_run(cache, raw_text_list, converter_version=1):
+    return list(ZoteroCache.cache_convert_iter(
+        cache, raw_text_list, ris_convert, RisToZotero.ris_tables_version(), "ris_item_map", converter_version
+    ))
+
+
+def test_miss_then_hit(cache):
+    first_items = cache_run(cache, cache_records)
+    cache_stats = ZoteroCache.cache_stats(cache)
+    assert (cache_stats["hits"], cache_stats["misses"], cache_stats["entries"]) == (0, 3, 3)
+    assert cache_run(cache, cache_records) == first_items == [ris_convert(ris_text) for ris_text in cache_records]
+    assert (cache["hits"], cache["misses"]) == (3, 3)
+
+
+def test_key_ignores_line_endings_but_not_versions(cache):
+    cache_run(cache, cache_records[:1])
+    cache_run(cache, [cache_records[0].replace("\n", "\r\n") + "\n\n"])
+    assert (cache["hits"], cache["misses"]) == (1, 1)
+    cache_run(cache, cache_records[:1], converter_version=2)
+    assert (cache["hits"], cache["misses"]) == (1, 2)
+    assert ZoteroCache.cache_key_make("a", "v1", "c", 1) != ZoteroCache.cache_key_make("a", "v2", "c", 1)
+
+
+def test_least_recently_used_are_evicted():
+    cache = ZoteroCache.cache_open(":memory:", max_entries=2)
+    try:
+        cache_run(cache, cache_records[:2])
+        time.sleep(0.01)
+        # One is used again, Two is now the least recently used
+        cache_run(cache, cache_records[:1])
+        time.sleep(0.01)
+        cache_run(cache, cache_records[2:])
+        assert ZoteroCache.cache_evict(cache) == 1
+        cache["hits"] = cache["misses"] = 0
+        cache_run(cache, [cache_records[0], cache_records[2]])
+        assert (cache["hits"], cache["misses"]) == (2, 0)
+        cache_run(cache, cache_records[1:2])
+        assert cache["misses"] == 1
+    finally:
+        ZoteroCache.cache_close(cache)
+
+
+def test_evict_by_bytes():
+    cache = ZoteroCache.cache_open(":memory:", max_entries=None, max_bytes=1)
+    try:
+        cache_run(cache, cache_records)
+        ZoteroCache.cache_evict(cache)
+        assert ZoteroCache.cache_stats(cache)["entries"] == 0
+    finally:
+        ZoteroCache.cache_close(cache)
@@ -0,0 +1,99 @@
+"""
+ZoteroDedup blocking and matching on items converted from RIS and BibTeX.
+"""
+
+__author__ = "Kaan Eraslan"
+__license__ = "MIT License, see LICENSE"
+
+# Packages ----------------------------------------------
+
+import io
+import statistics
+
+from zotBibtexJson import BibtexToZotero
+from ZotRisJson import RisToZotero
+from zotJson import ZoteroDedup
+
+# --------------------------------------------------------
+
+dedup_pairs = [
+    (
+        "TY  - JOUR\nTI  - The Hittite kingdom and the Anatolian plateau in the Late Bronze Age\n"
+        "AU  - Bryce, Trevor\nPY  - 2005\nER  - \n",
+        "@article{bryce05, title = {The {Hittite} Kingdom and the {A}natolian Plateau in the late {Bronze} Age},"
+        " author = {Bryce, Trevor}, year = 2005}"
+    ),
+    (
+        "TY  - BOOK\nTI  - Settlement patterns of the Konya plain during the Chalcolithic period\n"
+        "AU  - Baird, Douglas\nPY  - 1996\nER  - \n",
+        "@book{baird96, title = {Settlement patterns of the {K}onya plain during the {C}halcolithic},"
+        " author = {Douglas Baird}, year = {1996}}"
+    ),
+    (
+        "TY  - CHAP\nTI  - Schöne Gefäße aus Çatalhöyük und ihre Datierung\n"
+        "AU  - Mellaart, James\nPY  - 1967\nER  - \n",
+        "@incollection{mellaart67, title = {Sch{\\\"o}ne Gef{\\\"a}{\\ss}e aus {\\c{C}}atalh{\\\"o}y{\\\"u}k und ihre Datierung},"
+        " author = {Mellaart, J.}, year = 1967}"
+    )
+]
+dedup_distinct_titles = [
+    "Radiocarbon chronology of the Neolithic levels at Mersin Yumuktepe",
+    "Obsidian sourcing and exchange networks in central Anatolia",
+    "Textile production tools from the Iron Age citadel of Gordion",
+    "Water management and irrigation in Urartian fortresses"
+]
+
+
+def dedup_pair_items(ris_text, bibtex_entry):
+    ris_item = RisToZotero.ris_item_map(
+        ris_text, RisToZotero.type_map, RisToZotero.field_map, RisToZotero.dependent_fields
+    )
+    bibtex_item = next(BibtexToZotero.bibtex_zotero_iter(io.StringIO(bibtex_entry)))
+    return (ris_item, bibtex_item)
+
+
+def dedup_band_keys(zotero_item):
+    item_fields = ZoteroDedup.dedup_item_fields(zotero_item)
+    return set(ZoteroDedup.dedup_minhash_bands(item_fields["title"], 8, 4))
+
+
+def test_near_duplicates_share_a_block():
+    for ris_text, bibtex_entry in dedup_pairs:
+        ris_item, bibtex_item = dedup_pair_items(ris_text, bibtex_entry)
+        assert len(dedup_band_keys(ris_item) & dedup_band_keys(bibtex_item)) > 0
+
+
+def test_distinct_records_do_not_share_a_block():
+    zotero_items = [{"itemType": "journalArticle", "title": title} for title in dedup_distinct_titles]
+    zotero_items.extend(item for ris_text, bibtex_entry in dedup_pairs for item in dedup_pair_items(ris_text, bibtex_entry)[:1])
+    band_key_sets = [dedup_band_keys(zotero_item) for zotero_item in zotero_items]
+    for index_a in range(len(band_key_sets)):
+        for index_b in range(index_a + 1, len(band_key_sets)):
+            assert len(band_key_sets[index_a] & band_key_sets[index_b]) == 0
+
+
+def test_report_clusters_the_pairs_only():
+    zotero_items = []
+    for ris_text, bibtex_entry in dedup_pairs:
+        zotero_items.extend(dedup_pair_items(ris_text, bibtex_entry))
+    zotero_items.extend({"itemType": "journalArticle", "title": title} for title in dedup_distinct_titles)
+    report = ZoteroDedup.dedup_report(zotero_items)
+    assert sorted(cluster["items"] for cluster in report["clusters"]) == [[0, 1], [2, 3], [4, 5]]
+    assert all(cluster["reasons"] == ["title"] for cluster in report["clusters"])
+
+
+def test_signature_agreement_estimates_jaccard():
+    # two sets of 20 words sharing 10, Jaccard index 1/3
+    agreement_list = []
+    for set_index in range(400):
+        words = ["w%d_%d" % (set_index, word_index) for word_index in range(30)]
+        signatures = [
+            list(map(min, zip(*[ZoteroDedup.dedup_word_signature(word) for word in word_list])))
+            for word_list in (words[:20], words[10:])
+        ]
+        agreement_list.append(
+            sum(hash_a == hash_b for hash_a, hash_b in zip(*signatures)) / ZoteroDedup.dedup_hash_count
+        )
+    assert abs(statistics.mean(agreement_list) - 1 / 3) < 0.02
+    # independent hashes spread as a binomial, sqrt(1/3 * 2/3 / 32) = 0.083
+    assert 0.06 < statistics.pstdev(agreement_list) < 0.11
@@ -0,0 +1,82 @@
+"""
+ZoteroManifest incremental diffs over several runs.
+"""
+
+__author__ = "Kaan Eraslan"
+__license__ = "MIT License, see LICENSE"
+
+# Packages ----------------------------------------------
+
+import pytest
+
+from zotJson import ZoteroManifest
+
+# --------------------------------------------------------
+
+
+def manifest_run(identified_items, manifest, identities=None):
+    new_manifest = ZoteroManifest.manifest_new()
+    diff_dict = ZoteroManifest.manifest_diff(identified_items, manifest, new_manifest, identities)
+    return (diff_dict, new_manifest)
+
+
+def manifest_items_make(second_title="B"):
+    return [
+        ("SN:1", {"itemType": "book", "title": "A"}),
+        ("SN:1", {"itemType": "book", "title": second_title}),
+        (None, {"itemType": "book", "title": "No identity"}),
+        (None, {"itemType": "book", "title": "No identity"}),
+        ("DO:x", [{"itemType": "book", "title": "C"}, [{"itemType": "note", "note": "1"}, {"itemType": "note", "note": "2"}]])
+    ]
+
+
+def test_first_run_records_every_item():
+    diff_dict, new_manifest = manifest_run(manifest_items_make(), ZoteroManifest.manifest_new())
+    assert len(diff_dict["new"]) == 5
+    assert diff_dict["collisions"] == {"SN:1": 2}
+    assert len(new_manifest["items"]) == 5
+    assert "SN:1#1" in new_manifest["items"] and "SN:1#2" in new_manifest["items"]
+
+
+def test_rerun_is_unchanged():
+    diff_dict, manifest = manifest_run(manifest_items_make(), ZoteroManifest.manifest_new())
+    diff_dict, new_manifest = manifest_run(manifest_items_make(), manifest)
+    assert diff_dict["new"] == [] and diff_dict["changed"] == [] and diff_dict["deleted"] == []
+    assert new_manifest["items"] == manifest["items"]
+
+
+def test_colliding_item_changes_in_place():
+    diff_dict, manifest = manifest_run(manifest_items_make(), ZoteroManifest.manifest_new())
+    diff_dict, new_manifest = manifest_run(manifest_items_make("B2"), manifest)
+    assert [(identity, zotero_item["title"]) for identity, zotero_item in diff_dict["changed"]] == [("SN:1#2", "B2")]
+    assert diff_dict["changed"][0][1]["key"] == manifest["items"]["SN:1#2"]["key"]
+    assert diff_dict["new"] == [] and diff_dict["deleted"] == []
+
+
+def test_removed_notes_are_deleted():
+    diff_dict, manifest = manifest_run(manifest_items_make(), ZoteroManifest.manifest_new())
+    identified_items = manifest_items_make()
+    identified_items[4][1][1].pop()
+    diff_dict, new_manifest = manifest_run(identified_items, manifest)
+    assert [identity for identity, zotero_item in diff_dict["changed"]] == ["DO:x"]
+    assert diff_dict["deleted"] == [("DO:x", {"key": manifest["items"]["DO:x"]["notes"][1]})]
+
+
+def test_removed_item_is_deleted():
+    diff_dict, manifest = manifest_run(manifest_items_make(), ZoteroManifest.manifest_new())
+    diff_dict, new_manifest = manifest_run(manifest_items_make()[:4], manifest)
+    assert diff_dict["deleted"] == [("DO:x", {"key": manifest["items"]["DO:x"]["key"]})]
+
+
+def test_streamed_items_with_identities():
+    identified_items = manifest_items_make()
+    diff_dict, manifest = manifest_run(
+        iter(identified_items), ZoteroManifest.manifest_new(), identities=iter([identity for identity, item in identified_items])
+    )
+    assert len(diff_dict["new"]) == 5
+    assert diff_dict["collisions"] == {"SN:1": 2}
+
+
+def test_generator_without_identities_is_refused():
+    with pytest.raises(TypeError):
+        manifest_run(iter(manifest_items_make()), ZoteroManifest.manifest_new())
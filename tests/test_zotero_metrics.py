@@ -0,0 +1,61 @@
+"""
+ZoteroMetrics stage counters, and the memory traced with tracemalloc.
+"""
+
+__author__ = "Kaan Eraslan"
+__license__ = "MIT License, see LICENSE"
+
+# Packages ----------------------------------------------
+
+import tracemalloc
+
+from ZotRisJson import RisToZotero
+from zotJson import ZoteroMetrics
+
+# --------------------------------------------------------
+
+metrics_kept = []
+
+
+def test_peak_and_retained_bytes():
+    ZoteroMetrics.metrics_enable(track_allocations=True)
+    try:
+        metrics_token = ZoteroMetrics.metrics_stage_start()
+        metrics_kept.append(bytearray(1 << 20))
+        metrics_token = ZoteroMetrics.metrics_stage_end("kept", metrics_token, 1)
+        freed_buffer = bytearray(1 << 20)
+        del freed_buffer
+        ZoteroMetrics.metrics_stage_end("freed", metrics_token, 1)
+    finally:
+        metrics_state = ZoteroMetrics.metrics_disable()
+        metrics_kept.clear()
+    assert not tracemalloc.is_tracing()
+    kept_metrics, freed_metrics = metrics_state["stages"]["kept"], metrics_state["stages"]["freed"]
+    assert kept_metrics["retained_bytes"] >= 1 << 20
+    assert freed_metrics["peak_bytes"] >= 1 << 20
+    assert abs(freed_metrics["retained_bytes"]) < 1 << 16
+
+
+def test_converter_stages():
+    ZoteroMetrics.metrics_enable(track_allocations=True)
+    try:
+        RisToZotero.ris_p_dict_map(
+            RisToZotero.test_input_1, RisToZotero.type_map, RisToZotero.field_map, RisToZotero.dependent_fields
+        )
+        prometheus_text = ZoteroMetrics.metrics_prometheus()
+    finally:
+        metrics_state = ZoteroMetrics.metrics_disable()
+    assert set(metrics_state["stages"]) == {"ris_record_parse", "ris_record_map", "ris_record_lines"}
+    assert all(stage_metrics["records"] == 1 for stage_metrics in metrics_state["stages"].values())
+    assert 'zotero_stage_peak_bytes{stage="ris_record_parse"}' in prometheus_text
+    assert "allocated_blocks" not in prometheus_text
+
+
+def test_tracing_started_elsewhere_is_left_on():
+    tracemalloc.start()
+    try:
+        ZoteroMetrics.metrics_enable(track_allocations=True)
+        ZoteroMetrics.metrics_disable()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
@@ -0,0 +1,42 @@
+"""
+ZoteroParallel keeps a few file maps open per worker, and closes the rest.
+"""
+
+__author__ = "Kaan Eraslan"
+__license__ = "MIT License, see LICENSE"
+
+# Packages ----------------------------------------------
+
+import os
+
+from zotJson import ZoteroParallel
+
+# --------------------------------------------------------
+
+
+def test_mmap_cache_is_bounded(tmp_path):
+    path_list = []
+    for path_index in range(ZoteroParallel.parallel_mmap_cache_size + 2):
+        file_path = tmp_path / ("%d.ris" % path_index)
+        file_path.write_bytes(b"TY  - JOUR\n" * (path_index + 1))
+        path_list.append(str(file_path))
+    file_buffers = [ZoteroParallel.parallel_mmap_open(path) for path in path_list]
+    assert len(ZoteroParallel.parallel_mmap_cache) == ZoteroParallel.parallel_mmap_cache_size
+    assert [file_buffer.closed for file_buffer in file_buffers] == [True, True, False, False]
+    assert ZoteroParallel.parallel_mmap_open(path_list[-1]) is file_buffers[-1]
+    assert ZoteroParallel.parallel_mmap_open(path_list[-1])[:11] == b"TY  - JOUR\n"
+
+
+def test_changed_file_is_mapped_again(tmp_path):
+    file_path = tmp_path / "export.bib"
+    file_path.write_bytes(b"@misc{a}")
+    file_buffer = ZoteroParallel.parallel_mmap_open(str(file_path))
+    file_path.write_bytes(b"@misc{a, title = {changed}}")
+    file_stat = os.stat(file_path)
+    os.utime(file_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 10 ** 9))
+    changed_buffer = ZoteroParallel.parallel_mmap_open(str(file_path))
+    assert file_buffer.closed
+    assert changed_buffer[:] == b"@misc{a, title = {changed}}"
+    file_path.write_bytes(b"")
+    assert ZoteroParallel.parallel_mmap_open(str(file_path)) == b""
+    assert changed_buffer.closed
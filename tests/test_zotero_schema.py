@@ -0,0 +1,73 @@
+"""
+ZoteroSchema fixes the fields Zotero would reject for the item type.
+"""
+
+__author__ = "Kaan Eraslan"
+__license__ = "MIT License, see LICENSE"
+
+# Packages ----------------------------------------------
+
+from ZotRisJson import RisToZotero
+from zotJson import ZoteroSchema
+
+# --------------------------------------------------------
+
+
+def schema_validate(zotero_item, strip=False):
+    schema_report = ZoteroSchema.schema_report_make()
+    zotero_item = ZoteroSchema.schema_item_validate(zotero_item, ZoteroSchema.schema_index_load(), schema_report, strip)
+    return (zotero_item, schema_report["fields"])
+
+
+def test_base_fields_are_relocated():
+    zotero_item, report_fields = schema_validate({"itemType": "bookSection", "title": "T", "publicationTitle": "Book"})
+    assert zotero_item == {"itemType": "bookSection", "title": "T", "bookTitle": "Book"}
+    assert report_fields == {"publicationTitle": {"relocated": 1}}
+    zotero_item, report_fields = schema_validate({"itemType": "thesis", "publisher": "University"})
+    assert zotero_item == {"itemType": "thesis", "university": "University"}
+
+
+def test_relocation_keeps_the_field_of_the_type():
+    zotero_item, report_fields = schema_validate(
+        {"itemType": "bookSection", "bookTitle": "Kept", "publicationTitle": "Moved"}
+    )
+    assert zotero_item == {"itemType": "bookSection", "bookTitle": "Kept", "extra": "publicationTitle: Moved"}
+    assert report_fields == {"publicationTitle": {"extra": 1}}
+
+
+def test_rejected_fields_go_to_extra_or_are_stripped():
+    zotero_item, report_fields = schema_validate(
+        {"itemType": "journalArticle", "title": "T", "bogus": "v", "extra": "kept", "attachments/PDF": ["a.pdf"]}
+    )
+    assert zotero_item == {"itemType": "journalArticle", "title": "T", "extra": "kept\nbogus: v"}
+    assert report_fields == {"bogus": {"extra": 1}, "attachments/PDF": {"stripped": 1}}
+    zotero_item, report_fields = schema_validate({"itemType": "journalArticle", "title": "T", "bogus": "v"}, strip=True)
+    assert zotero_item == {"itemType": "journalArticle", "title": "T"}
+    assert report_fields == {"bogus": {"stripped": 1}}
+
+
+def test_notes_tags_creators_and_item_type():
+    zotero_item, report_fields = schema_validate({
+        "itemType": "book", "notes": "a note", "tags": "a; b, c",
+        "creators": [{"creatorType": "inventor", "name": "E"}]
+    })
+    zotero_dict, zotero_note_list = zotero_item
+    assert [zotero_note_dict["note"] for zotero_note_dict in zotero_note_list] == ["a note"]
+    assert zotero_dict["tags"] == [{"tag": "a"}, {"tag": "b"}, {"tag": "c"}]
+    assert zotero_dict["creators"] == [{"creatorType": "contributor", "name": "E"}]
+    zotero_item, report_fields = schema_validate({"itemType": "nope", "title": "T"})
+    assert zotero_item == {"itemType": "document", "title": "T", "extra": "itemType: nope"}
+    zotero_item, report_fields = schema_validate([{"itemType": "book"}, [{"itemType": "note", "note": "x", "title": "t"}]])
+    assert zotero_item == [{"itemType": "book"}, [{"itemType": "note", "note": "x"}]]
+    assert report_fields == {"note/title": {"stripped": 1}}
+
+
+def test_ris_items_pass_after_validation():
+    ris_text = "TY  - CHAP\nTI  - T\nT2  - Book\nAU  - Doe, J\nN1  - n\nL1  - a.pdf\nER  - "
+    zotero_item = RisToZotero.ris_item_map(ris_text, RisToZotero.type_map, RisToZotero.field_map, RisToZotero.dependent_fields)
+    zotero_item, report_fields = schema_validate(zotero_item)
+    item_fields = ZoteroSchema.schema_index_load()["itemTypes"]["bookSection"]["fields"]
+    assert item_fields.issuperset(zotero_item[0])
+    assert zotero_item[0]["bookTitle"] == "Book"
+    zotero_item, report_fields = schema_validate(zotero_item)
+    assert report_fields == {}
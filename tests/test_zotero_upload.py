@@ -0,0 +1,116 @@
+"""
+ZoteroUpload against the stub Zotero server of conftest.py.
+"""
+
+__author__ = "Kaan Eraslan"
+__license__ = "MIT License, see LICENSE"
+
+# Packages ----------------------------------------------
+
+import threading
+import time
+
+import pytest
+
+from zotJson import ZoteroUpload
+
+# --------------------------------------------------------
+
+
+def test_upload_all_batches(zotero_stub, zotero_items_make):
+    summary = ZoteroUpload.zotero_upload_run(
+        zotero_items_make([1] * 120), zotero_stub["items_url"], "key", concurrency=4
+    )
+    assert summary["batches"] == 5
+    assert len(summary["success"]) == 240
+    assert summary["failed"] == []
+    assert summary["retries"] == 0
+
+
+def test_retry_after_pauses(zotero_stub, zotero_items_make):
+    zotero_stub["script"] = [(429, {"Retry-After": "0.5"})]
+    start = time.monotonic()
+    summary = ZoteroUpload.zotero_upload_run(
+        zotero_items_make([0] * 100), zotero_stub["items_url"], "key", concurrency=1
+    )
+    requests = zotero_stub["requests"]
+    assert summary["retries"] == 1
+    assert len(summary["success"]) == 100
+    assert time.monotonic() - start >= 0.5
+    # nothing is sent while the pause lasts
+    assert all(request["time"] - requests[0]["time"] >= 0.45 for request in requests[1:])
+    # the retry keeps its write token
+    assert requests[0]["token"] in [request["token"] for request in requests[1:]]
+
+
+def test_backoff_pauses_on_success(zotero_stub, zotero_items_make):
+    zotero_stub["script"] = [(200, {"Backoff": "0.5"})]
+    summary = ZoteroUpload.zotero_upload_run(
+        zotero_items_make([0] * 100), zotero_stub["items_url"], "key", concurrency=1
+    )
+    requests = zotero_stub["requests"]
+    assert summary["retries"] == 0
+    assert len(requests) == 2
+    assert requests[1]["time"] - requests[0]["time"] >= 0.45
+
+
+def test_used_write_token_is_not_an_error(zotero_stub, zotero_items_make):
+    zotero_stub["script"] = [(412, {})]
+    summary = ZoteroUpload.zotero_upload_run(
+        zotero_items_make([0] * 10), zotero_stub["items_url"], "key", concurrency=1
+    )
+    assert summary["batches"] == 1
+    assert summary["success"] == {}
+    assert summary["failed"] == []
+
+
+def test_failing_status_raises(zotero_stub, zotero_items_make):
+    zotero_stub["script"] = [(403, {})]
+    with pytest.raises(ZoteroUpload.ZoteroUploadError):
+        ZoteroUpload.zotero_upload_run(zotero_items_make([0] * 10), zotero_stub["items_url"], "key")
+
+
+def test_retries_run_out(zotero_stub, zotero_items_make):
+    zotero_stub["script"] = [(503, {"Retry-After": "0.01"})] * 3
+    with pytest.raises(ZoteroUpload.ZoteroUploadError):
+        ZoteroUpload.zotero_upload_run(zotero_items_make([0] * 10), zotero_stub["items_url"], "key", max_retries=2)
+
+
+def test_spilled_notes_wait_for_their_parent(zotero_stub, zotero_items_make):
+    zotero_stub["parent_delay"] = 0.3
+    summary = ZoteroUpload.zotero_upload_run(
+        zotero_items_make([120, 1, 1, 1]), zotero_stub["items_url"], "key", concurrency=4
+    )
+    assert summary["failed"] == []
+    assert len(summary["success"]) == 121 + 6
+    for request in zotero_stub["requests"]:
+        for zotero_object in request["items"]:
+            if "parentItem" in zotero_object and zotero_object["parentItem"] not in [
+                parent_object["key"] for parent_object in request["items"]
+            ]:
+                assert zotero_object["parentItem"] in request["created"]
+
+
+def test_notes_of_a_failed_parent_are_not_sent(zotero_stub, zotero_items_make):
+    summary = ZoteroUpload.zotero_upload_run(
+        zotero_items_make([120], title="rejected"), zotero_stub["items_url"], "key", concurrency=2
+    )
+    assert len(zotero_stub["requests"]) == 1
+    assert len(summary["failed"]) == 121
+    # the 71 notes that spilled out of the batch of their parent
+    assert sum(failure["message"].startswith("parentItem") for zotero_object, failure in summary["failed"]) == 71
+
+
+def test_converter_runs_off_the_event_loop(zotero_stub, zotero_items_make):
+    converter_threads = set()
+
+    def zotero_items_convert():
+        for zotero_item in zotero_items_make([1] * 120):
+            converter_threads.add(threading.current_thread())
+            yield zotero_item
+
+    summary = ZoteroUpload.zotero_upload_run(
+        zotero_items_convert(), zotero_stub["items_url"], "key", concurrency=2
+    )
+    assert len(summary["success"]) == 240
+    assert threading.main_thread() not in converter_threads
@@ -0,0 +1,296 @@
+"""
+LaTeX to Unicode decoding of BibTeX field values.
+
+Accents (\\"o, {\\"o}, \\'{e}, \\v s, \\c{c}), letters and symbols (\\ss,
+\\o, \\aa, \\textemdash, \\alpha), escapes (\\&, \\%), ligatures (---,
+--, ``, '') and the ~ tie are replaced in one pass by a single regular
+expression alternation, built on first use from the tables below. The
+accented letters are precomposed then, with unicodedata. Formatting
+commands like \\emph{...} keep their content, and the remaining braces
+and $ are dropped, except in names, where bibtex_names_parse needs the
+braces of "{World Health Organization}".
+
+Values without any LaTeX are returned as they are after a few substring
+tests; the others are memoised, journal names and publishers repeat a
+lot.
+
+    bibtex_dict = latex_entry_decode(bibtex_dict)
+"""
+
+__author__ = "Kaan Eraslan"
+__license__ = "MIT License, see LICENSE"
+
+# Packages ----------------------------------------------
+
+import functools
+import re
+import string
+import unicodedata
+
+# --------------------------------------------------------
+
+# \<mark><letter> and \<mark>{<letter>}
+latex_accent_marks = {
+    "`": "\u0300",
+    "'": "\u0301",
+    "^": "\u0302",
+    "~": "\u0303",
+    "=": "\u0304",
+    ".": "\u0307",
+    '"': "\u0308"
+}
+# \<mark>{<letter>} and \<mark> <letter>
+latex_letter_accent_marks = {
+    "u": "\u0306",
+    "r": "\u030a",
+    "H": "\u030b",
+    "v": "\u030c",
+    "d": "\u0323",
+    "c": "\u0327",
+    "k": "\u0328",
+    "b": "\u0331",
+    "t": "\u0361"
+}
+latex_command_chars = {
+    "ss": "ß", "SS": "SS", "ae": "æ", "AE": "Æ", "oe": "œ", "OE": "Œ",
+    "aa": "å", "AA": "Å", "o": "ø", "O": "Ø", "l": "ł", "L": "Ł",
+    "i": "ı", "j": "ȷ", "dh": "ð", "DH": "Ð", "th": "þ", "TH": "Þ",
+    "ng": "ŋ", "NG": "Ŋ", "dj": "đ", "DJ": "Đ",
+    "textendash": "–", "textemdash": "—", "textquoteleft": "‘", "textquoteright": "’",
+    "textquotedblleft": "“", "textquotedblright": "”", "quotedblbase": "„",
+    "guillemotleft": "«", "guillemotright": "»", "guilsinglleft": "‹",
+    "guilsinglright": "›", "textexclamdown": "¡", "textquestiondown": "¿",
+    "S": "§", "P": "¶", "copyright": "©", "textcopyright": "©",
+    "textregistered": "®", "texttrademark": "™", "pounds": "£", "textsterling": "£",
+    "texteuro": "€", "euro": "€", "textyen": "¥", "dag": "†", "ddag": "‡",
+    "textdagger": "†", "textdaggerdbl": "‡", "dots": "…", "ldots": "…",
+    "textellipsis": "…", "textbullet": "•", "textperiodcentered": "·",
+    "textdegree": "°", "textmu": "µ", "textonehalf": "½", "textonequarter": "¼",
+    "textthreequarters": "¾", "texttimes": "×", "textdiv": "÷", "textless": "<",
+    "textgreater": ">", "textbackslash": "\\", "textasciitilde": "~", "textasciicircum": "^",
+    "textbar": "|", "textunderscore": "_", "TeX": "TeX", "LaTeX": "LaTeX", "BibTeX": "BibTeX",
+    "alpha": "α", "beta": "β", "gamma": "γ", "delta": "δ", "epsilon": "ε",
+    "varepsilon": "ε", "zeta": "ζ", "eta": "η", "theta": "θ", "vartheta": "ϑ",
+    "iota": "ι", "kappa": "κ", "lambda": "λ", "mu": "μ", "nu": "ν",
+    "xi": "ξ", "pi": "π", "varpi": "ϖ", "rho": "ρ", "sigma": "σ",
+    "varsigma": "ς", "tau": "τ", "upsilon": "υ", "phi": "φ", "varphi": "ϕ",
+    "chi": "χ", "psi": "ψ", "omega": "ω", "Gamma": "Γ", "Delta": "Δ",
+    "Theta": "Θ", "Lambda": "Λ", "Xi": "Ξ", "Pi": "Π", "Sigma": "Σ",
+    "Upsilon": "Υ", "Phi": "Φ", "Psi": "Ψ", "Omega": "Ω",
+    "pm": "±", "times": "×", "cdot": "·", "leq": "≤", "le": "≤",
+    "geq": "≥", "ge": "≥", "neq": "≠", "ne": "≠", "approx": "≈",
+    "sim": "∼", "infty": "∞", "rightarrow": "→", "to": "→", "leftarrow": "←",
+    "ell": "ℓ", "partial": "∂", "circ": "∘", "prime": "′"
+}
+# \<char>
+latex_escape_chars = {
+    "&": "&", "%": "%", "$": "$", "#": "#", "_": "_", "{": "{", "}": "}",
+    " ": " ", ",": "\u2009", "-": "", "/": "", "\\": " "
+}
+latex_text_chars = {
+    "---": "—", "--": "–", "``": "“", "''": "”", "!`": "¡", "?`": "¿",
+    "~": "\u00a0"
+}
+latex_first_chars = "\\{}~$`'!?-"
+# fields copied as they are
+latex_verbatim_fields = frozenset(["type", "ID", "url", "doi", "file", "eprint", "pdf", "isbn", "issn"])
+# fields that keep their braces, for bibtex_names_parse
+latex_name_fields = frozenset(["author", "editor", "translator"])
+
+
+def latex_text_has(latex_text):
+    """
+    params: latex_text, str.
+    return: bool. Whether the text has anything to decode.
+
+    A few substring tests are several times faster than one regular
+    expression with these alternatives.
+    """
+    #
+    return (
+        "\\" in latex_text or "{" in latex_text or "}" in latex_text or "~" in latex_text
+        or "$" in latex_text or "--" in latex_text or "``" in latex_text or "''" in latex_text
+        or "!`" in latex_text or "?`" in latex_text
+    )
+
+
+def latex_accent_chars_make():
+    """
+    return: latex_accent_chars, {(mark, letter): str}
+
+    Every accent on every ASCII letter, and on the dotless \\i and \\j,
+    precomposed where Unicode has the character.
+    """
+    #
+    latex_accent_chars = {}
+    accent_marks = dict(latex_accent_marks)
+    accent_marks.update(latex_letter_accent_marks)
+    letters = list(string.ascii_letters) + ["\\i", "\\j"]
+    for mark, combining_char in accent_marks.items():
+        for letter in letters:
+            base_letter = letter[1:] if letter.startswith("\\") else letter
+            latex_accent_chars[(mark, letter)] = unicodedata.normalize("NFC", base_letter + combining_char)
+    #
+    return latex_accent_chars
+
+
+def latex_literal_chars_make(latex_accent_chars, keep_braces):
+    """
+    params:
+    latex_accent_chars, {}, see latex_accent_chars_make
+    keep_braces, bool.
+
+    return: latex_literal_chars, {latex: str}
+
+    The usual spellings of every accent, command, escape and ligature, so
+    that most matches are replaced with one lookup of their text.
+    """
+    #
+    latex_literal_chars = {}
+    for (mark, letter), accent_char in latex_accent_chars.items():
+        spellings = ["\\%s{%s}" % (mark, letter)]
+        if mark in latex_accent_marks:
+            spellings.append("\\%s%s" % (mark, letter))
+        else:
+            spellings.append("\\%s %s" % (mark, letter))
+        for spelling in spellings:
+            latex_literal_chars[spelling] = accent_char
+            latex_literal_chars["{" + spelling + "}"] = accent_char
+    for command_name, command_char in latex_command_chars.items():
+        for spelling in ("\\" + command_name, "\\" + command_name + "{}", "\\" + command_name + " "):
+            latex_literal_chars[spelling] = command_char
+            latex_literal_chars["{" + spelling + "}"] = command_char
+    for escape_char, escaped_char in latex_escape_chars.items():
+        latex_literal_chars["\\" + escape_char] = escaped_char
+    latex_literal_chars.update(latex_text_chars)
+    if not keep_braces:
+        latex_literal_chars.update({"{": "", "}": "", "$": ""})
+    #
+    return latex_literal_chars
+
+
+@functools.lru_cache(maxsize=None)
+def latex_decoder_get(keep_braces):
+    """
+    params: keep_braces, bool.
+    return: (latex_re, latex_match_replace), (re.Pattern, function)
+
+    Built once per mode, on first use.
+    """
+    #
+    letter_re = r"\\[ij](?![A-Za-z])|[A-Za-z]"
+    accent_mark_re = "[" + re.escape("".join(latex_accent_marks)) + "]"
+    letter_mark_re = "[" + "".join(latex_letter_accent_marks) + "]"
+    command_re = "|".join(sorted(latex_command_chars, key=len, reverse=True))
+    escape_re = "[" + re.escape("".join(latex_escape_chars)) + "]"
+    text_re = "|".join(re.escape(text) for text in sorted(latex_text_chars, key=len, reverse=True))
+    latex_alternatives = [
+        # {\"o} as well as \"o, the braces of an accent go with it
+        r"(?P<accent>(?P<accent_open>\{)?\\(?P<accent_mark>%s)\s*"
+        r"(?:\{\s*(?P<accent_braced>%s)\s*\}|(?P<accent_letter>%s))(?(accent_open)\}))" % (
+            accent_mark_re, letter_re, letter_re
+        ),
+        r"(?P<letter_accent>(?P<letter_accent_open>\{)?\\(?P<letter_accent_mark>%s)"
+        r"(?:\s*\{\s*(?P<letter_accent_braced>%s)\s*\}|\s+(?P<letter_accent_letter>%s))(?(letter_accent_open)\}))" % (
+            letter_mark_re, letter_re, letter_re
+        ),
+        r"(?P<command>(?P<command_open>\{)?\\(?P<command_name>%s)(?![A-Za-z])(?:\{\}|[ \t])?(?(command_open)\}))" % (
+            command_re
+        ),
+        r"(?P<escape>\\(?P<escape_char>%s))" % escape_re,
+        # \emph{...}, \textit{...} and the other commands, their content is kept
+        r"(?P<unknown>\\[A-Za-z]+\s*(?=\{))",
+        r"(?P<text>%s)" % text_re
+    ]
+    if not keep_braces:
+        latex_alternatives.append(r"(?P<brace>[{}$])")
+    # the lookahead lets the positions without a special character fail at
+    # once, instead of trying every alternative
+    latex_re = re.compile("(?=[%s])(?:%s)" % (re.escape(latex_first_chars), "|".join(latex_alternatives)))
+    latex_accent_chars = latex_accent_chars_make()
+    latex_literal_get = latex_literal_chars_make(latex_accent_chars, keep_braces).get
+    #
+    def latex_match_replace(latex_match):
+        latex_char = latex_literal_get(latex_match.group())
+        if latex_char is not None:
+            return latex_char
+        # the spellings with more spaces, and the unknown commands
+        match_kind = latex_match.lastgroup
+        if match_kind == "accent":
+            letter = latex_match.group("accent_braced") or latex_match.group("accent_letter")
+            return latex_accent_chars[(latex_match.group("accent_mark"), letter)]
+        elif match_kind == "letter_accent":
+            letter = latex_match.group("letter_accent_braced") or latex_match.group("letter_accent_letter")
+            return latex_accent_chars[(latex_match.group("letter_accent_mark"), letter)]
+        elif match_kind == "command":
+            return latex_command_chars[latex_match.group("command_name")]
+        elif match_kind == "escape":
+            return latex_escape_chars[latex_match.group("escape_char")]
+        elif match_kind == "text":
+            return latex_text_chars[latex_match.group()]
+        return ""
+    #
+    return (latex_re, latex_match_replace)
+
+
+def latex_text_decode(latex_text, keep_braces=False):
+    """
+    params:
+    latex_text, str.
+    keep_braces, bool. Keep the braces that are not part of a command.
+
+    return: unicode_text, str.
+    """
+    #
+    latex_re, latex_match_replace = latex_decoder_get(keep_braces)
+    unicode_text = latex_re.sub(latex_match_replace, latex_text)
+    #
+    return unicode_text
+
+
+latex_cache_size = 65536
+latex_text_decode_cached = functools.lru_cache(maxsize=latex_cache_size)(latex_text_decode)
+
+
+def latex_decode(latex_text, keep_braces=False):
+    """
+    params:
+    latex_text, str.
+    keep_braces, bool.
+
+    return: unicode_text, str. latex_text itself if it has no LaTeX.
+    """
+    #
+    if not latex_text_has(latex_text):
+        return latex_text
+    #
+    return latex_text_decode_cached(latex_text, keep_braces)
+
+
+def latex_entry_decode(bibtex_dict):
+    """
+    params: bibtex_dict, {}, see BibtexToZotero.bibtex_entry_parse
+    return: bibtex_dict, {}. A new dict, its values decoded, or bibtex_dict
+    itself if none of its values has LaTeX.
+
+    Urls, DOI, identifiers and files are not decoded, names keep their
+    braces, the en dash of page ranges becomes "-".
+    """
+    #
+    # one search over the whole entry, most entries have no LaTeX at all
+    if not latex_text_has("\0".join(bibtex_dict.values())):
+        return bibtex_dict
+    decoded_dict = {}
+    for bibtex_field, bibtex_value in bibtex_dict.items():
+        if bibtex_field in latex_verbatim_fields:
+            decoded_dict[bibtex_field] = bibtex_value
+        elif not latex_text_has(bibtex_value):
+            decoded_dict[bibtex_field] = bibtex_value
+        elif bibtex_field in latex_name_fields:
+            decoded_dict[bibtex_field] = latex_text_decode_cached(bibtex_value, True)
+        elif bibtex_field == "pages":
+            decoded_dict[bibtex_field] = latex_text_decode_cached(bibtex_value, False).replace("\u2013", "-")
+        else:
+            decoded_dict[bibtex_field] = latex_text_decode_cached(bibtex_value, False)
+    #
+    return decoded_dict
@@ -0,0 +1,245 @@
+"""
+Multi-process conversion of large BibTeX databases.
+
+Entries of a database depend on its @string macros, so the conversion
+runs in two phases. The parent first scans the memory mapped bytes once
+for the entries, matching their braces as bibtex_entry_split does, so an
+"@type{" inside a @comment or a value is not an entry: it parses the
+@string entries, in order, into one macro table, and cuts the database
+into byte ranges of chunk_size entries. The workers get the table once, when they start,
+and keep it as a read only mapping; each maps the file itself, splits
+and parses the entries of its ranges with bibtex_entry_split and
+bibtex_entry_parse and converts them with bibtexTozotero. Results come
+back in the order of the entries.
+
+As every entry sees every macro, a macro defined twice has its last
+value in the whole database, not only after its second definition.
+Databases given as a file object are read by the parent with
+bibtex_dict_read, only bibtexTozotero runs in the workers.
+"""
+
+__author__ = "Kaan Eraslan"
+
+# Packages ----------------------------------------------
+
+import concurrent.futures
+import io
+import mmap
+import os
+import re
+import types
+
+from zotBibtexJson import BibtexToZotero
+from zotJson import ZoteroParallel
+
+# --------------------------------------------------------
+
+bibtex_entry_begin_bytes_re = re.compile(rb"@\s*([A-Za-z]+)\s*([{(])")
+bibtex_special_bytes_re = re.compile(rb'[{}()"]')
+bibtex_skipped_types = frozenset(["string", "comment", "preamble"])
+
+
+def bibtex_macro_define(bibtex_macros, bibtex_entry):
+    """
+    params:
+    bibtex_macros, {}. Updated in place.
+    bibtex_entry, str. An @string entry, see bibtex_entry_split
+
+    An @string can use the macros defined before it.
+    """
+    #
+    bibtex_dict = BibtexToZotero.bibtex_entry_parse(bibtex_entry, bibtex_macros)
+    for macro_name, macro_value in bibtex_dict.items():
+        if macro_name != "type":
+            bibtex_macros[macro_name] = macro_value
+
+
+def bibtex_entry_offsets(bib_buffer):
+    """
+    params: bib_buffer, bytes or mmap.mmap
+    yield: (bibtex_type, entry_start, entry_end), (str, int, int)
+
+    The entries bibtex_entry_split gives for the decoded buffer, as byte
+    offsets. The type is in lower case. An entry that is not closed ends
+    with the buffer.
+    """
+    #
+    buffer_size = len(bib_buffer)
+    pos = 0
+    while True:
+        at_index = bib_buffer.find(b"@", pos)
+        if at_index == -1:
+            return
+        entry_match = bibtex_entry_begin_bytes_re.match(bib_buffer, at_index)
+        if entry_match is None:
+            # a lone "@" outside of an entry
+            pos = at_index + 1
+            continue
+        bibtex_type = entry_match.group(1).decode("ascii").lower()
+        closer = b"}" if entry_match.group(2) == b"{" else b")"
+        depth = 0
+        in_quote = False
+        entry_end = buffer_size
+        for special_match in bibtex_special_bytes_re.finditer(bib_buffer, entry_match.end()):
+            special = special_match.group()
+            if special == b"{":
+                depth += 1
+            elif special == b"}" and depth > 0:
+                depth -= 1
+            elif special == b'"' and depth == 0:
+                in_quote = not in_quote
+            elif special == closer and depth == 0 and not in_quote:
+                entry_end = special_match.end()
+                break
+        yield (bibtex_type, at_index, entry_end)
+        pos = entry_end
+
+
+def bibtex_database_scan(bib_buffer, chunk_size, bibtex_macros=None, encoding="utf-8"):
+    """
+    params:
+    bib_buffer, bytes or mmap.mmap
+    chunk_size, int. Converted entries per range.
+    bibtex_macros, {} or None. Predefined @string macros.
+    encoding, str.
+
+    return: (bibtex_macros, range_list), (types.MappingProxyType, [(start, end), ...])
+
+    The ranges start at an entry and end at the start of the entry that
+    begins the next range, or with the buffer. Only the entries that are
+    converted count toward chunk_size, @string, @comment and @preamble
+    entries go with the range they are in. The months are always
+    defined, as in bibtex_dict_read.
+    """
+    #
+    macros = dict(BibtexToZotero.bibtex_month_macros)
+    if bibtex_macros is not None:
+        macros.update(bibtex_macros)
+    range_list = []
+    range_start = None
+    range_entries = 0
+    for bibtex_type, entry_start, entry_end in bibtex_entry_offsets(bib_buffer):
+        if bibtex_type == "string":
+            bibtex_macro_define(macros, bib_buffer[entry_start:entry_end].decode(encoding, "replace"))
+        if range_start is None:
+            range_start = entry_start
+        if bibtex_type in bibtex_skipped_types:
+            continue
+        if range_entries == chunk_size:
+            range_list.append((range_start, entry_start))
+            range_start = entry_start
+            range_entries = 0
+        range_entries += 1
+    if range_start is not None:
+        range_list.append((range_start, len(bib_buffer)))
+    #
+    return (types.MappingProxyType(macros), range_list)
+
+
+bibtex_worker_macros = types.MappingProxyType(dict(BibtexToZotero.bibtex_month_macros))
+
+
+def bibtex_worker_init(bibtex_macros):
+    """
+    params: bibtex_macros, {}. Sent once to each worker.
+    """
+    #
+    global bibtex_worker_macros
+    bibtex_worker_macros = types.MappingProxyType(bibtex_macros)
+
+
+def bibtex_range_map(path, range_start, range_end, encoding="utf-8"):
+    """
+    params:
+    path, str.
+    range_start, int.
+    range_end, int.
+    encoding, str.
+
+    return: zotero_dict_list, [{}, ...]
+
+    Runs in the worker processes, with the macros of bibtex_worker_init.
+    """
+    #
+    bib_buffer = ZoteroParallel.parallel_mmap_open(path)
+    bib_text = bib_buffer[range_start:range_end].decode(encoding, "replace")
+    zotero_dict_list = []
+    for bibtex_entry in BibtexToZotero.bibtex_entry_split(io.StringIO(bib_text.lstrip("\ufeff"))):
+        bibtex_dict = BibtexToZotero.bibtex_entry_parse(bibtex_entry, bibtex_worker_macros)
+        if bibtex_dict.get("type", "comment") not in bibtex_skipped_types:
+            zotero_dict_list.append(BibtexToZotero.bibtexTozotero(bibtex_dict, {}))
+    #
+    return zotero_dict_list
+
+
+def bibtex_dict_chunk_read(bib_file, chunk_size, bibtex_macros=None):
+    """
+    params:
+    bib_file, file object.
+    chunk_size, int.
+    bibtex_macros, {} or None. Predefined @string macros.
+
+    yield: bibtex_dict_list, [{}, ...], at most chunk_size entries.
+    """
+    #
+    bibtex_dict_list = []
+    for bibtex_dict in BibtexToZotero.bibtex_dict_read(bib_file, bibtex_macros):
+        bibtex_dict_list.append(bibtex_dict)
+        if len(bibtex_dict_list) == chunk_size:
+            yield bibtex_dict_list
+            bibtex_dict_list = []
+    #
+    if len(bibtex_dict_list) > 0:
+        yield bibtex_dict_list
+
+
+def bibtex_dict_chunk_map(bibtex_dict_list):
+    """
+    params: bibtex_dict_list, [{}, ...]
+    return: zotero_dict_list, [{}, ...]
+
+    Runs in the worker processes.
+    """
+    #
+    return [BibtexToZotero.bibtexTozotero(bibtex_dict, {}) for bibtex_dict in bibtex_dict_list]
+
+
+def convert_bibtex_parallel(path, workers=None, chunk_size=500, max_in_flight=None,
+                            bibtex_macros=None, encoding="utf-8"):
+    """
+    params:
+    path, str or file object. Paths are memory mapped.
+    workers, int. Number of processes, defaults to the number of cores.
+    chunk_size, int. Entries sent to a worker at once.
+    max_in_flight, int. Chunks submitted but not yet yielded, defaults to
+    twice the number of workers.
+    bibtex_macros, {} or None. Predefined @string macros.
+    encoding, str. Of the mapped file.
+
+    yield: zotero_dict, {}, in the order of the entries.
+
+    At most max_in_flight * chunk_size entries are held in memory.
+    """
+    #
+    workers, max_in_flight = ZoteroParallel.parallel_limits_get(workers, chunk_size, max_in_flight)
+    if isinstance(path, str):
+        if os.path.getsize(path) == 0:
+            return
+        with open(path, "rb") as bib_stream, mmap.mmap(bib_stream.fileno(), 0, access=mmap.ACCESS_READ) as bib_buffer:
+            macros, range_list = bibtex_database_scan(bib_buffer, chunk_size, bibtex_macros, encoding)
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, initializer=bibtex_worker_init, initargs=(dict(macros),)
+        )
+        task_iter = (
+            (bibtex_range_map, path, range_start, range_end, encoding)
+            for range_start, range_end in range_list
+        )
+    else:
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+        task_iter = (
+            (bibtex_dict_chunk_map, bibtex_dict_list)
+            for bibtex_dict_list in bibtex_dict_chunk_read(path, chunk_size, bibtex_macros)
+        )
+    #
+    with executor:
+        yield from ZoteroParallel.parallel_ordered_map(executor, task_iter, max_in_flight)
@@ -13,191 +13,601 @@ https://github.com/sciunto-org/python-bibtexparser
 __author__= "Kaan Eraslan"
 __license__= "MIT License, see LICENSE"
 
+import functools
+import hashlib
+import io
+import json
 import re
 import uuid
 
+from zotBibtexJson import BibtexLatex
+from zotJson import ZoteroMetrics
+
+bibtex_entry_begin_re = re.compile(r"@\s*([A-Za-z]+)\s*([{(])")
+bibtex_special_re = re.compile(r'[{}()"]')
+bibtex_brace_re = re.compile(r'[{}"]')
+bibtex_field_name_re = re.compile(r"\s*([^\s=,{}()\"#]+)\s*")
+bibtex_value_part_re = re.compile(r"\s*([^\s,#{}\"]+)\s*")
+bibtex_name_and_re = re.compile(r"[{}]|\s+and\s+", re.I)
+bibtex_name_part_re = re.compile(r"[{}]|,")
+bibtex_name_token_re = re.compile(r"[{}]|\s+")
+
+bibtex_month_macros = {
+    "jan": "January",
+    "feb": "February",
+    "mar": "March",
+    "apr": "April",
+    "may": "May",
+    "jun": "June",
+    "jul": "July",
+    "aug": "August",
+    "sep": "September",
+    "oct": "October",
+    "nov": "November",
+    "dec": "December"
+}
+
+
+def bibtex_entry_split(bib_file, chunk_size=65536):
+    """
+    params:
+    bib_file, file object, or a path as str.
+    chunk_size, int. Characters read at once.
+
+    yield: bibtex_entry, str. "@type{...}" with balanced braces.
+
+    Scans the database once and yields each entry when its closing brace
+    (or parenthesis) is read, so only the current entry is kept in
+    memory. An "@" inside an entry, as in an email or an url, does not
+    start a new entry. Text between entries is skipped.
+    """
+    #
+    if isinstance(bib_file, str):
+        with open(bib_file, "r", encoding="utf-8") as bib_stream:
+            yield from bibtex_entry_split(bib_stream, chunk_size)
+        return
+    #
+    buffer = ""
+    pos = 0
+    entry_start = None
+    eof = False
+    while True:
+        if entry_start is None:
+            at_index = buffer.find("@", pos)
+            if at_index == -1:
+                buffer = ""
+                pos = 0
+            else:
+                entry_match = bibtex_entry_begin_re.match(buffer, at_index)
+                if entry_match is not None:
+                    entry_start = at_index
+                    closer = "}" if entry_match.group(2) == "{" else ")"
+                    depth = 0
+                    in_quote = False
+                    pos = entry_match.end()
+                    continue
+                elif len(buffer) - at_index > 256 or eof:
+                    # a lone "@" outside of an entry
+                    pos = at_index + 1
+                    continue
+                else:
+                    buffer = buffer[at_index:]
+                    pos = 0
+        else:
+            for special_match in bibtex_special_re.finditer(buffer, pos):
+                special = special_match.group()
+                pos = special_match.end()
+                if special == "{":
+                    depth += 1
+                elif special == "}" and depth > 0:
+                    depth -= 1
+                elif special == '"' and depth == 0:
+                    in_quote = not in_quote
+                elif special == closer and depth == 0 and not in_quote:
+                    yield buffer[entry_start:pos]
+                    entry_start = None
+                    break
+            else:
+                pos = len(buffer)
+            if entry_start is None:
+                continue
+            buffer = buffer[entry_start:]
+            pos = pos - entry_start
+            entry_start = 0
+        #
+        if eof:
+            break
+        chunk = bib_file.read(chunk_size)
+        if len(chunk) == 0:
+            eof = True
+        buffer = buffer + chunk
+    #
+    if entry_start is not None:
+        yield buffer[entry_start:]
+
+
+def bibtex_value_parse(bibtex_entry, pos, bibtex_macros):
+    """
+    params:
+    bibtex_entry, str.
+    pos, int. Where the value starts.
+    bibtex_macros, {}
+
+    return: (value, pos), (str, int)
+
+    Reads the parts of a value joined by "#": braced or quoted strings,
+    numbers and macro names.
+    """
+    #
+    value_parts = []
+    while True:
+        while pos < len(bibtex_entry) and bibtex_entry[pos].isspace():
+            pos += 1
+        if pos >= len(bibtex_entry):
+            break
+        delimiter = bibtex_entry[pos]
+        if delimiter == "{" or delimiter == '"':
+            depth = 0
+            value_start = pos + 1
+            pos = len(bibtex_entry)
+            for brace_match in bibtex_brace_re.finditer(bibtex_entry, value_start):
+                char = brace_match.group()
+                if char == "{":
+                    depth += 1
+                elif char == "}" and depth == 0 and delimiter == "{":
+                    pos = brace_match.start()
+                    break
+                elif char == "}":
+                    depth -= 1
+                elif char == '"' and depth == 0 and delimiter == '"':
+                    pos = brace_match.start()
+                    break
+            value_parts.append(bibtex_entry[value_start:pos])
+            pos += 1
+        else:
+            part_match = bibtex_value_part_re.match(bibtex_entry, pos)
+            if part_match is None:
+                break
+            part = part_match.group(1)
+            pos = part_match.end()
+            if part.isdigit():
+                value_parts.append(part)
+            else:
+                value_parts.append(bibtex_macros.get(part.lower(), part))
+        #
+        while pos < len(bibtex_entry) and bibtex_entry[pos].isspace():
+            pos += 1
+        if pos < len(bibtex_entry) and bibtex_entry[pos] == "#":
+            pos += 1
+        else:
+            break
+    #
+    value = " ".join("".join(value_parts).split())
+    #
+    return (value, pos)
+
+
+def bibtex_entry_parse(bibtex_entry, bibtex_macros=None):
+    """
+    params:
+    bibtex_entry, str. See bibtex_entry_split.
+    bibtex_macros, {} or None. @string definitions, keyed by lower case name.
+
+    return: bibtex_dict, {}
+
+    The entry type is under "type" and the citation key under "ID", field
+    names are in lower case. @string entries give {"type": "string",
+    name: value}, @preamble entries {"type": "preamble", "preamble": value}.
+    """
+    #
+    if bibtex_macros is None:
+        bibtex_macros = bibtex_month_macros
+    entry_match = bibtex_entry_begin_re.match(bibtex_entry)
+    bibtex_dict = {}
+    if entry_match is None:
+        return bibtex_dict
+    bibtex_dict["type"] = entry_match.group(1).lower()
+    pos = entry_match.end()
+    body_end = len(bibtex_entry) - 1
+    #
+    if bibtex_dict["type"] == "comment":
+        return bibtex_dict
+    elif bibtex_dict["type"] == "preamble":
+        bibtex_dict["preamble"] = bibtex_value_parse(bibtex_entry[:body_end], pos, bibtex_macros)[0]
+        return bibtex_dict
+    elif bibtex_dict["type"] != "string":
+        key_end = bibtex_entry.find(",", pos)
+        if key_end == -1:
+            bibtex_dict["ID"] = bibtex_entry[pos:body_end].strip()
+            return bibtex_dict
+        bibtex_dict["ID"] = bibtex_entry[pos:key_end].strip()
+        pos = key_end + 1
+    #
+    body = bibtex_entry[:body_end]
+    while pos < len(body):
+        name_match = bibtex_field_name_re.match(body, pos)
+        if name_match is None:
+            break
+        pos = name_match.end()
+        if pos >= len(body) or body[pos] != "=":
+            break
+        value, pos = bibtex_value_parse(body, pos + 1, bibtex_macros)
+        bibtex_dict[name_match.group(1).lower()] = value
+        while pos < len(body) and (body[pos].isspace() or body[pos] == ","):
+            pos += 1
+    #
+    return bibtex_dict
+
+
+def bibtex_dict_read(bib_file, bibtex_macros=None):
+    """
+    params:
+    bib_file, file object, or a path as str.
+    bibtex_macros, {} or None. Predefined @string macros.
+
+    yield: bibtex_dict, {}, see bibtex_entry_parse
+
+    @string definitions are collected as they are read and expanded in the
+    entries that follow them. @comment and @preamble entries are skipped.
+    """
+    #
+    macros = dict(bibtex_month_macros)
+    if bibtex_macros is not None:
+        macros.update(bibtex_macros)
+    for bibtex_entry in bibtex_entry_split(bib_file):
+        bibtex_dict = bibtex_entry_parse(bibtex_entry, macros)
+        bibtex_type = bibtex_dict.get("type")
+        if bibtex_type == "string":
+            for macro_name, macro_value in bibtex_dict.items():
+                if macro_name != "type":
+                    macros[macro_name] = macro_value
+        elif bibtex_type is not None and bibtex_type != "comment" and bibtex_type != "preamble":
+            yield bibtex_dict
+
+
 def bibtex_text_read(bibDatabase_str):
     """
     params: bibDatabase_str, str.
     return: bibTeXREF_list, []
     """
     #
-    bib_element_re = re.compile("@.+?(?=@)", re.S)
-    bibTeXREF_list = re.findall(bib_element_re, bibDatabase_str)
+    bibTeXREF_list = list(bibtex_entry_split(io.StringIO(bibDatabase_str)))
     #
     return bibTeXREF_list
 
 
+bibtex_types = {
+    "inproceedings": "conferencePaper",
+    "book": "book",
+    "article": "journalArticle",
+    "inbook": "bookSection",
+    "incollection": "bookSection",
+    "patent": "patent",
+    "phdthesis": "thesis",
+    "unpublished": "manuscript",
+    "conference": "conferencePaper",
+    "techreport": "report",
+    "booklet": "book",
+    "manual": "book",
+    "mastersthesis": "thesis",
+    "misc": "book",
+    "proceedings": "book",
+    "online": "webpage"
+}
+# item type of the entry types that are not in bibtex_types, @software,
+# @thesis, @report, @dataset, ...
+bibtex_fallback_itemType = "document"
+
+# bibtex field => zotero field, or {itemType: zotero field} where
+# "__default" is used for the other item types.
+# When several bibtex fields give the same zotero field, the one that comes
+# later in the list wins: notes > review > annote > comments, year > date.
+
+bibtex_fields = [
+    ("comments", "notes"),
+    ("annote", "notes"),
+    ("review", "notes"),
+    ("notes", "notes"),
+    ("keywords", "tags"),
+    ("keyword", "tags"),
+    ("date", "date"),
+    ("pages", {
+        "book": "numPages",
+        "thesis": "numPages",
+        "manuscript": "numPages",
+        "__default": "pages"
+    }),
+    ("year", "date"),
+    ("title", "title"),
+    ("lastchecked", "accessDate"),
+    ("urldate", "accessDate"),
+    ("journal", "publicationTitle"),
+    ("number", {
+        "report": "reportNumber",
+        "book": "seriesNumber",
+        "bookSection": "seriesNumber",
+        "conferencePaper": "seriesNumber",
+        "patent": "patentNumber"
+    }),
+    ("booktitle", "publicationTitle"),
+    ("school", "publisher"),
+    ("institution", "publisher"),
+    ("issue", "issue"),
+    ("location", "place"),
+    ("address", "place"),
+    ("chapter", "section"),
+    ("edition", "edition"),
+    ("series", "series"),
+    ("volume", "volume"),
+    ("copyright", "rights"),
+    ("isbn", "ISBN"),
+    ("issn", "ISSN"),
+    ("shorttitle", "shortTitle"),
+    ("url", "url"),
+    ("doi", "DOI"),
+    ("abstract", "abstractNote"),
+    ("nationality", "country"),
+    ("language", "language"),
+    ("assignee", "assignee")
+]
+
+
+def bibtex_field_table_compile(bibtex_field_list, itemType=None):
+    """
+    params:
+    bibtex_field_list, [(str, str or {}), ...]
+    itemType, str or None.
+
+    return: bibtex_field_table, {bibtexField: (zoteroField, rank)}
+
+    rank is the position of the field in the list, used to keep the
+    precedence between fields that map to the same zotero field. It is
+    None when no other field maps to that zotero field.
+    """
+    #
+    bibtex_field_table = {}
+    zotero_field_sources = {}
+    for rank, (bibtex_field, zotero_field) in enumerate(bibtex_field_list):
+        if isinstance(zotero_field, dict):
+            zotero_field = zotero_field.get(itemType, zotero_field.get("__default"))
+        if zotero_field is not None:
+            bibtex_field_table[bibtex_field] = (zotero_field, rank)
+            zotero_field_sources[zotero_field] = zotero_field_sources.get(zotero_field, 0) + 1
+    for bibtex_field, (zotero_field, rank) in bibtex_field_table.items():
+        if zotero_field_sources[zotero_field] == 1:
+            bibtex_field_table[bibtex_field] = (zotero_field, None)
+    #
+    return bibtex_field_table
+
+
+bibtex_field_tables = {
+    itemType: bibtex_field_table_compile(bibtex_fields, itemType)
+    for itemType in set(bibtex_types.values()) | {bibtex_fallback_itemType}
+}
+
+
+def bibtex_record_identity(bibtex_dict):
+    """
+    params: bibtex_dict, {}, see bibtex_entry_parse
+    return: identity, str or None. "key:<citation key>" or "doi:<doi>"
+    """
+    #
+    if len(bibtex_dict.get("ID", "")) > 0:
+        return "key:" + bibtex_dict["ID"]
+    elif len(bibtex_dict.get("doi", "")) > 0:
+        return "doi:" + bibtex_dict["doi"].lower()
+    #
+    return None
+
+
+# raised whenever entries convert differently with the same tables, it is
+# part of the ZoteroCache keys. 2: values are LaTeX decoded. 3: the von
+# part starts at the first lowercase word of "First von Last" names.
+bibtex_converter_version = 3
+
+
+def bibtex_tables_version(bibtex_macros=None):
+    """
+    params: bibtex_macros, {} or None. The @string macros of the database.
+    return: tables_version, str. Changes whenever a map or a macro changes.
+    """
+    #
+    bibtex_tables = [bibtex_types, bibtex_fields, bibtex_macros or {}]
+    tables_version = "bibtex-" + hashlib.sha256(json.dumps(bibtex_tables, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+    #
+    return tables_version
+
+
 def bibtex_type_map(bibtex_dict, zotero_dict):
     """
     params: bibtex_dict, dict.
-    return: zotero_dict, dict.
+    return: zotero_dict, dict. With bibtex_fallback_itemType as the item
+    type of an unknown entry type.
     """
     #
-    if bibtex_dict["type"] == "inproceedings":
-        zotero_dict["itemType"] = "conferencePaper"
-    elif bibtex_dict["type"] == "book":
-        zotero_dict["itemType"] = "book"
-    elif bibtex_dict["type"] == "article":
-        zotero_dict["itemType"] = "journalArticle"
-    elif bibtex_dict["type"] == "inbook":
-        zotero_dict["itemType"] = "bookSection"
-    elif bibtex_dict["type"] == "incollection":
-        zotero_dict["itemType"] = "bookSection"
-    elif bibtex_dict["type"] == "patent":
-        zotero_dict["itemType"] = "patent"
-    elif bibtex_dict["type"] == "phdthesis":
-        zotero_dict["itemType"] = "thesis"
-    elif bibtex_dict["type"] == "unpublished":
-        zotero_dict["itemType"] = "manuscript"
-    elif bibtex_dict["type"] == "conference":
-        zotero_dict["itemType"] = "conferencePaper"
-    elif bibtex_dict["type"] == "techreport":
-        zotero_dict["itemType"] = "report"
-    elif bibtex_dict["type"] == "booklet":
-        zotero_dict["itemType"] = "book"
-    elif bibtex_dict["type"] == "manual":
-        zotero_dict["itemType"] = "book"
-    elif bibtex_dict["type"] == "mastersthesis":
-        zotero_dict["itemType"] = "thesis"
-    elif bibtex_dict["type"] == "misc":
-        zotero_dict["itemType"] = "book"
-    elif bibtex_dict["type"] == "proceedings":
-        zotero_dict["itemType"] = "book"
-    elif bibtex_dict["type"] == "online":
-        zotero_dict["itemType"] = "webpage"
+    zotero_dict["itemType"] = bibtex_types.get(bibtex_dict.get("type"), bibtex_fallback_itemType)
     #
     return zotero_dict
 
+
 def bibtex_field_map(bibtex_dict, zotero_dict, bibtex_type):
     """
     params: bibtex_dict, dict.
     return: zotero_dict, dict.
+
+    Only the fields of the entry are looked up, once each, in the
+    bibtex_field_tables entry of the item type.
     """
     #
-    if "comments" in bibtex_dict.keys():
-        zotero_dict["notes"] = bibtex_dict["comments"]
-    if "annote" in bibtex_dict.keys():
-        zotero_dict["notes"] = bibtex_dict["annote"]
-    if "review" in bibtex_dict.keys():
-        zotero_dict["notes"] = bibtex_dict["review"]
-    if "notes" in bibtex_dict.keys():
-        zotero_dict["notes"] = bibtex_dict["notes"]
-    if "keywords" in bibtex_dict.keys():
-        zotero_dict["tags"] = bibtex_dict["keywords"]
-    if "keyword" in bibtex_dict.keys():
-        zotero_dict["tags"] = bibtex_dict["keyword"]
-    if "date" in bibtex_dict.keys():
-        zotero_dict["date"] = bibtex_dict["date"]
-    if "pages" in bibtex_dict.keys() and (bibtex_type == "book" or bibtex_type == "thesis" or bibtex_type == "manuscript"):
-        zotero_dict["numPages"] = bibtex_dict["pages"]
-    if "pages" in bibtex_dict.keys() and bibtex_type != "book" and bibtex_type != "thesis" and bibtex_type != "manuscript":
-        zotero_dict["pages"] = bibtex_dict["pages"]
-    if "year" in bibtex_dict.keys():
-        zotero_dict["date"] = bibtex_dict["year"]
-    if "title" in bibtex_dict.keys():
-        zotero_dict["title"] = bibtex_dict["title"]
-    if "lastchecked" in bibtex_dict.keys():
-        zotero_dict["accessDate"] = bibtex_dict["lastchecked"]
-    if "urldate" in bibtex_dict.keys():
-        zotero_dict["accessDate"] = bibtex_dict["urldate"]
-    if "journal" in bibtex_dict.keys():
-        zotero_dict["publicationTitle"] = bibtex_dict["journal"]
-    if "number" in bibtex_dict.keys() and bibtex_type == "report":
-        zotero_dict["reportNumber"] = bibtex_dict["number"]
-    if "number" in bibtex_dict.keys() and (bibtex_type == "book" or bibtex_type == "bookSection" or bibtex_type == "conferencePaper"):
-        zotero_dict["seriesNumber"] = bibtex_dict["number"]
-    if "number" in bibtex_dict.keys() and bibtex_type == "patent":
-        zotero_dict["patentNumber"] = bibtex_type["number"]
-    if "booktitle" in bibtex_dict.keys():
-        zotero_dict["publicationTitle"] = bibtex_dict["booktitle"]
-    if "school" in bibtex_dict.keys():
-        zotero_dict["publisher"] = bibtex_dict["school"]
-    if "institution" in bibtex_dict.keys():
-        zotero_dict["publisher"] = bibtex_dict["institution"]
-    if "issue" in bibtex_dict.keys():
-        zotero_dict["issue"] = bibtex_dict["issue"]
-    if "location" in bibtex_dict.keys():
-        zotero_dict["place"] = bibtex_dict["location"]
-    if "address" in bibtex_dict.keys():
-        zotero_dict["place"] = bibtex_dict["address"]
-    if "chapter" in bibtex_dict.keys():
-        zotero_dict["section"] = bibtex_dict["chapter"]
-    if "edition" in bibtex_dict.keys():
-        zotero_dict["edition"] = bibtex_dict["edition"]
-    if "series" in bibtex_dict.keys():
-        zotero_dict["series"] = bibtex_dict["series"]
-    if "volume" in bibtex_dict.keys():
-        zotero_dict["volume"] = bibtex_dict["volume"]
-    if "copyright" in bibtex_dict.keys():
-        zotero_dict["rights"] = bibtex_dict["copyright"]
-    if "isbn" in bibtex_dict.keys():
-        zotero_dict["ISBN"] = bibtex_dict["isbn"]
-    if "issn" in bibtex_dict.keys():
-        zotero_dict["ISSN"] = bibtex_dict["issn"]
-    if "shorttitle" in bibtex_dict.keys():
-        zotero_dict["shortTitle"] = bibtex_dict["shorttitle"]
-    if "url" in bibtex_dict.keys():
-        zotero_dict["url"] = bibtex_dict["url"]
-    if "doi" in bibtex_dict.keys():
-        zotero_dict["DOI"] = bibtex_dict["doi"]
-    if "abstract" in bibtex_dict.keys():
-        zotero_dict["abstractNote"] = bibtex_dict["abstract"]
-    if "nationality" in bibtex_dict.keys():
-        zotero_dict["country"] = bibtex_dict["nationality"]
-    if "language" in bibtex_dict.keys():
-        zotero_dict["language"] = bibtex_dict["language"]
-    if "assignee" in bibtex_dict.keys():
-        zotero_dict["assignee"] = bibtex_dict["assignee"]
+    bibtex_field_table = bibtex_field_tables.get(bibtex_type)
+    if bibtex_field_table is None:
+        bibtex_field_table = bibtex_field_table_compile(bibtex_fields, bibtex_type)
+        bibtex_field_tables[bibtex_type] = bibtex_field_table
+    zotero_field_ranks = {}
+    for bibtex_field, bibtex_value in bibtex_dict.items():
+        bibtex_field_rule = bibtex_field_table.get(bibtex_field)
+        if bibtex_field_rule is None:
+            continue
+        zotero_field, rank = bibtex_field_rule
+        if rank is None:
+            zotero_dict[zotero_field] = bibtex_value
+        elif zotero_field_ranks.get(zotero_field, -1) < rank:
+            zotero_dict[zotero_field] = bibtex_value
+            zotero_field_ranks[zotero_field] = rank
     #
     return zotero_dict
 
 
-def bibtex_parse_name(bibtex_dict, zotero_dict):
+def bibtex_name_divide(name_str, separator_re):
     """
     params:
-    bibtex_dict, {}
-    zotero_dict, {}
+    name_str, str.
+    separator_re, compiled re matching braces or the separator.
 
-    return: zotero_dict, {}
+    return: name_part_list, [str, ...]
+
+    Splits on the separator outside of braces only, so that
+    "{Barnes and Noble}" stays in one piece.
+    """
+    #
+    name_part_list = []
+    depth = 0
+    part_start = 0
+    for separator_match in separator_re.finditer(name_str):
+        separator = separator_match.group()
+        if separator == "{":
+            depth += 1
+        elif separator == "}":
+            depth -= 1
+        elif depth == 0:
+            name_part_list.append(name_str[part_start:separator_match.start()].strip())
+            part_start = separator_match.end()
+    name_part_list.append(name_str[part_start:].strip())
+    #
+    return name_part_list
+
+
+def bibtex_name_unbrace(name_str):
+    """
+    params: name_str, str.
+    return: name_str, str. Without the braces around the whole string.
+    """
+    #
+    if not (name_str.startswith("{") and name_str.endswith("}")):
+        return name_str
+    depth = 0
+    for char in name_str[1:-1]:
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth < 0:
+                # "{A} and {B}"
+                return name_str
+    #
+    return name_str[1:-1]
+
+
+def bibtex_name_parse(name_str):
+    """
+    params: name_str, str. A single name.
+
+    return: name_tuple, (lastName, firstName), or (name,) for corporate
+    names given in braces like "{World Health Organization}".
 
+    Handles "Last, First", "Last, Jr, First" and "First von Last".
     """
     #
-    names_list = []
+    name_str = name_str.strip()
+    unbraced = bibtex_name_unbrace(name_str)
+    if unbraced != name_str:
+        return (unbraced.strip(),)
     #
-    if "author" in bibtex_dict.keys():
-        names_list.append(
-            ("author", bibtex_dict["author"])
-        )
-    if "editor" in bibtex_dict.keys():
-        names_list.append(
-            ("editor", bibtex_dict["editor"])
-        )
-    if "translator" in bibtex_dict.keys():
-        names_list.append(
-            ("translator", bibtex_dict["translator"])
-        )
+    name_part_list = bibtex_name_divide(name_str, bibtex_name_part_re)
+    if len(name_part_list) > 1:
+        last_name = name_part_list[0]
+        first_name = ", ".join([name_part_list[-1]] + name_part_list[1:-1])
+        return (bibtex_name_unbrace(last_name), first_name.strip(", "))
+    #
+    name_token_list = [
+        name_token for name_token in bibtex_name_divide(name_str, bibtex_name_token_re) if len(name_token) > 0
+    ]
+    # the von part starts at the first lowercase word, "Ludwig van
+    # Beethoven", "Charles de la Vall{\'e}e Poussin", the last word is
+    # always part of the last name and the first of the first name
+    last_start = len(name_token_list) - 1
+    for token_index in range(1, len(name_token_list) - 1):
+        if name_token_list[token_index][:1].islower():
+            last_start = token_index
+            break
+    last_name = " ".join(bibtex_name_unbrace(name_token) for name_token in name_token_list[last_start:])
+    first_name = " ".join(name_token_list[:last_start])
+    #
+    return (last_name, first_name)
+
+
+bibtex_name_cache_size = 4096
+bibtex_name_parse_cached = functools.lru_cache(maxsize=bibtex_name_cache_size)(bibtex_name_parse)
+
+
+def bibtex_name_cache_resize(maxsize):
+    """
+    params: maxsize, int or None. None for an unbounded cache.
+
+    Replaces the name cache, the parsed names are dropped.
+    """
+    #
+    global bibtex_name_cache_size, bibtex_name_parse_cached
+    bibtex_name_cache_size = maxsize
+    bibtex_name_parse_cached = functools.lru_cache(maxsize=maxsize)(bibtex_name_parse)
+
+
+def bibtex_names_parse(names_str_list, creatorType="author"):
+    """
+    params:
+    names_str_list, [str, ...]. Raw values like "Smith, John and Doe, Jane".
+    creatorType, str.
+
+    return: creators, [{}, {}, ...]
+
+    Names already seen are taken from the name cache, see
+    bibtex_name_cache_resize.
+    """
     #
     creators = []
-    for names_value in names_list:
-        names_divided = names_value[1].strip().split(" and ")
-        for i in range(len(names_divided)):
-            creator = {}
-            if len(names_divided[i]) == 0:
+    for names_str in names_str_list:
+        for name_str in bibtex_name_divide(names_str.strip(), bibtex_name_and_re):
+            if len(name_str) == 0 or name_str == "others":
                 continue
-            elif len(names_divided[i]) > 0:
-                name_divide = names_divided[i].split(",")
-                if len(name_divide) > 1:
-                    creator["firstName"] = name_divide.pop()
-                    creator["lastName"] = name_divide.pop(0)
-                    if len(name_divide) > 0:
-                        creator["firstName"] = creator["firstName"] + ", ".join(name_divide)
-                    creator["creatorType"] = names_value[0]
+            name_tuple = bibtex_name_parse_cached(name_str)
+            if len(name_tuple) == 1:
+                creator = {"name": name_tuple[0], "creatorType": creatorType}
+            else:
+                creator = {"firstName": name_tuple[1], "lastName": name_tuple[0], "creatorType": creatorType}
             creators.append(creator)
+    #
+    return creators
+
+
+def bibtex_parse_name(bibtex_dict, zotero_dict):
+    """
+    params:
+    bibtex_dict, {}
+    zotero_dict, {}
+
+    return: zotero_dict, {}
+
+    """
+    #
+    creators = []
+    for creatorType in ("author", "editor", "translator"):
+        if creatorType in bibtex_dict:
+            creators.extend(bibtex_names_parse([bibtex_dict[creatorType]], creatorType))
     zotero_dict["creators"] = creators
     #
     return zotero_dict
 
+
 def bibtexTozotero(bibtex_dict, zotero_dict):
     """
     params:
@@ -205,11 +615,28 @@ def bibtexTozotero(bibtex_dict, zotero_dict):
     zotero_dict, {}
 
     return: bibtex_names, {}
+
+    The values are decoded from LaTeX first, see BibtexLatex. With
+    ZoteroMetrics enabled, each of the four stages is timed, with the
+    fields of the entry as its lines.
     """
     #
+    if ZoteroMetrics.metrics_state is None:
+        bibtex_dict = BibtexLatex.latex_entry_decode(bibtex_dict)
+        bibtex_type = bibtex_type_map(bibtex_dict, zotero_dict)
+        bibtex_fields = bibtex_field_map(bibtex_dict, bibtex_type, bibtex_type["itemType"])
+        return bibtex_parse_name(bibtex_dict, bibtex_fields)
+    #
+    field_count = len(bibtex_dict)
+    metrics_token = ZoteroMetrics.metrics_stage_start()
+    bibtex_dict = BibtexLatex.latex_entry_decode(bibtex_dict)
+    metrics_token = ZoteroMetrics.metrics_stage_end("bibtex_latex_decode", metrics_token, 1, field_count)
     bibtex_type = bibtex_type_map(bibtex_dict, zotero_dict)
+    metrics_token = ZoteroMetrics.metrics_stage_end("bibtex_type_map", metrics_token, 1, field_count)
     bibtex_fields = bibtex_field_map(bibtex_dict, bibtex_type, bibtex_type["itemType"])
+    metrics_token = ZoteroMetrics.metrics_stage_end("bibtex_field_map", metrics_token, 1, field_count)
     bibtex_names = bibtex_parse_name(bibtex_dict, bibtex_fields)
+    ZoteroMetrics.metrics_stage_end("bibtex_parse_name", metrics_token, 1, field_count)
     #
     return bibtex_names
 
@@ -230,21 +657,43 @@ def bibtexNoteszotero(bibtex_names):
     #
     return notes_dict
 
-def zotero_collection_map(zotero_item_list, collection=""):
+def bibtex_zotero_iter(bib_file):
+    """
+    params: bib_file, file object, or a path as str.
+    yield: zotero_dict, {}
+
+    Converts the entries of a database one at a time, see bibtex_dict_read.
+    """
+    #
+    for bibtex_dict in bibtex_dict_read(bib_file):
+        yield bibtexTozotero(bibtex_dict, {})
+
+
+def zotero_collection_iter(zotero_item_list, collection=""):
     """
     params:
-    zotero_item_list, [{},{},...]
+    zotero_item_list, iterable of {}
     collection, str.
 
-    return: zotero_collection_list, []
+    yield: zotero_item, {}
     """
     #
-    zotero_collection_list = []
-    #
     for zotero_item in zotero_item_list:
         zotero_item["collections"] = []
         zotero_item["collections"].append(collection)
-        zotero_collection_list.append(zotero_item)
+        yield zotero_item
+
+
+def zotero_collection_map(zotero_item_list, collection=""):
+    """
+    params:
+    zotero_item_list, [{},{},...]
+    collection, str.
+
+    return: zotero_collection_list, []
+    """
+    #
+    zotero_collection_list = list(zotero_collection_iter(zotero_item_list, collection))
     #
     return zotero_collection_list
 
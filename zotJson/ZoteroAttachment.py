@@ -0,0 +1,283 @@
+"""
+Attachment child items from the attachment paths of converted items.
+
+The RIS L1, L2 and L4 fields end up as path lists under attachments/PDF,
+attachments/HTML and attachments/other. EndNote writes its files as
+internal-pdf://<folder>/<file>, relative to the PDF folder of the
+library (<library>.Data/PDF), which is given as attachment_root. Each
+path is resolved, the file is read once for its MD5, which Zotero file
+uploads need with the mtime, and becomes an attachment child item next
+to the notes of its parent. URLs become linked_url attachments.
+
+Files are hashed in a thread pool, hashlib releases the GIL while it
+reads. Hashes can be kept in a ZoteroCache under the path, size and
+mtime of the file, so that a re-run only reads the files that changed.
+
+    cache = ZoteroCache.cache_open("attachments.sqlite")
+    attachment_report = attachment_report_make()
+    for zotero_item in attachment_stage(zotero_items, "My Library.Data/PDF", cache, attachment_report):
+        ...
+    ZoteroCache.cache_close(cache)
+
+attachment_report["files"] maps the key of every imported_file item to
+the local file to upload.
+"""
+
+__author__ = "Kaan Eraslan"
+__license__ = "MIT License, see LICENSE"
+
+# Packages ----------------------------------------------
+
+import collections
+import concurrent.futures
+import hashlib
+import mimetypes
+import os
+import re
+import urllib.parse
+import urllib.request
+
+from zotJson import ZoteroBatch
+from zotJson import ZoteroCache
+
+# --------------------------------------------------------
+
+attachment_field_prefix = "attachments/"
+attachment_block_size = 2 ** 20
+attachment_scheme_re = re.compile(r"^([A-Za-z][A-Za-z0-9+.\-]+):(.*)$", re.S)
+attachment_url_schemes = frozenset(["http", "https", "ftp"])
+attachment_endnote_schemes = frozenset(["internal-pdf"])
+
+
+def attachment_report_make():
+    """
+    return: attachment_report, {"files": {key: path}, "hashed", "cached", "bytes", "links", "missing"}
+    """
+    #
+    return {"files": {}, "hashed": 0, "cached": 0, "bytes": 0, "links": 0, "missing": 0}
+
+
+def attachment_path_resolve(attachment_path, attachment_root=None):
+    """
+    params:
+    attachment_path, str. internal-pdf://, file://, a URL, doi: or a path.
+    attachment_root, str or None. Folder of internal-pdf:// and relative
+    paths, the current folder if None.
+
+    return: (kind, location), ("file", str) or ("url", str)
+    """
+    #
+    attachment_root = attachment_root if attachment_root is not None else os.getcwd()
+    scheme_match = attachment_scheme_re.match(attachment_path)
+    if scheme_match is not None:
+        scheme = scheme_match.group(1).lower()
+        scheme_rest = scheme_match.group(2)
+        if scheme in attachment_endnote_schemes:
+            return ("file", os.path.join(attachment_root, urllib.parse.unquote(scheme_rest.lstrip("/"))))
+        elif scheme == "file":
+            return ("file", urllib.request.url2pathname(urllib.parse.urlparse(attachment_path).path))
+        elif scheme == "doi":
+            return ("url", "https://doi.org/" + scheme_rest.lstrip("/"))
+        elif scheme in attachment_url_schemes:
+            return ("url", attachment_path)
+    file_path = os.path.expanduser(attachment_path)
+    #
+    return ("file", os.path.join(attachment_root, file_path))
+
+
+def attachment_file_hash(file_path, block_size=attachment_block_size):
+    """
+    params:
+    file_path, str.
+    block_size, int. Bytes read at a time.
+
+    return: file_hash, {"md5": str, "size": int, "mtime_ns": int}
+
+    size and mtime are those of the file that was read. Runs in the
+    threads of attachment_stage.
+    """
+    #
+    md5_hash = hashlib.md5()
+    read_buffer = bytearray(block_size)
+    read_view = memoryview(read_buffer)
+    with open(file_path, "rb", buffering=0) as attachment_file:
+        file_stat = os.fstat(attachment_file.fileno())
+        read_count = attachment_file.readinto(read_buffer)
+        while read_count:
+            md5_hash.update(read_view[:read_count])
+            read_count = attachment_file.readinto(read_buffer)
+    file_hash = {"md5": md5_hash.hexdigest(), "size": file_stat.st_size, "mtime_ns": file_stat.st_mtime_ns}
+    #
+    return file_hash
+
+
+def attachment_cache_key(file_path, file_size, mtime_ns):
+    """
+    params:
+    file_path, str.
+    file_size, int.
+    mtime_ns, int.
+
+    return: key, str. For ZoteroCache.cache_get and cache_put.
+    """
+    #
+    return "md5\0%s\0%d\0%d" % (os.path.abspath(file_path), file_size, mtime_ns)
+
+
+def attachment_file_item_make(file_path, file_hash, link_mode="imported_file"):
+    """
+    params:
+    file_path, str.
+    file_hash, {}, see attachment_file_hash
+    link_mode, "imported_file" or "linked_file". linked_file items keep
+    the path.
+
+    return: zotero_attachment_dict, {}
+    """
+    #
+    filename = os.path.basename(file_path)
+    contentType, charset = mimetypes.guess_type(filename)
+    zotero_attachment_dict = {
+        "key": ZoteroBatch.zotero_key_make(),
+        "itemType": "attachment",
+        "linkMode": link_mode,
+        "title": filename,
+        "contentType": contentType or "application/octet-stream",
+        "charset": charset or "",
+        "tags": [],
+        "relations": {}
+    }
+    if link_mode == "linked_file":
+        zotero_attachment_dict["path"] = os.path.abspath(file_path)
+    else:
+        zotero_attachment_dict["filename"] = filename
+        zotero_attachment_dict["md5"] = file_hash["md5"]
+        zotero_attachment_dict["mtime"] = file_hash["mtime_ns"] // 1000000
+    #
+    return zotero_attachment_dict
+
+
+def attachment_link_item_make(url):
+    """
+    params: url, str.
+    return: zotero_attachment_dict, {}
+    """
+    #
+    zotero_attachment_dict = {
+        "itemType": "attachment",
+        "linkMode": "linked_url",
+        "title": url,
+        "url": url,
+        "tags": [],
+        "relations": {}
+    }
+    #
+    return zotero_attachment_dict
+
+
+def attachment_paths_pop(zotero_dict):
+    """
+    params: zotero_dict, {}. The attachments/ fields are removed.
+    return: attachment_paths, [(field, str), ...]
+    """
+    #
+    attachment_paths = []
+    for field in [field for field in zotero_dict if field.startswith(attachment_field_prefix)]:
+        field_value = zotero_dict.pop(field)
+        for attachment_path in (field_value if isinstance(field_value, list) else field_value.split("\n")):
+            if len(attachment_path.strip()) > 0:
+                attachment_paths.append((field, attachment_path.strip()))
+    #
+    return attachment_paths
+
+
+def attachment_stage(zotero_items, attachment_root=None, cache=None, attachment_report=None,
+                     workers=8, max_in_flight=None, link_mode="imported_file", diagnostics=None):
+    """
+    params:
+    zotero_items, iterable of {} or [{},[{}, ...]]
+    attachment_root, str or None, see attachment_path_resolve
+    cache, {} or None, see ZoteroCache.cache_open. Used from this thread only.
+    attachment_report, {} or None, see attachment_report_make
+    workers, int. Hashing threads.
+    max_in_flight, int or None. Items waiting for their hashes, 8 * workers
+    by default.
+    link_mode, "imported_file" or "linked_file", see attachment_file_item_make
+    diagnostics, [] or None. Files that can not be read.
+
+    yield: zotero_item, [{},[{}, ...]], in the order of zotero_items, its
+    attachments/ fields replaced by attachment items after its notes.
+
+    ZoteroBatch.zotero_item_group gives the attachment items the key of
+    their parent as parentItem, as it does for notes. Missing files are
+    reported and skipped.
+    """
+    #
+    attachment_report = attachment_report_make() if attachment_report is None else attachment_report
+    max_in_flight = max_in_flight if max_in_flight is not None else 8 * workers
+    pending_items = collections.deque()
+    #
+    def attachment_item_finish(zotero_item, attachment_jobs):
+        zotero_dict, zotero_note_list = zotero_item
+        for field, attachment_path, kind, location, file_hash in attachment_jobs:
+            if kind == "url":
+                zotero_note_list.append(attachment_link_item_make(location))
+                attachment_report["links"] += 1
+                continue
+            if isinstance(file_hash, concurrent.futures.Future):
+                try:
+                    file_hash = file_hash.result()
+                except OSError as attachment_error:
+                    attachment_report["missing"] += 1
+                    if diagnostics is not None:
+                        diagnostics.append({"field": field, "message": str(attachment_error), "text": attachment_path})
+                    continue
+                attachment_report["hashed"] += 1
+                attachment_report["bytes"] += file_hash["size"]
+                if cache is not None:
+                    ZoteroCache.cache_put(
+                        cache, attachment_cache_key(location, file_hash["size"], file_hash["mtime_ns"]), file_hash
+                    )
+            zotero_attachment_dict = attachment_file_item_make(location, file_hash, link_mode)
+            if link_mode != "linked_file":
+                attachment_report["files"][zotero_attachment_dict["key"]] = location
+            zotero_note_list.append(zotero_attachment_dict)
+        #
+        return zotero_item
+    #
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        for zotero_item in zotero_items:
+            if isinstance(zotero_item, dict):
+                zotero_item = [zotero_item, []]
+            elif len(zotero_item) < 2:
+                zotero_item = [zotero_item[0], []]
+            attachment_jobs = []
+            for field, attachment_path in attachment_paths_pop(zotero_item[0]):
+                kind, location = attachment_path_resolve(attachment_path, attachment_root)
+                file_hash = None
+                if kind == "file" and link_mode != "linked_file":
+                    if cache is not None:
+                        try:
+                            file_stat = os.stat(location)
+                            file_hash = ZoteroCache.cache_get(
+                                cache, attachment_cache_key(location, file_stat.st_size, file_stat.st_mtime_ns)
+                            )
+                        except OSError:
+                            file_hash = None
+                    if file_hash is None:
+                        file_hash = executor.submit(attachment_file_hash, location)
+                    else:
+                        attachment_report["cached"] += 1
+                elif kind == "file" and not os.path.isfile(location):
+                    attachment_report["missing"] += 1
+                    if diagnostics is not None:
+                        diagnostics.append({"field": field, "message": "file not found", "text": attachment_path})
+                    continue
+                attachment_jobs.append((field, attachment_path, kind, location, file_hash))
+            pending_items.append((zotero_item, attachment_jobs))
+            if len(pending_items) >= max_in_flight:
+                yield attachment_item_finish(*pending_items.popleft())
+        while len(pending_items) > 0:
+            yield attachment_item_finish(*pending_items.popleft())
+    if cache is not None:
+        cache["connection"].commit()
@@ -0,0 +1,176 @@
+"""
+Batches of converted items for the Zotero write API.
+
+POST <userOrGroupPrefix>/items accepts at most 50 objects per request and
+a Zotero-Write-Token per request. Items get client assigned keys so that
+their notes can point to them with parentItem and go in the same request,
+instead of waiting for resp["success"]["0"] of every parent.
+"""
+
+__author__ = "Kaan Eraslan"
+__license__ = "MIT License, see LICENSE"
+
+# Packages ----------------------------------------------
+
+import json
+import secrets
+import urllib.request
+
+from ZotRisJson import RisToZotero
+
+# --------------------------------------------------------
+
+zotero_batch_size = 50
+zotero_key_chars = "23456789ABCDEFGHIJKLMNPQRSTUVWXYZ"
+
+
+def zotero_key_make():
+    """
+    return: key, str. A client assigned Zotero object key.
+    """
+    #
+    key = "".join(secrets.choice(zotero_key_chars) for i in range(8))
+    #
+    return key
+
+
+def zotero_batch_make(batch_items, batch_after=None):
+    """
+    params:
+    batch_items, [{}, ...]
+    batch_after, str or None. Token of the batch that must go through first.
+
+    return: zotero_batch, {"token": str, "items": [{}, ...]}, with "after"
+    if batch_after is given.
+    """
+    #
+    zotero_batch = {"token": RisToZotero.zotero_write_token(), "items": batch_items}
+    if batch_after is not None:
+        zotero_batch["after"] = batch_after
+    #
+    return zotero_batch
+
+
+def zotero_item_group(zotero_item):
+    """
+    params: zotero_item, {} or [{},[{}, ...]]
+    return: zotero_object_list, [{}, ...], the parent followed by its notes.
+
+    The parent gets a key if it has none, the notes get their own key and
+    the parent key as parentItem.
+    """
+    #
+    if isinstance(zotero_item, dict):
+        zotero_dict = zotero_item
+        zotero_note_list = []
+    else:
+        zotero_dict = zotero_item[0]
+        zotero_note_list = zotero_item[1] if len(zotero_item) > 1 else []
+    #
+    if "key" not in zotero_dict:
+        zotero_dict["key"] = zotero_key_make()
+    zotero_object_list = [zotero_dict]
+    for zotero_note_dict in zotero_note_list:
+        if "key" not in zotero_note_dict:
+            zotero_note_dict["key"] = zotero_key_make()
+        zotero_note_dict["parentItem"] = zotero_dict["key"]
+        zotero_object_list.append(zotero_note_dict)
+    #
+    return zotero_object_list
+
+
+def zotero_batch_plan(zotero_items, batch_size=zotero_batch_size):
+    """
+    params:
+    zotero_items, iterable of {} or [{},[{}, ...]]
+    batch_size, int. At most 50 for the Zotero API.
+
+    yield: zotero_batch, {"token": str, "items": [{}, ...]}
+
+    A parent and its notes are kept in the same batch. A parent with more
+    notes than fit in one batch is put first and the rest of its notes
+    follow in the next batches, these have the token of the batch of the
+    parent as "after" and must only be sent once that batch went through.
+    """
+    #
+    batch_items = []
+    batch_after = None
+    for zotero_item in zotero_items:
+        zotero_object_list = zotero_item_group(zotero_item)
+        if len(batch_items) + len(zotero_object_list) > batch_size and len(batch_items) > 0:
+            yield zotero_batch_make(batch_items, batch_after)
+            batch_items = []
+            batch_after = None
+        if len(zotero_object_list) > batch_size:
+            parent_batch = zotero_batch_make(zotero_object_list[:batch_size])
+            yield parent_batch
+            zotero_object_list = zotero_object_list[batch_size:]
+            while len(zotero_object_list) > batch_size:
+                yield zotero_batch_make(zotero_object_list[:batch_size], parent_batch["token"])
+                zotero_object_list = zotero_object_list[batch_size:]
+            batch_after = parent_batch["token"]
+        batch_items.extend(zotero_object_list)
+    #
+    if len(batch_items) > 0:
+        yield zotero_batch_make(batch_items, batch_after)
+
+
+def zotero_batch_request(zotero_batch, items_url, api_key):
+    """
+    params:
+    zotero_batch, {}, see zotero_batch_plan
+    items_url, str. https://api.zotero.org/groups/<id>/items or a local
+    stub server.
+    api_key, str.
+
+    return: request, urllib.request.Request
+    """
+    #
+    request = urllib.request.Request(
+        items_url,
+        data=json.dumps(zotero_batch["items"]).encode("utf-8"),
+        method="POST",
+        headers={
+            "Content-Type": "application/json",
+            "Zotero-API-Key": api_key,
+            "Zotero-API-Version": "3",
+            "Zotero-Write-Token": zotero_batch["token"]
+        }
+    )
+    #
+    return request
+
+
+def zotero_batch_send(zotero_batch, items_url, api_key, timeout=60):
+    """
+    params:
+    zotero_batch, {}, see zotero_batch_plan
+    items_url, str.
+    api_key, str.
+    timeout, int. Seconds.
+
+    return: resp, {"success": {}, "unchanged": {}, "failed": {}}
+    """
+    #
+    request = zotero_batch_request(zotero_batch, items_url, api_key)
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        resp = json.loads(response.read().decode("utf-8"))
+    #
+    return resp
+
+
+def zotero_batch_failed(resp, zotero_batch):
+    """
+    params:
+    resp, {}, see zotero_batch_send
+    zotero_batch, {}
+
+    return: failed_list, [(zotero_object, failure), ...]
+    """
+    #
+    failed_list = [
+        (zotero_batch["items"][int(item_index)], failure)
+        for item_index, failure in resp.get("failed", {}).items()
+    ]
+    #
+    return failed_list
@@ -0,0 +1,243 @@
+"""
+On-disk cache of converted records, so that re-importing a nearly
+identical export only converts the records that changed.
+
+Records are keyed by a hash of their normalised raw text, of the version
+of the mapping tables, RisToZotero.ris_tables_version or
+BibtexToZotero.bibtex_tables_version, and of the converter: its name, as
+several converters share the RIS tables, and its module version,
+RisToZotero.ris_converter_version or BibtexToZotero.bibtex_converter_version.
+Changing a table or a converter gives new keys, the old entries are
+evicted in time. The least recently used entries are
+evicted when the cache holds more than max_entries records or
+max_bytes of JSON.
+
+    cache = cache_open("conversions.sqlite")
+    for zotero_item in cache_convert_iter(
+        cache, ris_record_read(path), ris_convert, ris_tables_version(),
+        "ris_p_dict_map", ris_converter_version
+    ):
+        ...
+    cache_close(cache)
+"""
+
+__author__ = "Kaan Eraslan"
+__license__ = "MIT License, see LICENSE"
+
+# Packages ----------------------------------------------
+
+import hashlib
+import json
+import sqlite3
+import time
+
+# --------------------------------------------------------
+
+cache_evict_every = 1000
+
+
+def cache_open(path, max_entries=1000000, max_bytes=2 ** 30):
+    """
+    params:
+    path, str. ":memory:" for a cache that is not kept.
+    max_entries, int or None.
+    max_bytes, int or None. Size of the stored JSON.
+
+    return: cache, {}
+    """
+    #
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS conversions ("
+        "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, accessed REAL NOT NULL)"
+    )
+    connection.execute("CREATE INDEX IF NOT EXISTS conversions_accessed ON conversions (accessed)")
+    cache = {
+        "connection": connection,
+        "max_entries": max_entries,
+        "max_bytes": max_bytes,
+        "inserts": 0,
+        "hits": 0,
+        "misses": 0
+    }
+    #
+    return cache
+
+
+def cache_close(cache):
+    """
+    params: cache, {}
+    """
+    #
+    cache_evict(cache)
+    cache["connection"].commit()
+    cache["connection"].close()
+
+
+def cache_text_normalise(raw_text):
+    """
+    params: raw_text, str.
+    return: normalised_text, str.
+
+    Line endings, trailing spaces and blank lines do not change the key.
+    """
+    #
+    normalised_text = "\n".join(
+        raw_line.rstrip() for raw_line in raw_text.splitlines() if len(raw_line.strip()) > 0
+    )
+    #
+    return normalised_text
+
+
+def cache_key_make(raw_text, tables_version, converter, converter_version):
+    """
+    params:
+    raw_text, str.
+    tables_version, str.
+    converter, str. Name of the conversion, e.g. "ris_p_dict_map" or
+    "pascal_francis_journal_zotero_map".
+    converter_version, int or str. Version of the module of the converter.
+
+    return: key, str.
+    """
+    #
+    key_hash = hashlib.sha256(tables_version.encode("utf-8"))
+    key_hash.update(b"\0")
+    key_hash.update(converter.encode("utf-8"))
+    key_hash.update(b"\0")
+    key_hash.update(str(converter_version).encode("utf-8"))
+    key_hash.update(b"\0")
+    key_hash.update(cache_text_normalise(raw_text).encode("utf-8"))
+    #
+    return key_hash.hexdigest()
+
+
+def cache_get(cache, key):
+    """
+    params:
+    cache, {}
+    key, str.
+
+    return: zotero_item, or None if the key is not in the cache.
+    """
+    #
+    connection = cache["connection"]
+    row = connection.execute("SELECT value FROM conversions WHERE key = ?", (key,)).fetchone()
+    if row is None:
+        cache["misses"] += 1
+        return None
+    cache["hits"] += 1
+    connection.execute("UPDATE conversions SET accessed = ? WHERE key = ?", (time.time(), key))
+    #
+    return json.loads(row[0])
+
+
+def cache_put(cache, key, zotero_item):
+    """
+    params:
+    cache, {}
+    key, str.
+    zotero_item, JSON serialisable.
+    """
+    #
+    value = json.dumps(zotero_item, ensure_ascii=False, separators=(",", ":"))
+    cache["connection"].execute(
+        "INSERT OR REPLACE INTO conversions (key, value, size, accessed) VALUES (?, ?, ?, ?)",
+        (key, value, len(value), time.time())
+    )
+    cache["inserts"] += 1
+    if cache["inserts"] % cache_evict_every == 0:
+        cache_evict(cache)
+
+
+def cache_evict(cache):
+    """
+    params: cache, {}
+    return: evicted, int. Entries removed.
+
+    Removes the least recently used entries until the cache is within
+    max_entries and max_bytes.
+    """
+    #
+    connection = cache["connection"]
+    entry_count, byte_count = connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM conversions").fetchone()
+    evicted = 0
+    if cache["max_entries"] is not None and entry_count > cache["max_entries"]:
+        excess = entry_count - cache["max_entries"]
+        connection.execute(
+            "DELETE FROM conversions WHERE key IN (SELECT key FROM conversions ORDER BY accessed LIMIT ?)",
+            (excess,)
+        )
+        evicted += excess
+        byte_count = connection.execute("SELECT COALESCE(SUM(size), 0) FROM conversions").fetchone()[0]
+    if cache["max_bytes"] is not None and byte_count > cache["max_bytes"]:
+        freed = 0
+        evict_keys = []
+        for key, size in connection.execute("SELECT key, size FROM conversions ORDER BY accessed"):
+            if byte_count - freed <= cache["max_bytes"]:
+                break
+            evict_keys.append((key,))
+            freed += size
+        connection.executemany("DELETE FROM conversions WHERE key = ?", evict_keys)
+        evicted += len(evict_keys)
+    connection.commit()
+    #
+    return evicted
+
+
+def cache_convert(cache, raw_text, convert, tables_version, converter, converter_version):
+    """
+    params:
+    cache, {}
+    raw_text, str. One record.
+    convert, function. raw_text => zotero_item
+    tables_version, str.
+    converter, str. See cache_key_make
+    converter_version, int or str.
+
+    return: zotero_item
+    """
+    #
+    key = cache_key_make(raw_text, tables_version, converter, converter_version)
+    zotero_item = cache_get(cache, key)
+    if zotero_item is None:
+        zotero_item = convert(raw_text)
+        cache_put(cache, key, zotero_item)
+    #
+    return zotero_item
+
+
+def cache_convert_iter(cache, raw_text_list, convert, tables_version, converter, converter_version):
+    """
+    params:
+    cache, {}
+    raw_text_list, iterable of str, e.g. RisToZotero.ris_record_read or
+    BibtexToZotero.bibtex_entry_split
+    convert, function. raw_text => zotero_item
+    tables_version, str. For BibTeX, add a hash of the @string macros the
+    entries use, they are not part of the entry text.
+    converter, str. See cache_key_make
+    converter_version, int or str.
+
+    yield: zotero_item
+    """
+    #
+    for raw_text in raw_text_list:
+        yield cache_convert(cache, raw_text, convert, tables_version, converter, converter_version)
+    cache["connection"].commit()
+
+
+def cache_stats(cache):
+    """
+    params: cache, {}
+    return: stats, {"hits", "misses", "entries", "bytes"}
+    """
+    #
+    entry_count, byte_count = cache["connection"].execute(
+        "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM conversions"
+    ).fetchone()
+    stats = {"hits": cache["hits"], "misses": cache["misses"], "entries": entry_count, "bytes": byte_count}
+    #
+    return stats
@@ -0,0 +1,342 @@
+"""
+Duplicate detection over converted items, whatever their source.
+
+Items are indexed once by normalised DOI, by ISBN (as ISBN-13), by ISSN
+with volume and first page, and by MinHash bands of their title words.
+Only items that share one of these keys are compared, so the work grows
+with the number of items and not with its square. Pairs found through
+a title are confirmed on title trigrams, year and first author, pairs
+found through an ISBN or ISSN on the title only, a DOI is enough.
+
+    report = dedup_report(zotero_items)
+    for cluster in report["clusters"]:
+        cluster["keep"], cluster["items"], cluster["reasons"]
+"""
+
+__author__ = "Kaan Eraslan"
+__license__ = "MIT License, see LICENSE"
+
+# Packages ----------------------------------------------
+
+import functools
+import hashlib
+import random
+import re
+import unicodedata
+
+# --------------------------------------------------------
+
+dedup_doi_re = re.compile(r"10\.\d{4,9}/\S+")
+dedup_year_re = re.compile(r"\d{4}")
+dedup_isbn_re = re.compile(r"[0-9Xx][0-9Xx\- ]{8,16}[0-9Xx]")
+dedup_issn_re = re.compile(r"\d{4}-?\d{3}[\dXx]")
+dedup_word_re = re.compile(r"\w+")
+dedup_stop_words = frozenset([
+    "a", "an", "and", "at", "de", "der", "des", "die", "du", "et", "for", "in", "la", "le", "les",
+    "of", "on", "the", "to", "und", "von", "with"
+])
+
+
+def dedup_doi_normalise(doi):
+    """
+    params: doi, str.
+    return: doi, str. "10.xxxx/..." in lower case, or "" if there is none.
+    """
+    #
+    doi_match = dedup_doi_re.search(doi or "")
+    if doi_match is None:
+        return ""
+    #
+    return doi_match.group().lower().rstrip(".")
+
+
+def dedup_isbn_normalise(isbn):
+    """
+    params: isbn, str. One or more ISBN.
+    return: isbn_list, [str, ...] as ISBN-13.
+    """
+    #
+    isbn_list = []
+    for isbn_match in dedup_isbn_re.finditer(isbn or ""):
+        isbn_chars = isbn_match.group().replace("-", "").replace(" ", "").upper()
+        if len(isbn_chars) == 10:
+            isbn_body = "978" + isbn_chars[:9]
+            check_sum = sum(int(digit) * (1 if index % 2 == 0 else 3) for index, digit in enumerate(isbn_body))
+            isbn_list.append(isbn_body + str((10 - check_sum % 10) % 10))
+        elif len(isbn_chars) == 13 and isbn_chars.isdigit():
+            isbn_list.append(isbn_chars)
+    #
+    return isbn_list
+
+
+def dedup_issn_normalise(issn):
+    """
+    params: issn, str.
+    return: issn, str. Eight characters, or "".
+    """
+    #
+    issn_match = dedup_issn_re.search(issn or "")
+    if issn_match is None:
+        return ""
+    #
+    return issn_match.group().replace("-", "").upper()
+
+
+def dedup_title_normalise(title):
+    """
+    params: title, str.
+    return: title, str. Lower case, without accents, punctuation or braces.
+    """
+    #
+    title = title or ""
+    if not title.isascii():
+        title = unicodedata.normalize("NFKD", title)
+        title = "".join(char for char in title if not unicodedata.combining(char))
+    #
+    return " ".join(dedup_word_re.findall(title.lower()))
+
+
+def dedup_item_fields(zotero_item):
+    """
+    params: zotero_item, {} or [{},[{}, ...]]
+    return: item_fields, {}. The normalised fields used for matching.
+    """
+    #
+    zotero_dict = zotero_item if isinstance(zotero_item, dict) else zotero_item[0]
+    first_author = ""
+    for creator in zotero_dict.get("creators", []):
+        first_author = creator.get("lastName") or creator.get("name") or ""
+        if len(first_author) > 0:
+            break
+    year_match = dedup_year_re.search(zotero_dict.get("date", "") or "")
+    pages = zotero_dict.get("pages", "") or ""
+    item_fields = {
+        "doi": dedup_doi_normalise(zotero_dict.get("DOI", "")),
+        "isbn": dedup_isbn_normalise(zotero_dict.get("ISBN", "")),
+        "issn": dedup_issn_normalise(zotero_dict.get("ISSN", "")),
+        "volume": str(zotero_dict.get("volume", "") or "").strip(),
+        "first_page": pages.split("-")[0].strip(),
+        "title": dedup_title_normalise(zotero_dict.get("title", "")),
+        "year": year_match.group() if year_match is not None else "",
+        "first_author": dedup_title_normalise(first_author)
+    }
+    #
+    return item_fields
+
+
+dedup_hash_count = 32
+dedup_hash_prime = 2 ** 61 - 1
+
+
+def dedup_hash_coefficients_make(hash_count, seed=20240229):
+    """
+    params:
+    hash_count, int.
+    seed, int. Fixed, so that the signatures are the same in every run.
+
+    return: hash_coefficients, ((a, b), ...)
+
+    dedup_word_signature computes a * h + b mod dedup_hash_prime over one
+    64 bit hash h of the word. With random a and b, the hashes are
+    independent, which seeds of a single CRC are not.
+    """
+    #
+    coefficient_random = random.Random(seed)
+    hash_coefficients = tuple(
+        (coefficient_random.randrange(1, dedup_hash_prime), coefficient_random.randrange(0, dedup_hash_prime))
+        for hash_index in range(hash_count)
+    )
+    #
+    return hash_coefficients
+
+
+dedup_hash_coefficients = dedup_hash_coefficients_make(dedup_hash_count)
+
+
+@functools.lru_cache(maxsize=65536)
+def dedup_word_signature(word):
+    """
+    params: word, str.
+    return: word_signature, (int, ...). dedup_hash_count hashes, see
+    dedup_hash_coefficients.
+
+    Title words repeat a lot, their hashes are cached.
+    """
+    #
+    word_hash = int.from_bytes(hashlib.blake2b(word.encode("utf-8"), digest_size=8).digest(), "little")
+    word_hash = word_hash % dedup_hash_prime
+    #
+    return tuple((a * word_hash + b) % dedup_hash_prime for a, b in dedup_hash_coefficients)
+
+
+def dedup_minhash_bands(title, bands, rows):
+    """
+    params:
+    title, str. Normalised.
+    bands, int.
+    rows, int. Hashes per band, bands * rows at most dedup_hash_count.
+
+    return: band_keys, [tuple, ...]
+    """
+    #
+    word_signatures = [
+        dedup_word_signature(word) for word in set(title.split()) if word not in dedup_stop_words
+    ]
+    if len(word_signatures) == 0:
+        return []
+    signature = list(map(min, zip(*word_signatures)))
+    band_keys = [
+        ("title", band_index) + tuple(signature[band_index * rows:(band_index + 1) * rows])
+        for band_index in range(bands)
+    ]
+    #
+    return band_keys
+
+
+def dedup_trigrams(title):
+    """
+    params: title, str.
+    return: trigram_set, set.
+    """
+    #
+    padded_title = "  " + title + " "
+    #
+    return set(padded_title[index:index + 3] for index in range(len(padded_title) - 2))
+
+
+def dedup_title_similarity(title_a, title_b):
+    """
+    params:
+    title_a, str.
+    title_b, str.
+
+    return: similarity, float. Jaccard index of the title trigrams.
+    """
+    #
+    if title_a == title_b:
+        return 1.0
+    trigrams_a = dedup_trigrams(title_a)
+    trigrams_b = dedup_trigrams(title_b)
+    #
+    return len(trigrams_a & trigrams_b) / max(len(trigrams_a | trigrams_b), 1)
+
+
+def dedup_pair_check(fields_a, fields_b, reason, threshold):
+    """
+    params:
+    fields_a, {}, see dedup_item_fields
+    fields_b, {}
+    reason, str. The kind of key the two items share.
+    threshold, float.
+
+    return: bool.
+    """
+    #
+    if reason == "doi":
+        return True
+    if len(fields_a["title"]) == 0 or len(fields_b["title"]) == 0:
+        return False
+    if reason in ("isbn", "issn"):
+        return dedup_title_similarity(fields_a["title"], fields_b["title"]) >= 0.5
+    # the cheap fields first, the trigrams only for the pairs left
+    for field in ("doi", "year", "first_author"):
+        if fields_a[field] and fields_b[field] and fields_a[field] != fields_b[field]:
+            return False
+    #
+    return dedup_title_similarity(fields_a["title"], fields_b["title"]) >= threshold
+
+
+def dedup_root(parents, index):
+    """
+    params:
+    parents, [int, ...]. Union-find forest.
+    index, int.
+
+    return: root, int.
+    """
+    #
+    root = index
+    while parents[root] != root:
+        root = parents[root]
+    while parents[index] != root:
+        parents[index], index = root, parents[index]
+    #
+    return root
+
+
+def dedup_report(zotero_items, threshold=0.8, bands=8, rows=4, max_bucket=50):
+    """
+    params:
+    zotero_items, iterable of {} or [{},[{}, ...]]
+    threshold, float. Title trigram similarity of near duplicates.
+    bands, int. MinHash bands, more bands find more candidate pairs.
+    rows, int. Hashes per band, more rows find fewer. bands * rows can not
+    be more than dedup_hash_count.
+    max_bucket, int. Items of a key compared with a new item, keeps very
+    common keys from becoming quadratic.
+
+    return: report, {"items": int, "duplicates": int, "clusters": [{}, ...]}
+
+    Each cluster gives the item indexes, the one to keep (the one with the
+    most fields) and the reasons its items were matched.
+    """
+    #
+    if bands * rows > dedup_hash_count:
+        raise ValueError("bands * rows should be at most %d" % dedup_hash_count)
+    buckets = {}
+    item_fields_list = []
+    field_counts = []
+    parents = []
+    reasons = {}
+    for item_index, zotero_item in enumerate(zotero_items):
+        item_fields = dedup_item_fields(zotero_item)
+        item_fields_list.append(item_fields)
+        zotero_dict = zotero_item if isinstance(zotero_item, dict) else zotero_item[0]
+        field_counts.append(sum(1 for value in zotero_dict.values() if value))
+        parents.append(item_index)
+        #
+        item_keys = []
+        if item_fields["doi"]:
+            item_keys.append(("doi", item_fields["doi"]))
+        for isbn in item_fields["isbn"]:
+            item_keys.append(("isbn", isbn))
+        if item_fields["issn"] and item_fields["first_page"]:
+            item_keys.append(("issn", item_fields["issn"], item_fields["volume"], item_fields["first_page"]))
+        item_keys.extend(dedup_minhash_bands(item_fields["title"], bands, rows))
+        #
+        compared = set()
+        for item_key in item_keys:
+            bucket = buckets.setdefault(item_key, [])
+            for other_index in bucket[-max_bucket:]:
+                if other_index in compared:
+                    continue
+                compared.add(other_index)
+                root_a = dedup_root(parents, item_index)
+                root_b = dedup_root(parents, other_index)
+                if root_a == root_b:
+                    continue
+                if dedup_pair_check(item_fields, item_fields_list[other_index], item_key[0], threshold):
+                    parents[root_a] = root_b
+                    reasons.setdefault(root_b, set()).add(item_key[0])
+                    reasons[root_b].update(reasons.pop(root_a, set()))
+            bucket.append(item_index)
+    #
+    cluster_dict = {}
+    for item_index in range(len(parents)):
+        cluster_dict.setdefault(dedup_root(parents, item_index), []).append(item_index)
+    clusters = []
+    for root, item_index_list in cluster_dict.items():
+        if len(item_index_list) < 2:
+            continue
+        clusters.append({
+            "items": item_index_list,
+            "keep": max(item_index_list, key=lambda index: field_counts[index]),
+            "reasons": sorted(reasons.get(root, set()))
+        })
+    report = {
+        "items": len(parents),
+        "duplicates": sum(len(cluster["items"]) - 1 for cluster in clusters),
+        "clusters": clusters
+    }
+    #
+    return report
@@ -0,0 +1,261 @@
+"""
+Incremental re-import against the manifest of the previous run.
+
+The manifest maps the identity of every record (RisToZotero.ris_record_identity,
+BibtexToZotero.bibtex_record_identity) to the hash of its converted item
+and to its Zotero key. manifest_diff_iter then only gives the items that
+are new, changed or deleted since that run. Changed items carry the key
+of the item already in the library, so they can be sent as updates.
+
+    manifest = manifest_load("anatolia.manifest.json")
+    new_manifest = manifest_new()
+    identities = (ris_record_identity(ris_text) for ris_text in ris_record_read(path))
+    identified_items = (
+        (ris_record_identity(ris_text), ris_item_map(ris_text, type_map, field_map, dependent_fields))
+        for ris_text in ris_record_read(path)
+    )
+    for status, identity, zotero_item in manifest_diff_iter(
+        identified_items, manifest, new_manifest, identities=identities
+    ):
+        ...
+    manifest_save(new_manifest, "anatolia.manifest.json")
+
+The export is read twice, once for the identities only, and the items
+are streamed.
+
+Save the new manifest only once the changes have been uploaded.
+"""
+
+__author__ = "Kaan Eraslan"
+__license__ = "MIT License, see LICENSE"
+
+# Packages ----------------------------------------------
+
+import collections
+import hashlib
+import json
+import os
+
+from zotJson import ZoteroBatch
+
+# --------------------------------------------------------
+
+manifest_format = 1
+manifest_ignored_fields = ("key", "version", "parentItem")
+
+
+def manifest_new():
+    """
+    return: manifest, {"format": int, "items": {}}
+    """
+    #
+    manifest = {"format": manifest_format, "items": {}}
+    #
+    return manifest
+
+
+def manifest_load(path):
+    """
+    params: path, str.
+    return: manifest, {}. Empty if the file does not exist yet.
+    """
+    #
+    if not os.path.exists(path):
+        return manifest_new()
+    with open(path, "r", encoding="utf-8") as manifest_file:
+        manifest = json.load(manifest_file)
+    if manifest.get("format") != manifest_format:
+        raise ValueError("Unknown manifest format: " + str(manifest.get("format")))
+    #
+    return manifest
+
+
+def manifest_save(manifest, path):
+    """
+    params:
+    manifest, {}
+    path, str.
+
+    Written to a temporary file first, so a failed save keeps the previous
+    manifest.
+    """
+    #
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "w", encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file, ensure_ascii=False, separators=(",", ":"))
+    os.replace(temporary_path, path)
+
+
+def manifest_strip(zotero_item):
+    """
+    params: zotero_item, {} or [{},[{}, ...]]
+    return: zotero_item, without the fields set during upload.
+    """
+    #
+    if isinstance(zotero_item, dict):
+        return {
+            field: value for field, value in zotero_item.items() if field not in manifest_ignored_fields
+        }
+    #
+    return [manifest_strip(zotero_part) for zotero_part in zotero_item]
+
+
+def manifest_item_hash(zotero_item):
+    """
+    params: zotero_item, {} or [{},[{}, ...]]
+    return: item_hash, str.
+    """
+    #
+    item_json = json.dumps(manifest_strip(zotero_item), sort_keys=True, ensure_ascii=False)
+    item_hash = hashlib.sha256(item_json.encode("utf-8")).hexdigest()
+    #
+    return item_hash
+
+
+def manifest_item_parent(zotero_item):
+    """
+    params: zotero_item, {} or [{},[{}, ...]]
+    return: zotero_dict, {}. The item itself, not its notes.
+    """
+    #
+    if isinstance(zotero_item, dict):
+        return zotero_item
+    #
+    return zotero_item[0]
+
+
+def manifest_item_keys(zotero_item, previous_entry):
+    """
+    params:
+    zotero_item, {} or [{},[{}, ...]]
+    previous_entry, {} or None. The manifest entry of the previous run.
+
+    return: manifest_entry_keys, {"key": str, "notes": [str, ...]}
+
+    Gives the item, and its notes in order, the keys they had in the
+    previous run, or new client assigned keys.
+    """
+    #
+    zotero_dict = manifest_item_parent(zotero_item)
+    if previous_entry is not None:
+        zotero_dict["key"] = previous_entry["key"]
+        previous_note_keys = previous_entry.get("notes", [])
+    else:
+        previous_note_keys = []
+    if "key" not in zotero_dict:
+        zotero_dict["key"] = ZoteroBatch.zotero_key_make()
+    #
+    note_keys = []
+    if not isinstance(zotero_item, dict) and len(zotero_item) > 1:
+        for note_index, zotero_note_dict in enumerate(zotero_item[1]):
+            if note_index < len(previous_note_keys):
+                zotero_note_dict["key"] = previous_note_keys[note_index]
+            elif "key" not in zotero_note_dict:
+                zotero_note_dict["key"] = ZoteroBatch.zotero_key_make()
+            note_keys.append(zotero_note_dict["key"])
+    manifest_entry_keys = {"key": zotero_dict["key"], "notes": note_keys}
+    #
+    return manifest_entry_keys
+
+
+def manifest_identity_fallback(identity, item_hash, identity_counts, fallback_counts):
+    """
+    params:
+    identity, str or None.
+    item_hash, str. See manifest_item_hash
+    identity_counts, collections.Counter. Items of the run per identity.
+    fallback_counts, collections.Counter. Updated in place.
+
+    return: identity, str. The identity the item is kept under.
+
+    An identity shared by several items becomes "identity#n", n counting
+    its items in the order of the run. Items without an identity are kept
+    under the hash of their content, "hash:" + item_hash, with "#n" for
+    the repeats of the same content.
+    """
+    #
+    if identity is not None and identity_counts[identity] < 2:
+        return identity
+    base_identity = identity if identity is not None else "hash:" + item_hash
+    fallback_counts[base_identity] += 1
+    if identity is None and fallback_counts[base_identity] == 1:
+        return base_identity
+    #
+    return base_identity + "#" + str(fallback_counts[base_identity])
+
+
+def manifest_diff_iter(identified_items, manifest, new_manifest, collisions=None, identities=None):
+    """
+    params:
+    identified_items, iterable of (identity, zotero_item). Read twice if
+    identities is None, so a list or an object giving a new iterator each
+    time, not a generator.
+    manifest, {}. The manifest of the previous run.
+    new_manifest, {}. Filled with every item seen in this run.
+    collisions, {} or None. Filled with {identity: count} for the
+    identities more than one item of this run has.
+    identities, iterable of str or None, or None. The identities of
+    identified_items, in the same order, e.g. ris_record_identity over
+    the records, without converting them.
+
+    yield: (status, identity, zotero_item)
+
+    status is "new", "changed" or "deleted", unchanged items are skipped.
+    New items get client assigned keys, changed items and their notes get
+    the keys they have in the library. Deleted items, and the notes a
+    changed item no longer has, come last, as {"key": key}.
+
+    The identities are counted in a first pass, only the counts are kept.
+    An identity shared by several items, or a missing one, is replaced
+    with a fallback identity, see manifest_identity_fallback, which is
+    written to the manifest like the others.
+    """
+    #
+    if identities is None:
+        if iter(identified_items) is identified_items:
+            raise TypeError("identified_items is read twice, give a list or the identities")
+        identities = (identity for identity, zotero_item in identified_items)
+    identity_counts = collections.Counter(identity for identity in identities if identity is not None)
+    for identity, identity_count in identity_counts.items():
+        if identity_count > 1 and collisions is not None:
+            collisions[identity] = identity_count
+    fallback_counts = collections.Counter()
+    previous_items = manifest["items"]
+    current_items = new_manifest["items"]
+    deleted_note_keys = []
+    for identity, zotero_item in identified_items:
+        item_hash = manifest_item_hash(zotero_item)
+        identity = manifest_identity_fallback(identity, item_hash, identity_counts, fallback_counts)
+        previous_entry = previous_items.get(identity)
+        manifest_entry = manifest_item_keys(zotero_item, previous_entry)
+        manifest_entry["hash"] = item_hash
+        current_items[identity] = manifest_entry
+        if previous_entry is None:
+            yield ("new", identity, zotero_item)
+            continue
+        for note_key in previous_entry.get("notes", [])[len(manifest_entry["notes"]):]:
+            deleted_note_keys.append((identity, note_key))
+        if previous_entry["hash"] != item_hash:
+            yield ("changed", identity, zotero_item)
+    #
+    for identity, note_key in deleted_note_keys:
+        yield ("deleted", identity, {"key": note_key})
+    for identity, previous_entry in previous_items.items():
+        if identity not in current_items:
+            yield ("deleted", identity, {"key": previous_entry["key"]})
+
+
+def manifest_diff(identified_items, manifest, new_manifest, identities=None):
+    """
+    params: see manifest_diff_iter
+    return: diff_dict, {"new": [], "changed": [], "deleted": [], "collisions": {}},
+    lists of (identity, zotero_item) and the repeated identities.
+    """
+    #
+    diff_dict = {"new": [], "changed": [], "deleted": [], "collisions": {}}
+    for status, identity, zotero_item in manifest_diff_iter(
+        identified_items, manifest, new_manifest, diff_dict["collisions"], identities
+    ):
+        diff_dict[status].append((identity, zotero_item))
+    #
+    return diff_dict
@@ -0,0 +1,181 @@
+"""
+Optional per stage metrics of the converters.
+
+ris_p_dict_map and bibtexTozotero time each of their stages when metrics
+are enabled: wall time, records, lines (ris lines or bibtex fields) and,
+if asked for, the memory of each stage as traced by tracemalloc: the
+highest peak a call reached above the memory it started with, and the
+bytes the calls left allocated. While metrics_state is None, the
+converters only check it once per record.
+
+    metrics_enable(track_allocations=True)
+    ...convert...
+    print(metrics_prometheus())
+    metrics_disable()
+
+Metrics are kept per process, the workers of RisParallel keep their own.
+"""
+
+__author__ = "Kaan Eraslan"
+__license__ = "MIT License, see LICENSE"
+
+# Packages ----------------------------------------------
+
+import json
+import time
+import tracemalloc
+
+# --------------------------------------------------------
+
+metrics_state = None
+metrics_prefix = "zotero_stage"
+
+
+def metrics_enable(track_allocations=False):
+    """
+    params: track_allocations, bool. Also trace the memory of each stage
+    with tracemalloc, started here if it is not tracing already. Every
+    allocation is then traced, which makes conversion several times
+    slower.
+
+    return: metrics_state, {}. A new, empty state.
+    """
+    #
+    global metrics_state
+    tracemalloc_started = track_allocations and not tracemalloc.is_tracing()
+    if tracemalloc_started:
+        tracemalloc.start()
+    metrics_state = {
+        "track_allocations": track_allocations,
+        "tracemalloc_started": tracemalloc_started,
+        "started": time.time(),
+        "stages": {}
+    }
+    #
+    return metrics_state
+
+
+def metrics_disable():
+    """
+    return: metrics_state, {} or None. The state collected so far.
+
+    Stops tracemalloc if metrics_enable started it.
+    """
+    #
+    global metrics_state
+    collected_state = metrics_state
+    metrics_state = None
+    if collected_state is not None and collected_state["tracemalloc_started"]:
+        tracemalloc.stop()
+    #
+    return collected_state
+
+
+def metrics_stage_start():
+    """
+    return: metrics_token, (float, int). Passed to metrics_stage_end, the
+    traced bytes at the start of the stage, 0 when not tracking.
+    """
+    #
+    if metrics_state is not None and metrics_state["track_allocations"] and tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+        return (time.perf_counter(), tracemalloc.get_traced_memory()[0])
+    #
+    return (time.perf_counter(), 0)
+
+
+def metrics_stage_end(stage, metrics_token, records=0, lines=0):
+    """
+    params:
+    stage, str.
+    metrics_token, (float, int), from metrics_stage_start or from the
+    previous metrics_stage_end.
+    records, int. Records that went through the stage.
+    lines, int. Lines or fields of these records.
+
+    return: metrics_token, for the next stage.
+    """
+    #
+    if metrics_state is None:
+        return metrics_token
+    end_time = time.perf_counter()
+    end_bytes, peak_bytes = metrics_token[1], metrics_token[1]
+    if metrics_state["track_allocations"] and tracemalloc.is_tracing():
+        end_bytes, peak_bytes = tracemalloc.get_traced_memory()
+    stage_metrics = metrics_state["stages"].get(stage)
+    if stage_metrics is None:
+        stage_metrics = {
+            "calls": 0, "seconds": 0.0, "max_seconds": 0.0, "records": 0, "lines": 0,
+            "peak_bytes": 0, "retained_bytes": 0
+        }
+        metrics_state["stages"][stage] = stage_metrics
+    elapsed = end_time - metrics_token[0]
+    stage_metrics["calls"] += 1
+    stage_metrics["seconds"] += elapsed
+    stage_metrics["max_seconds"] = max(stage_metrics["max_seconds"], elapsed)
+    stage_metrics["records"] += records
+    stage_metrics["lines"] += lines
+    stage_metrics["peak_bytes"] = max(stage_metrics["peak_bytes"], peak_bytes - metrics_token[1])
+    stage_metrics["retained_bytes"] += end_bytes - metrics_token[1]
+    #
+    return metrics_stage_start()
+
+
+def metrics_summary(state=None):
+    """
+    params: state, {} or None for the current metrics_state.
+    return: summary, {stage: {}}, the counters with records per second,
+    microseconds per record and lines per record.
+    """
+    #
+    state = metrics_state if state is None else state
+    if state is None:
+        return {}
+    summary = {}
+    for stage, stage_metrics in state["stages"].items():
+        stage_summary = dict(stage_metrics)
+        records = max(stage_metrics["records"], 1)
+        stage_summary["us_per_record"] = stage_metrics["seconds"] / records * 1e6
+        stage_summary["records_per_second"] = stage_metrics["records"] / stage_metrics["seconds"] if stage_metrics["seconds"] > 0 else 0.0
+        stage_summary["lines_per_record"] = stage_metrics["lines"] / records
+        summary[stage] = stage_summary
+    #
+    return summary
+
+
+def metrics_json(state=None):
+    """
+    params: state, {} or None for the current metrics_state.
+    return: str.
+    """
+    #
+    return json.dumps(metrics_summary(state), indent=2, sort_keys=True)
+
+
+def metrics_prometheus(state=None):
+    """
+    params: state, {} or None for the current metrics_state.
+    return: str. Prometheus text exposition format.
+    """
+    #
+    state = metrics_state if state is None else state
+    if state is None:
+        return ""
+    metric_rows = [
+        ("seconds_total", "counter", "Wall time spent in the stage.", "seconds"),
+        ("calls_total", "counter", "Calls of the stage.", "calls"),
+        ("records_total", "counter", "Records that went through the stage.", "records"),
+        ("lines_total", "counter", "Lines or fields of these records.", "lines"),
+        ("max_seconds", "gauge", "Longest call of the stage.", "max_seconds")
+    ]
+    if state["track_allocations"]:
+        metric_rows.append(("peak_bytes", "gauge", "Highest traced memory of a call above its start.", "peak_bytes"))
+        metric_rows.append(("retained_bytes", "gauge", "Traced memory left allocated by the calls.", "retained_bytes"))
+    metric_lines = []
+    for metric_name, metric_type, metric_help, counter in metric_rows:
+        metric_lines.append("# HELP %s_%s %s" % (metrics_prefix, metric_name, metric_help))
+        metric_lines.append("# TYPE %s_%s %s" % (metrics_prefix, metric_name, metric_type))
+        for stage, stage_metrics in sorted(state["stages"].items()):
+            metric_lines.append('%s_%s{stage="%s"} %s' % (metrics_prefix, metric_name, stage, repr(stage_metrics[counter])))
+    #
+    return "\n".join(metric_lines) + "\n"
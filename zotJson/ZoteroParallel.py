@@ -0,0 +1,100 @@
+"""
+Process pool helpers shared by RisParallel and BibtexParallel.
+
+Both convert a file in chunks: the parent cuts the file, the workers map
+it themselves and convert their chunk, and the results are yielded in
+the order of the chunks with a bounded number of chunks in flight.
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        task_iter = ((chunk_map, path, chunk) for chunk in chunk_iter)
+        yield from parallel_ordered_map(executor, task_iter, max_in_flight)
+"""
+
+__author__ = "Kaan Eraslan"
+__license__ = "MIT License, see LICENSE"
+
+# Packages ----------------------------------------------
+
+import collections
+import mmap
+import os
+
+# --------------------------------------------------------
+
+# path => (size, mtime_ns, mmap.mmap), least recently used first
+parallel_mmap_cache = collections.OrderedDict()
+parallel_mmap_cache_size = 2
+
+
+def parallel_limits_get(workers=None, chunk_size=500, max_in_flight=None):
+    """
+    params:
+    workers, int or None. Defaults to the number of cores.
+    chunk_size, int.
+    max_in_flight, int or None. Defaults to twice the number of workers.
+
+    return: (workers, max_in_flight), (int, int)
+    """
+    #
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if max_in_flight is None:
+        max_in_flight = 2 * workers
+    if chunk_size < 1 or max_in_flight < 1:
+        raise ValueError("chunk_size and max_in_flight should be at least 1")
+    #
+    return (workers, max_in_flight)
+
+
+def parallel_mmap_open(path):
+    """
+    params: path, str.
+    return: file_buffer, mmap.mmap or b"" for an empty file.
+
+    Used by the workers, which copy what they need out of the map before
+    their chunk returns. The maps of the last parallel_mmap_cache_size
+    paths are kept open between chunks, the others are closed, as is the
+    map of a path whose size or mtime changed.
+    """
+    #
+    path_stat = os.stat(path)
+    mmap_path = os.path.abspath(path)
+    cached_map = parallel_mmap_cache.pop(mmap_path, None)
+    if cached_map is not None:
+        if cached_map[:2] == (path_stat.st_size, path_stat.st_mtime_ns):
+            parallel_mmap_cache[mmap_path] = cached_map
+            return cached_map[2]
+        cached_map[2].close()
+    if path_stat.st_size == 0:
+        return b""
+    with open(path, "rb") as file_stream:
+        file_buffer = mmap.mmap(file_stream.fileno(), 0, access=mmap.ACCESS_READ)
+    parallel_mmap_cache[mmap_path] = (path_stat.st_size, path_stat.st_mtime_ns, file_buffer)
+    while len(parallel_mmap_cache) > parallel_mmap_cache_size:
+        parallel_mmap_cache.popitem(last=False)[1][2].close()
+    #
+    return file_buffer
+
+
+def parallel_ordered_map(executor, task_iter, max_in_flight):
+    """
+    params:
+    executor, concurrent.futures.Executor. Shut down by the caller.
+    task_iter, iterable of (function, *args), the function of a chunk
+    returning a list.
+    max_in_flight, int. Tasks submitted but not yet yielded.
+
+    yield: the elements of the results, in the order of the tasks.
+
+    A task is only taken from task_iter when fewer than max_in_flight
+    are waiting, so the input is read as fast as the results are
+    consumed.
+    """
+    #
+    in_flight = collections.deque()
+    for task in task_iter:
+        if len(in_flight) == max_in_flight:
+            yield from in_flight.popleft().result()
+        in_flight.append(executor.submit(*task))
+    while len(in_flight) > 0:
+        yield from in_flight.popleft().result()
@@ -0,0 +1,269 @@
+"""
+Checks converted items against the fields Zotero allows for their type.
+
+The API rejects, one item at a time in the "failed" part of its response,
+items with a field their type does not have: "notes" or "attachments/PDF"
+on a parent, "publicationTitle" on a book section, "version" on a computer
+program. The fields of every item type are read once from the vendored
+zotero_schema.json (the itemTypes part of https://api.zotero.org/schema)
+into frozensets, and items are checked and fixed before they are sent:
+
+    schema_index = schema_index_load()
+    zotero_items, report = schema_batch_validate(zotero_items, schema_index)
+    report["fields"] == {"notes": {"note": 12}, "version": {"extra": 3}, ...}
+
+A field that is not allowed is moved to the field of the item type with
+the same base field (publicationTitle to bookTitle, publisher to
+university), "notes" become child notes and string "tags" become tag
+lists. Other fields are written as "field: value" lines in "extra", or
+dropped with strip=True. Attachment paths are dropped, run
+ZoteroAttachment.attachment_stage first to turn them into child items.
+"""
+
+__author__ = "Kaan Eraslan"
+__license__ = "MIT License, see LICENSE"
+
+# Packages ----------------------------------------------
+
+import functools
+import json
+import os
+import re
+
+# --------------------------------------------------------
+
+schema_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "zotero_schema.json")
+schema_common_keys = (
+    "key", "version", "itemType", "tags", "collections", "relations", "deleted", "dateAdded", "dateModified"
+)
+schema_type_keys = {
+    "note": ("note", "parentItem"),
+    "attachment": (
+        "parentItem", "linkMode", "note", "contentType", "charset", "filename", "md5", "mtime", "path"
+    )
+}
+schema_fallback_itemType = "document"
+schema_tag_split_re = re.compile(r"\s*[;,]\s*")
+
+
+def schema_index_make(zotero_schema):
+    """
+    params: zotero_schema, {}. Zotero schema, at least its "itemTypes".
+
+    return: schema_index, {"itemTypes": {itemType: item_schema}, "baseFields": {field: baseField}}
+
+    item_schema is {"fields", "creatorTypes", "primaryCreatorType", "baseFields"},
+    "fields" being every key the item type accepts, and "baseFields" mapping
+    the base fields, and the fields themselves, to the field of the type.
+    """
+    #
+    item_schemas = {}
+    base_fields = {}
+    for item_type_schema in zotero_schema["itemTypes"]:
+        itemType_value = item_type_schema["itemType"]
+        field_names = [field_schema["field"] for field_schema in item_type_schema["fields"]]
+        item_base_fields = {}
+        for field_schema in item_type_schema["fields"]:
+            item_base_fields[field_schema["field"]] = field_schema["field"]
+            if "baseField" in field_schema:
+                item_base_fields[field_schema["baseField"]] = field_schema["field"]
+                base_fields[field_schema["field"]] = field_schema["baseField"]
+        creatorTypes = [creator_schema["creatorType"] for creator_schema in item_type_schema["creatorTypes"]]
+        primaryCreatorType = None
+        for creator_schema in item_type_schema["creatorTypes"]:
+            if creator_schema.get("primary", False):
+                primaryCreatorType = creator_schema["creatorType"]
+        extra_keys = schema_type_keys.get(itemType_value, ("creators",))
+        item_schemas[itemType_value] = {
+            "fields": frozenset(field_names + list(schema_common_keys) + list(extra_keys)),
+            "creatorTypes": frozenset(creatorTypes),
+            "primaryCreatorType": primaryCreatorType,
+            "baseFields": item_base_fields
+        }
+    schema_index = {"itemTypes": item_schemas, "baseFields": base_fields}
+    #
+    return schema_index
+
+
+@functools.lru_cache(maxsize=None)
+def schema_index_load(path=schema_path):
+    """
+    params: path, str. A Zotero schema json file.
+    return: schema_index, {}, see schema_index_make. Built once per path.
+    """
+    #
+    with open(path, "r", encoding="utf-8") as schema_file:
+        zotero_schema = json.load(schema_file)
+    #
+    return schema_index_make(zotero_schema)
+
+
+def schema_report_make():
+    """
+    return: schema_report, {"items": int, "changed": int, "fields": {field: {action: int}}}
+    """
+    #
+    return {"items": 0, "changed": 0, "fields": {}}
+
+
+def schema_report_count(schema_report, field, action):
+    """
+    params:
+    schema_report, {}
+    field, str.
+    action, str. "relocated", "note", "tags", "extra", "stripped",
+    "creatorType" or "itemType".
+    """
+    #
+    field_actions = schema_report["fields"].setdefault(field, {})
+    field_actions[action] = field_actions.get(action, 0) + 1
+
+
+def schema_value_text(value):
+    """
+    params: value, str, number, [] or {}.
+    return: str. For a line of extra.
+    """
+    #
+    if isinstance(value, str):
+        return value
+    elif isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    #
+    return str(value)
+
+
+def schema_item_validate(zotero_item, schema_index, schema_report=None, strip=False):
+    """
+    params:
+    zotero_item, {} or [{},[{}, ...]]
+    schema_index, {}, see schema_index_load
+    schema_report, {} or None, see schema_report_make. Counted in place.
+    strip, bool. Drop the fields that can not be relocated, instead of
+    writing them to extra.
+
+    return: zotero_item, fixed in place. [{},[{}, ...]] if notes were added
+    to a {} item.
+
+    The parent, its notes and its attachments are checked. An item type
+    that is not in the schema becomes "document", a creator type the item
+    type does not have becomes "contributor", or its primary creator type.
+    """
+    #
+    if isinstance(zotero_item, dict):
+        zotero_dict = zotero_item
+        zotero_note_list = []
+    else:
+        zotero_dict = zotero_item[0]
+        zotero_note_list = zotero_item[1] if len(zotero_item) > 1 else []
+    item_schemas = schema_index["itemTypes"]
+    item_schema = item_schemas.get(zotero_dict.get("itemType"))
+    changed = False
+    if item_schema is None:
+        if schema_report is not None:
+            schema_report_count(schema_report, "itemType", "itemType")
+        if not strip and zotero_dict.get("itemType"):
+            zotero_dict["extra"] = "\n".join(
+                extra_line for extra_line in (zotero_dict.get("extra", ""), "itemType: " + str(zotero_dict["itemType"]))
+                if len(extra_line) > 0
+            )
+        zotero_dict["itemType"] = schema_fallback_itemType
+        item_schema = item_schemas[schema_fallback_itemType]
+        changed = True
+    item_fields = item_schema["fields"]
+    #
+    if not item_fields.issuperset(zotero_dict):
+        extra_lines = [zotero_dict["extra"]] if zotero_dict.get("extra") else []
+        item_base_fields = item_schema["baseFields"]
+        base_fields = schema_index["baseFields"]
+        for field in [field for field in zotero_dict if field not in item_fields]:
+            value = zotero_dict.pop(field)
+            if value is None or value == "" or value == []:
+                action = "stripped"
+            elif field == "notes":
+                action = "note"
+                for note_text in (value if isinstance(value, list) else [value]):
+                    zotero_note_list.append({"itemType": "note", "note": note_text, "tags": [], "relations": {}})
+            elif field.startswith("attachments/"):
+                action = "stripped"
+            else:
+                target_field = item_base_fields.get(base_fields.get(field, field))
+                if target_field is not None and not zotero_dict.get(target_field):
+                    action = "relocated"
+                    zotero_dict[target_field] = value
+                elif strip:
+                    action = "stripped"
+                else:
+                    action = "extra"
+                    extra_lines.append(field + ": " + schema_value_text(value))
+            if schema_report is not None:
+                schema_report_count(schema_report, field, action)
+        if len(extra_lines) > 0 and "extra" in item_fields:
+            zotero_dict["extra"] = "\n".join(extra_lines)
+        changed = True
+    #
+    if isinstance(zotero_dict.get("tags"), str):
+        zotero_dict["tags"] = [
+            {"tag": tag} for tag in schema_tag_split_re.split(zotero_dict["tags"].strip()) if len(tag) > 0
+        ]
+        if schema_report is not None:
+            schema_report_count(schema_report, "tags", "tags")
+        changed = True
+    creatorTypes = item_schema["creatorTypes"]
+    for creator in zotero_dict.get("creators", ()):
+        if creator.get("creatorType") not in creatorTypes:
+            if schema_report is not None:
+                schema_report_count(schema_report, "creators/" + str(creator.get("creatorType")), "creatorType")
+            creator["creatorType"] = "contributor" if "contributor" in creatorTypes else item_schema["primaryCreatorType"]
+            changed = True
+    #
+    for zotero_note_dict in zotero_note_list:
+        child_itemType = "attachment" if zotero_note_dict.get("itemType") == "attachment" else "note"
+        child_fields = item_schemas[child_itemType]["fields"]
+        for field in [field for field in zotero_note_dict if field not in child_fields]:
+            del zotero_note_dict[field]
+            if schema_report is not None:
+                schema_report_count(schema_report, child_itemType + "/" + field, "stripped")
+            changed = True
+    if schema_report is not None:
+        schema_report["items"] += 1
+        schema_report["changed"] += 1 if changed else 0
+    if isinstance(zotero_item, dict) and len(zotero_note_list) > 0:
+        return [zotero_dict, zotero_note_list]
+    #
+    return zotero_item
+
+
+def schema_items_validate(zotero_items, schema_index=None, schema_report=None, strip=False):
+    """
+    params:
+    zotero_items, iterable of {} or [{},[{}, ...]]
+    schema_index, {} or None for the vendored schema.
+    schema_report, {} or None
+    strip, bool.
+
+    yield: zotero_item, fixed.
+
+    For streams going to ZoteroUpload.zotero_upload_run, the report is
+    complete once the stream is.
+    """
+    #
+    schema_index = schema_index_load() if schema_index is None else schema_index
+    for zotero_item in zotero_items:
+        yield schema_item_validate(zotero_item, schema_index, schema_report, strip)
+
+
+def schema_batch_validate(zotero_items, schema_index=None, strip=False):
+    """
+    params:
+    zotero_items, iterable of {} or [{},[{}, ...]]
+    schema_index, {} or None for the vendored schema.
+    strip, bool.
+
+    return: (zotero_item_list, schema_report), ([...], {}), see schema_report_make
+    """
+    #
+    schema_report = schema_report_make()
+    zotero_item_list = list(schema_items_validate(zotero_items, schema_index, schema_report, strip))
+    #
+    return (zotero_item_list, schema_report)
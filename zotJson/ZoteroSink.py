@@ -0,0 +1,137 @@
+"""
+Newline delimited JSON output for converted Zotero items.
+
+Each item is written on its own line as soon as it is produced, so peak
+memory is one item and readers can follow the file while the conversion
+is still running. The RIS converters produce [zotero_dict, zotero_note_list]
+pairs, these are written as one line so that notes stay with their parent.
+
+    with ndjson_sink_open("anatolia.ndjson.gz") as sink:
+        ndjson_items_write(sink, zotero_collection_iter(items, "Anatolia"))
+"""
+
+__author__ = "Kaan Eraslan"
+__license__ = "MIT License, see LICENSE"
+
+# Packages ----------------------------------------------
+
+import gzip
+import io
+import json
+
+# --------------------------------------------------------
+
+ndjson_compressions = (None, "gzip", "zstd")
+
+
+def ndjson_compression_guess(path):
+    """
+    params: path, str.
+    return: compression, None, "gzip" or "zstd"
+    """
+    #
+    if path.endswith(".gz"):
+        return "gzip"
+    elif path.endswith(".zst"):
+        return "zstd"
+    #
+    return None
+
+
+def ndjson_sink_open(path, compression="auto"):
+    """
+    params:
+    path, str.
+    compression, "auto", None, "gzip" or "zstd". "auto" uses the file
+    extension, .gz or .zst.
+
+    return: sink, text file object.
+
+    Plain files are line buffered so that every item reaches the file when
+    it is written. zstd needs the zstandard package.
+    """
+    #
+    if compression == "auto":
+        compression = ndjson_compression_guess(path)
+    if compression not in ndjson_compressions:
+        raise ValueError("compression should be one of " + ", ".join(str(c) for c in ndjson_compressions))
+    #
+    if compression == "gzip":
+        return gzip.open(path, "wt", encoding="utf-8")
+    elif compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as zstd_import_fail:
+            raise ImportError("zstd compression needs the zstandard package") from zstd_import_fail
+        zstd_writer = zstandard.ZstdCompressor().stream_writer(open(path, "wb"), closefd=True)
+        return io.TextIOWrapper(zstd_writer, encoding="utf-8")
+    #
+    return open(path, "w", encoding="utf-8", buffering=1)
+
+
+def ndjson_source_open(path, compression="auto"):
+    """
+    params:
+    path, str.
+    compression, "auto", None, "gzip" or "zstd".
+
+    return: source, text file object.
+    """
+    #
+    if compression == "auto":
+        compression = ndjson_compression_guess(path)
+    if compression == "gzip":
+        return gzip.open(path, "rt", encoding="utf-8")
+    elif compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as zstd_import_fail:
+            raise ImportError("zstd compression needs the zstandard package") from zstd_import_fail
+        zstd_reader = zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+        return io.TextIOWrapper(zstd_reader, encoding="utf-8")
+    #
+    return open(path, "r", encoding="utf-8")
+
+
+def ndjson_item_write(sink, zotero_item):
+    """
+    params:
+    sink, text file object, see ndjson_sink_open
+    zotero_item, {} or [{},[{}, ...]]
+    """
+    #
+    sink.write(json.dumps(zotero_item, ensure_ascii=False, separators=(",", ":")))
+    sink.write("\n")
+
+
+def ndjson_items_write(sink, zotero_items):
+    """
+    params:
+    sink, text file object, see ndjson_sink_open
+    zotero_items, iterable, ideally a generator such as
+    RisToZotero.pascal_francis_item_iter or BibtexToZotero.bibtex_zotero_iter
+
+    return: item_count, int.
+    """
+    #
+    item_count = 0
+    for zotero_item in zotero_items:
+        ndjson_item_write(sink, zotero_item)
+        item_count += 1
+    #
+    return item_count
+
+
+def ndjson_items_read(path, compression="auto"):
+    """
+    params:
+    path, str.
+    compression, "auto", None, "gzip" or "zstd".
+
+    yield: zotero_item, {} or [{},[{}, ...]]
+    """
+    #
+    with ndjson_source_open(path, compression) as source:
+        for ndjson_line in source:
+            if len(ndjson_line.strip()) > 0:
+                yield json.loads(ndjson_line)
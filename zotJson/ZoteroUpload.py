@@ -0,0 +1,363 @@
+"""
+Asyncio upload of converted items to the Zotero write API.
+
+The converters feed a bounded queue of batches (see ZoteroBatch) and a
+fixed number of workers post them over a pool of keep-alive connections.
+The requests themselves go through http.client in the default executor,
+so nothing outside of the standard library is needed.
+
+Zotero asks clients to slow down with two headers: Backoff, on any
+response, and Retry-After, with 429 and 503 responses. Both pause every
+worker, not only the one that got the response.
+
+    summary = zotero_upload_run(
+        pascal_francis_item_iter(notices, "journalArticle", pascal_francis_journal_zotero_map),
+        "https://api.zotero.org/groups/<id>/items",
+        api_key,
+        concurrency=4
+    )
+"""
+
+__author__ = "Kaan Eraslan"
+__license__ = "MIT License, see LICENSE"
+
+# Packages ----------------------------------------------
+
+import asyncio
+import http.client
+import json
+import time
+import urllib.parse
+
+from zotJson import ZoteroBatch
+
+# --------------------------------------------------------
+
+zotero_retry_statuses = (429, 500, 502, 503, 504)
+
+
+class ZoteroUploadError(Exception):
+    """A batch could not be uploaded after all its retries."""
+
+
+def zotero_connection_make(items_url, timeout):
+    """
+    params:
+    items_url, str.
+    timeout, int. Seconds.
+
+    return: connection, http.client.HTTPConnection or HTTPSConnection
+    """
+    #
+    url_parts = urllib.parse.urlsplit(items_url)
+    if url_parts.scheme == "https":
+        return http.client.HTTPSConnection(url_parts.netloc, timeout=timeout)
+    #
+    return http.client.HTTPConnection(url_parts.netloc, timeout=timeout)
+
+
+def zotero_connection_post(connection, items_url, zotero_batch, api_key):
+    """
+    params:
+    connection, http.client.HTTPConnection
+    items_url, str.
+    zotero_batch, {}, see ZoteroBatch.zotero_batch_plan
+    api_key, str.
+
+    return: (status, headers, body), (int, {}, bytes)
+
+    Blocking, runs in the executor.
+    """
+    #
+    url_parts = urllib.parse.urlsplit(items_url)
+    path = url_parts.path + ("?" + url_parts.query if url_parts.query else "")
+    connection.request(
+        "POST",
+        path,
+        body=json.dumps(zotero_batch["items"]).encode("utf-8"),
+        headers={
+            "Content-Type": "application/json",
+            "Zotero-API-Key": api_key,
+            "Zotero-API-Version": "3",
+            "Zotero-Write-Token": zotero_batch["token"]
+        }
+    )
+    response = connection.getresponse()
+    body = response.read()
+    #
+    return (response.status, dict(response.getheaders()), body)
+
+
+def zotero_header_seconds(headers, name):
+    """
+    params:
+    headers, {}
+    name, str.
+
+    return: seconds, float. 0.0 if the header is missing or not a number.
+    """
+    #
+    for header_name, header_value in headers.items():
+        if header_name.lower() == name.lower():
+            try:
+                return max(float(header_value), 0.0)
+            except ValueError:
+                return 0.0
+    #
+    return 0.0
+
+
+def zotero_upload_state_make(items_url, api_key, concurrency=4, max_retries=5, timeout=60, retry_delay=1.0):
+    """
+    params:
+    items_url, str.
+    api_key, str.
+    concurrency, int. Workers, and connections in the pool.
+    max_retries, int. Per batch.
+    timeout, int. Seconds.
+    retry_delay, float. First delay when the server gives none, doubled
+    on every retry.
+
+    return: upload_state, {}
+
+    Shared by the workers: the connection pool, the pause asked for by the
+    server and the summary of the upload. Must be made inside the event
+    loop that runs the upload.
+    """
+    #
+    connections = asyncio.Queue()
+    for connection_index in range(concurrency):
+        connections.put_nowait(None)
+    upload_state = {
+        "items_url": items_url,
+        "api_key": api_key,
+        "concurrency": concurrency,
+        "max_retries": max_retries,
+        "timeout": timeout,
+        "retry_delay": retry_delay,
+        "pause_until": 0.0,
+        "connections": connections,
+        "summary": {"batches": 0, "success": {}, "unchanged": {}, "failed": [], "retries": 0}
+    }
+    #
+    return upload_state
+
+
+def zotero_upload_pause(upload_state, seconds):
+    """
+    params:
+    upload_state, {}
+    seconds, float.
+    """
+    #
+    upload_state["pause_until"] = max(upload_state["pause_until"], time.monotonic() + seconds)
+
+
+async def zotero_upload_pause_wait(upload_state):
+    """
+    params: upload_state, {}
+    """
+    #
+    delay = upload_state["pause_until"] - time.monotonic()
+    while delay > 0:
+        await asyncio.sleep(delay)
+        delay = upload_state["pause_until"] - time.monotonic()
+
+
+async def zotero_upload_post(upload_state, zotero_batch):
+    """
+    params:
+    upload_state, {}
+    zotero_batch, {}
+
+    return: resp, {"success": {}, "unchanged": {}, "failed": {}}
+    """
+    #
+    loop = asyncio.get_running_loop()
+    connections = upload_state["connections"]
+    retry_delay = upload_state["retry_delay"]
+    for attempt in range(upload_state["max_retries"] + 1):
+        await zotero_upload_pause_wait(upload_state)
+        connection = await connections.get()
+        if connection is None:
+            connection = zotero_connection_make(upload_state["items_url"], upload_state["timeout"])
+        try:
+            status, headers, body = await loop.run_in_executor(
+                None,
+                zotero_connection_post,
+                connection,
+                upload_state["items_url"],
+                zotero_batch,
+                upload_state["api_key"]
+            )
+        except (OSError, http.client.HTTPException):
+            connection.close()
+            connections.put_nowait(None)
+            zotero_upload_pause(upload_state, retry_delay * 2 ** attempt)
+            upload_state["summary"]["retries"] += 1
+            continue
+        connections.put_nowait(connection)
+        #
+        zotero_upload_pause(upload_state, zotero_header_seconds(headers, "Backoff"))
+        if status == 200:
+            return json.loads(body.decode("utf-8"))
+        elif status == 412:
+            # the write token was already used, the batch went through before a retry
+            return {"success": {}, "unchanged": {}, "failed": {}}
+        elif status in zotero_retry_statuses:
+            retry_after = zotero_header_seconds(headers, "Retry-After")
+            zotero_upload_pause(upload_state, retry_after if retry_after > 0 else retry_delay * 2 ** attempt)
+            upload_state["summary"]["retries"] += 1
+            continue
+        raise ZoteroUploadError("HTTP %d: %s" % (status, body.decode("utf-8", "replace")))
+    #
+    raise ZoteroUploadError("batch %s failed after %d retries" % (zotero_batch["token"], upload_state["max_retries"]))
+
+
+def zotero_upload_summarize(summary, resp, zotero_batch):
+    """
+    params:
+    summary, {}, see zotero_upload_state_make
+    resp, {}, see zotero_upload_post
+    zotero_batch, {}
+
+    return: failed_keys, set of the keys of the items that failed.
+    """
+    #
+    summary["batches"] += 1
+    for item_index, key in resp.get("success", {}).items():
+        summary["success"][zotero_batch["items"][int(item_index)]["key"]] = key
+    for item_index, key in resp.get("unchanged", {}).items():
+        summary["unchanged"][zotero_batch["items"][int(item_index)]["key"]] = key
+    failed_list = ZoteroBatch.zotero_batch_failed(resp, zotero_batch)
+    summary["failed"].extend(failed_list)
+    #
+    return set(zotero_object.get("key") for zotero_object, failure in failed_list)
+
+
+async def zotero_upload_consume(upload_state, batch_queue):
+    """
+    params:
+    upload_state, {}
+    batch_queue, asyncio.Queue of batch chains, [zotero_batch, ...], None
+    stops the worker.
+
+    The batches of a chain are posted one after the other, the notes that
+    spill out of the batch of their parent are only sent once the parent
+    went through. Notes of a parent that failed are not sent, they are
+    reported as failed.
+    """
+    #
+    summary = upload_state["summary"]
+    while True:
+        batch_chain = await batch_queue.get()
+        if batch_chain is None:
+            return
+        failed_keys = set()
+        for zotero_batch in batch_chain:
+            if len(failed_keys) > 0:
+                orphan_list = [
+                    (zotero_object, {"key": zotero_object["key"], "code": 400,
+                                     "message": "parentItem %s failed" % zotero_object["parentItem"]})
+                    for zotero_object in zotero_batch["items"]
+                    if zotero_object.get("parentItem") in failed_keys
+                ]
+                summary["failed"].extend(orphan_list)
+                zotero_batch = dict(
+                    zotero_batch,
+                    items=[
+                        zotero_object for zotero_object in zotero_batch["items"]
+                        if zotero_object.get("parentItem") not in failed_keys
+                    ]
+                )
+                if len(zotero_batch["items"]) == 0:
+                    continue
+            resp = await zotero_upload_post(upload_state, zotero_batch)
+            failed_keys.update(zotero_upload_summarize(summary, resp, zotero_batch))
+
+
+async def zotero_upload_produce(upload_state, zotero_items, batch_queue, batch_size):
+    """
+    params:
+    upload_state, {}
+    zotero_items, iterable of {} or [{},[{}, ...]], straight from a converter.
+    batch_queue, asyncio.Queue
+    batch_size, int.
+
+    A batch is queued with the batches that come "after" it, see
+    ZoteroBatch.zotero_batch_plan, so that a single worker sends them in
+    order. The plan, and the converter behind it, is advanced in the
+    default executor, so that converting the next batch does not hold up
+    the requests in flight.
+    """
+    #
+    loop = asyncio.get_running_loop()
+    plan_iter = ZoteroBatch.zotero_batch_plan(zotero_items, batch_size)
+    batch_chain = []
+    while True:
+        zotero_batch = await loop.run_in_executor(None, next, plan_iter, None)
+        if zotero_batch is None:
+            break
+        if "after" not in zotero_batch and len(batch_chain) > 0:
+            await batch_queue.put(batch_chain)
+            batch_chain = []
+        batch_chain.append(zotero_batch)
+    if len(batch_chain) > 0:
+        await batch_queue.put(batch_chain)
+    for worker_index in range(upload_state["concurrency"]):
+        await batch_queue.put(None)
+
+
+async def zotero_upload(upload_state, zotero_items, batch_size=ZoteroBatch.zotero_batch_size):
+    """
+    params:
+    upload_state, {}, see zotero_upload_state_make
+    zotero_items, iterable of {} or [{},[{}, ...]]
+    batch_size, int.
+
+    return: summary, {}
+
+    The queue holds at most two batch chains per worker, the converters are
+    only advanced as fast as the batches are uploaded.
+    """
+    #
+    batch_queue = asyncio.Queue(maxsize=2 * upload_state["concurrency"])
+    workers = [
+        asyncio.create_task(zotero_upload_consume(upload_state, batch_queue))
+        for worker_index in range(upload_state["concurrency"])
+    ]
+    producer = asyncio.create_task(zotero_upload_produce(upload_state, zotero_items, batch_queue, batch_size))
+    try:
+        await asyncio.gather(producer, *workers)
+    finally:
+        for task in [producer] + workers:
+            task.cancel()
+        connections = upload_state["connections"]
+        while not connections.empty():
+            connection = connections.get_nowait()
+            if connection is not None:
+                connection.close()
+    #
+    return upload_state["summary"]
+
+
+def zotero_upload_run(zotero_items, items_url, api_key, concurrency=4, max_retries=5, batch_size=ZoteroBatch.zotero_batch_size):
+    """
+    params:
+    zotero_items, iterable of {} or [{},[{}, ...]]
+    items_url, str.
+    api_key, str.
+    concurrency, int. Requests in flight.
+    max_retries, int. Per batch.
+    batch_size, int.
+
+    return: summary, {"batches": int, "success": {}, "unchanged": {}, "failed": [], "retries": int}
+    """
+    #
+    async def zotero_upload_main():
+        upload_state = zotero_upload_state_make(items_url, api_key, concurrency=concurrency, max_retries=max_retries)
+        return await zotero_upload(upload_state, zotero_items, batch_size)
+    #
+    summary = asyncio.run(zotero_upload_main())
+    #
+    return summary
@@ -0,0 +1,446 @@
+"""
+Batch conversion of RIS and BibTeX exports to Zotero JSON.
+
+    python -m zotJson exports/*.ris exports/*.bib.gz -o items.ndjson.gz
+    python -m zotJson "pf/**/*.ris" --mapper pascal-francis -o items.json
+
+Files are converted in parallel, one file per worker, each into its own
+part file; the parts are then joined in the order of the inputs. Files
+of cli_parallel_min_bytes or more are converted first, one at a time,
+in chunks over all the workers (RisParallel, BibtexParallel), so that a
+single large export uses every core too. The format of a file comes from
+its extension (.ris, .bib, with or without .gz) or else from its first
+lines. Throughput is reported on stderr.
+
+A file that can not be read or decoded is reported on stderr with its
+error and left out of the output, the other files are still converted
+and the exit status is 1.
+
+The converters, and their mapping tables, are only imported by the
+workers that need them.
+"""
+
+__author__ = "Kaan Eraslan"
+__license__ = "MIT License, see LICENSE"
+
+# Packages ----------------------------------------------
+
+import argparse
+import functools
+import glob
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+
+from zotJson import ZoteroSink
+
+# --------------------------------------------------------
+
+cli_formats = ("ris", "bibtex")
+cli_format_extensions = {".ris": "ris", ".txt": "ris", ".bib": "bibtex", ".bibtex": "bibtex"}
+cli_ris_sniff_re = re.compile(r"^\s*TY {1,2}-", re.M)
+cli_bibtex_sniff_re = re.compile(r"^\s*@\s*[A-Za-z]+\s*[{(]", re.M)
+cli_mappers = ("lines", "zotero", "pascal-francis")
+cli_parallel_min_bytes = 32 * 1024 * 1024
+cli_file_errors = (ValueError, OSError, EOFError, ImportError)
+
+
+def cli_paths_expand(patterns):
+    """
+    params: patterns, [str, ...]. Paths or globs, ** included.
+    return: path_list, [str, ...], without duplicates, in the given order.
+    """
+    #
+    path_list = []
+    for pattern in patterns:
+        matched_paths = sorted(glob.glob(pattern, recursive=True)) if glob.has_magic(pattern) else [pattern]
+        for path in matched_paths:
+            if os.path.isfile(path) and path not in path_list:
+                path_list.append(path)
+    #
+    return path_list
+
+
+def cli_format_guess(path):
+    """
+    params: path, str.
+    return: file_format, "ris", "bibtex" or None.
+    """
+    #
+    base_path = path[:-3] if path.endswith(".gz") else path
+    file_format = cli_format_extensions.get(os.path.splitext(base_path)[1].lower())
+    if file_format is not None:
+        return file_format
+    with ZoteroSink.ndjson_source_open(path) as source:
+        head_text = source.read(8192)
+    if cli_ris_sniff_re.search(head_text) is not None:
+        return "ris"
+    elif cli_bibtex_sniff_re.search(head_text) is not None:
+        return "bibtex"
+    #
+    return None
+
+
+def cli_items_iter(source, file_format, mapper):
+    """
+    params:
+    source, text file object.
+    file_format, "ris" or "bibtex"
+    mapper, "lines", "zotero" or "pascal-francis". Only used for RIS.
+
+    yield: (record_count, zotero_item or None)
+
+    record_count is 1 for every record read, zotero_item is None for the
+    records the mapper skips.
+    """
+    #
+    if file_format == "bibtex":
+        from zotBibtexJson import BibtexToZotero
+        for bibtex_dict in BibtexToZotero.bibtex_dict_read(source):
+            yield (1, BibtexToZotero.bibtexTozotero(bibtex_dict, {}))
+        return
+    #
+    from ZotRisJson import RisToZotero
+    for ris_text in RisToZotero.ris_record_read(source):
+        yield (1, cli_ris_record_convert(ris_text, mapper))
+
+
+def cli_ris_record_convert(ris_text, mapper):
+    """
+    params:
+    ris_text, str. One RIS record.
+    mapper, "lines", "zotero" or "pascal-francis"
+
+    return: zotero_item, {} or [{},[],[], ...] for "lines", or None for
+    the records the mapper skips.
+
+    At module level so that RisParallel can send it to its workers.
+    """
+    #
+    from ZotRisJson import RisToZotero
+    if mapper == "zotero":
+        return RisToZotero.ris_item_map(
+            ris_text, RisToZotero.type_map, RisToZotero.field_map, RisToZotero.dependent_fields
+        )
+    ris_p_dict = RisToZotero.ris_p_dict_map(
+        ris_text, RisToZotero.type_map, RisToZotero.field_map, RisToZotero.dependent_fields
+    )
+    if mapper == "lines":
+        return ris_p_dict
+    notice_zotero_maps = {
+        "journalArticle": RisToZotero.pascal_francis_journal_zotero_map,
+        "conferencePaper": RisToZotero.pascal_francis_conference_zotero_map
+    }
+    notice_zotero_map = notice_zotero_maps.get(ris_p_dict[0].get("itemType") if ris_p_dict else None)
+    #
+    return notice_zotero_map(ris_p_dict) if notice_zotero_map is not None else None
+
+
+def cli_parallel_items_iter(path, source, file_format, mapper, workers):
+    """
+    params:
+    path, str.
+    source, text file object, of the same file.
+    file_format, "ris" or "bibtex"
+    mapper, str.
+    workers, int.
+
+    yield: (record_count, zotero_item or None), see cli_items_iter
+
+    Uncompressed files are memory mapped by path, compressed ones are
+    read from source.
+    """
+    #
+    if ZoteroSink.ndjson_compression_guess(path) is None:
+        source = path
+    if file_format == "bibtex":
+        from zotBibtexJson import BibtexParallel
+        for zotero_item in BibtexParallel.convert_bibtex_parallel(source, workers):
+            yield (1, zotero_item)
+        return
+    #
+    from ZotRisJson import RisParallel
+    record_map = functools.partial(cli_ris_record_convert, mapper=mapper)
+    for zotero_item in RisParallel.convert_ris_parallel(source, workers, record_map=record_map):
+        yield (1, zotero_item)
+
+
+def cli_file_workers(path, workers):
+    """
+    params: path, str. workers, int.
+    return: file_workers, int. workers for files of cli_parallel_min_bytes
+    or more, 1 otherwise.
+    """
+    #
+    if workers > 1 and os.path.getsize(path) >= cli_parallel_min_bytes:
+        return workers
+    #
+    return 1
+
+
+def cli_file_convert(path, file_format, mapper, part_path, validate=False, workers=1):
+    """
+    params:
+    path, str. A .ris or .bib file, gzip compressed or not.
+    file_format, "ris", "bibtex" or None to guess it.
+    mapper, str.
+    part_path, str. NDJSON file the items are written to.
+    validate, bool. Fix the items against the Zotero schema, see
+    ZoteroSchema. The "lines" of RIS files are not items and are left as is.
+    workers, int. More than 1 converts the file in chunks over as many
+    processes, see cli_parallel_items_iter.
+
+    return: file_result, {"path", "format", "records", "items", "bytes", "part", "schema", "error"}
+
+    Runs in the worker processes. When the file can not be read, or
+    decoded, the part is left empty and "error" gives the reason, it is
+    None otherwise.
+    """
+    #
+    record_count = 0
+    item_count = 0
+    schema_report = None
+    try:
+        if file_format is None:
+            file_format = cli_format_guess(path)
+        if file_format is None:
+            raise ValueError("can not tell the format of " + path)
+        if validate and (file_format == "bibtex" or mapper != "lines"):
+            from zotJson import ZoteroSchema
+            schema_index = ZoteroSchema.schema_index_load()
+            schema_report = ZoteroSchema.schema_report_make()
+        with ZoteroSink.ndjson_source_open(path) as source, open(part_path, "w", encoding="utf-8") as part:
+            if workers > 1:
+                items_iter = cli_parallel_items_iter(path, source, file_format, mapper, workers)
+            else:
+                items_iter = cli_items_iter(source, file_format, mapper)
+            for record_step, zotero_item in items_iter:
+                record_count += record_step
+                if zotero_item is not None:
+                    if schema_report is not None:
+                        zotero_item = ZoteroSchema.schema_item_validate(zotero_item, schema_index, schema_report)
+                    ZoteroSink.ndjson_item_write(part, zotero_item)
+                    item_count += 1
+    except cli_file_errors as file_error:
+        # the items written before the error are dropped with the part
+        open(part_path, "w", encoding="utf-8").close()
+        file_result = {
+            "path": path,
+            "format": file_format,
+            "records": 0,
+            "items": 0,
+            "bytes": 0,
+            "part": part_path,
+            "schema": None,
+            "error": "%s: %s" % (type(file_error).__name__, file_error)
+        }
+        return file_result
+    file_result = {
+        "path": path,
+        "format": file_format,
+        "records": record_count,
+        "items": item_count,
+        "bytes": os.path.getsize(path),
+        "part": part_path,
+        "schema": schema_report,
+        "error": None
+    }
+    #
+    return file_result
+
+
+def cli_parts_join(file_results, output, output_format):
+    """
+    params:
+    file_results, iterable of {}, see cli_file_convert, in input order.
+    output, text file object.
+    output_format, "ndjson" or "json". json writes one array.
+    """
+    #
+    item_separator = ""
+    if output_format == "json":
+        output.write("[")
+    for file_result in file_results:
+        with open(file_result["part"], "r", encoding="utf-8") as part:
+            if output_format == "ndjson":
+                shutil.copyfileobj(part, output)
+            else:
+                for ndjson_line in part:
+                    output.write(item_separator + ndjson_line.rstrip("\n"))
+                    item_separator = ",\n"
+        os.remove(file_result["part"])
+    if output_format == "json":
+        output.write("]\n")
+
+
+def cli_results_iter(path_list, file_format, mapper, part_dir, workers, validate=False):
+    """
+    params:
+    path_list, [str, ...]
+    file_format, str or None.
+    mapper, str.
+    part_dir, str.
+    workers, int.
+    validate, bool.
+
+    yield: file_result, {}, in the order of path_list.
+
+    The large files, see cli_file_workers, are converted first, each
+    over all the workers, then the others one file per worker, so the
+    two never compete for the cores.
+    """
+    #
+    part_paths = [os.path.join(part_dir, "%06d.ndjson" % path_index) for path_index in range(len(path_list))]
+    path_workers = [cli_file_workers(path, workers) for path in path_list]
+    small_count = path_workers.count(1)
+    if small_count == len(path_list) and (workers == 1 or small_count == 1):
+        for path, part_path in zip(path_list, part_paths):
+            yield cli_file_convert(path, file_format, mapper, part_path, validate)
+        return
+    large_results = {
+        path_index: cli_file_convert(path, file_format, mapper, part_path, validate, file_workers)
+        for path_index, (path, part_path, file_workers) in enumerate(zip(path_list, part_paths, path_workers))
+        if file_workers > 1
+    }
+    if small_count <= 1:
+        for path_index, (path, part_path) in enumerate(zip(path_list, part_paths)):
+            if path_index in large_results:
+                yield large_results[path_index]
+            else:
+                yield cli_file_convert(path, file_format, mapper, part_path, validate)
+        return
+    import concurrent.futures
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            path_index: executor.submit(cli_file_convert, path, file_format, mapper, part_path, validate)
+            for path_index, (path, part_path) in enumerate(zip(path_list, part_paths))
+            if path_index not in large_results
+        }
+        for path_index in range(len(path_list)):
+            if path_index in large_results:
+                yield large_results[path_index]
+            else:
+                yield futures[path_index].result()
+
+
+def cli_schema_print(file_results):
+    """
+    params: file_results, [{}, ...], see cli_file_convert
+
+    Prints, on stderr, what validation did to each field over all files.
+    """
+    #
+    field_counts = {}
+    changed_count = 0
+    for file_result in file_results:
+        if file_result["schema"] is None:
+            continue
+        changed_count += file_result["schema"]["changed"]
+        for field, field_actions in file_result["schema"]["fields"].items():
+            field_counts.setdefault(field, {})
+            for action, count in field_actions.items():
+                field_counts[field][action] = field_counts[field].get(action, 0) + count
+    if len(field_counts) == 0:
+        return
+    print("%d items fixed against the Zotero schema:" % changed_count, file=sys.stderr)
+    for field, field_actions in sorted(field_counts.items(), key=lambda field_item: -sum(field_item[1].values())):
+        print("  %-32s %s" % (field, ", ".join(
+            "%s %d" % (action, count) for action, count in sorted(field_actions.items())
+        )), file=sys.stderr)
+
+
+def cli_output_open(output_path):
+    """
+    params: output_path, str. "-" for stdout, .gz and .zst are compressed.
+    return: output, text file object.
+    """
+    #
+    if output_path == "-":
+        return open(sys.stdout.fileno(), "w", encoding="utf-8", closefd=False)
+    #
+    return ZoteroSink.ndjson_sink_open(output_path)
+
+
+def cli_parser_make():
+    """
+    return: parser, argparse.ArgumentParser
+    """
+    #
+    parser = argparse.ArgumentParser(
+        prog="python -m zotJson",
+        description="Convert RIS and BibTeX exports to Zotero JSON."
+    )
+    parser.add_argument("inputs", nargs="+", help="files or globs, .gz files are read compressed")
+    parser.add_argument("-o", "--output", default="-", help="output file, - for stdout (default)")
+    parser.add_argument(
+        "-t", "--to", choices=("ndjson", "json"), default=None,
+        help="output format, json for .json outputs and ndjson otherwise by default"
+    )
+    parser.add_argument("-f", "--input-format", choices=cli_formats, default=None, help="skip format detection")
+    parser.add_argument(
+        "-m", "--mapper", choices=cli_mappers, default="lines",
+        help="RIS output: ris_p_dict_map lines, Zotero items of every type, or Pascal-Francis items"
+    )
+    parser.add_argument(
+        "--validate", action="store_true",
+        help="fix the fields Zotero would reject for the item type, and count them on stderr"
+    )
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("-q", "--quiet", action="store_true", help="do not report throughput")
+    #
+    return parser
+
+
+def main(argv=None):
+    args = cli_parser_make().parse_args(argv)
+    path_list = cli_paths_expand(args.inputs)
+    if len(path_list) == 0:
+        print("no input files", file=sys.stderr)
+        return 2
+    output_format = args.to
+    if output_format is None:
+        output_format = "json" if re.search(r"\.json(\.gz|\.zst)?$", args.output) else "ndjson"
+    #
+    start = time.perf_counter()
+    file_results = []
+    with tempfile.TemporaryDirectory(prefix="zotJson-") as part_dir:
+        results_iter = cli_results_iter(
+            path_list, args.input_format, args.mapper, part_dir, max(args.workers, 1), args.validate
+        )
+        try:
+            with cli_output_open(args.output) as output:
+                cli_parts_join(
+                    (file_results.append(file_result) or file_result for file_result in results_iter),
+                    output,
+                    output_format
+                )
+        except BrokenPipeError:
+            # the reader of stdout went away, as with | head
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            return 1
+    elapsed = max(time.perf_counter() - start, 1e-9)
+    failed_results = [file_result for file_result in file_results if file_result["error"] is not None]
+    for file_result in failed_results:
+        print("%s: %s" % (file_result["path"], file_result["error"]), file=sys.stderr)
+    #
+    if not args.quiet:
+        record_count = sum(file_result["records"] for file_result in file_results)
+        item_count = sum(file_result["items"] for file_result in file_results)
+        byte_count = sum(file_result["bytes"] for file_result in file_results)
+        print(
+            "%d files, %d records, %d items in %.2f s: %.0f records/s, %.2f MB/s" % (
+                len(file_results), record_count, item_count, elapsed,
+                record_count / elapsed, byte_count / elapsed / 1e6
+            ),
+            file=sys.stderr
+        )
+        cli_schema_print(file_results)
+    #
+    return 1 if len(failed_results) > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())